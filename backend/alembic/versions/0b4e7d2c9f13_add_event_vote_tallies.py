@@ -0,0 +1,57 @@
+"""add event_vote_tally and one-vote-per-category unique index
+
+Revision ID: 0b4e7d2c9f13
+Revises: f3c8a1d5b7e9
+Create Date: 2026-10-17 13:40:52.174406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b4e7d2c9f13'
+down_revision: Union[str, None] = 'f3c8a1d5b7e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicate votes left by racing requests, keeping each voter's latest
+    op.execute("""
+        DELETE FROM event_vote WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY event_id, voter_id, award_category
+                    ORDER BY created_at DESC, id DESC
+                ) AS position
+                FROM event_vote
+            ) ranked WHERE position > 1
+        )
+    """)
+    op.create_index('uq_event_vote_event_voter_category', 'event_vote',
+                    ['event_id', 'voter_id', 'award_category'], unique=True)
+
+    op.create_table('event_vote_tally',
+    sa.Column('event_id', sa.String(), nullable=False),
+    sa.Column('award_category', sa.String(), nullable=False),
+    sa.Column('nominee_id', sa.String(), nullable=False),
+    sa.Column('vote_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+    sa.ForeignKeyConstraint(['event_id'], ['event.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['nominee_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('event_id', 'award_category', 'nominee_id')
+    )
+    op.execute("""
+        INSERT INTO event_vote_tally (event_id, award_category, nominee_id, vote_count)
+        SELECT event_id, award_category, nominee_id, count(*)
+        FROM event_vote
+        GROUP BY event_id, award_category, nominee_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('event_vote_tally')
+    op.drop_index('uq_event_vote_event_voter_category', table_name='event_vote')
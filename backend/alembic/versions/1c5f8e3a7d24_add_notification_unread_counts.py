@@ -0,0 +1,42 @@
+"""add notification_unread_counts and partial unread index
+
+Revision ID: 1c5f8e3a7d24
+Revises: 0b4e7d2c9f13
+Create Date: 2026-10-17 14:32:08.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c5f8e3a7d24'
+down_revision: Union[str, None] = '0b4e7d2c9f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_notifications_user_id_unread', 'notifications', ['user_id'], unique=False,
+                    postgresql_where=sa.text('is_read = false'))
+
+    op.create_table('notification_unread_counts',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('unread_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.execute("""
+        INSERT INTO notification_unread_counts (user_id, unread_count)
+        SELECT user_id, count(*) FROM notifications
+        WHERE is_read = false
+        GROUP BY user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('notification_unread_counts')
+    op.drop_index('ix_notifications_user_id_unread', table_name='notifications')
@@ -0,0 +1,35 @@
+"""add notification coalescing columns and open-row unique index
+
+Revision ID: 2d6a9b4e8f35
+Revises: 1c5f8e3a7d24
+Create Date: 2026-10-17 15:48:21.304117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d6a9b4e8f35'
+down_revision: Union[str, None] = '1c5f8e3a7d24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('notifications', sa.Column('coalesce_key', sa.String(), nullable=True))
+    op.add_column('notifications', sa.Column('actor_count', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('notifications', sa.Column('latest_actor_id', sa.String(), nullable=True))
+    op.add_column('notifications', sa.Column('latest_actor_name', sa.String(), nullable=True))
+    op.create_index('uq_notifications_user_id_coalesce_key_unread', 'notifications', ['user_id', 'coalesce_key'],
+                    unique=True, postgresql_where=sa.text('is_read = false'))
+
+
+def downgrade() -> None:
+    op.drop_index('uq_notifications_user_id_coalesce_key_unread', table_name='notifications')
+    op.drop_column('notifications', 'latest_actor_name')
+    op.drop_column('notifications', 'latest_actor_id')
+    op.drop_column('notifications', 'actor_count')
+    op.drop_column('notifications', 'coalesce_key')
@@ -0,0 +1,47 @@
+"""add notifications_archive and archival candidate index
+
+Revision ID: 3e7b0c5f9a46
+Revises: 2d6a9b4e8f35
+Create Date: 2026-10-17 16:21:37.518240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e7b0c5f9a46'
+down_revision: Union[str, None] = '2d6a9b4e8f35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notifications_archive',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('message', sa.String(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('related_entity_type', sa.String(), nullable=True),
+    sa.Column('related_entity_id', sa.String(), nullable=True),
+    sa.Column('coalesce_key', sa.String(), nullable=True),
+    sa.Column('actor_count', sa.Integer(), server_default='1', nullable=False),
+    sa.Column('latest_actor_id', sa.String(), nullable=True),
+    sa.Column('latest_actor_name', sa.String(), nullable=True),
+    sa.Column('is_read', sa.Boolean(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_notifications_archive_user_id_created_at', 'notifications_archive', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_notifications_created_at_read', 'notifications', ['created_at'], unique=False,
+                    postgresql_where=sa.text('is_read = true'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_created_at_read', table_name='notifications')
+    op.drop_index('ix_notifications_archive_user_id_created_at', table_name='notifications_archive')
+    op.drop_table('notifications_archive')
@@ -0,0 +1,51 @@
+"""add testing cycle status counters
+
+Revision ID: 5a9d2e7b1c68
+Revises: 4f8c1d6a0b57
+Create Date: 2026-10-17 17:46:53.127804
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9d2e7b1c68'
+down_revision: Union[str, None] = '4f8c1d6a0b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = {
+    'pass_count': 'PASS',
+    'fail_count': 'FAIL',
+    'blocked_count': 'BLOCKED',
+    'skipped_count': 'SKIPPED',
+    'pending_count': 'PENDING',
+}
+
+
+def upgrade() -> None:
+    for column in COUNTERS:
+        op.add_column('testing_cycles', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_test_executions_cycle_id_created_at_id', 'test_executions', ['cycle_id', 'created_at', 'id'], unique=False)
+
+    # Backfill from existing executions
+    assignments = ",\n".join(
+        f"{column} = (SELECT count(*) FROM test_executions e WHERE e.cycle_id = testing_cycles.id AND e.status = '{status}')"
+        for column, status in COUNTERS.items()
+    )
+    op.execute(f"UPDATE testing_cycles SET {assignments}")
+    op.execute("""
+        UPDATE testing_cycles SET pass_rate = CASE
+            WHEN pass_count + fail_count + blocked_count > 0
+            THEN (pass_count * 200 + pass_count + fail_count + blocked_count) / ((pass_count + fail_count + blocked_count) * 2)
+            ELSE 0 END
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_test_executions_cycle_id_created_at_id', table_name='test_executions')
+    for column in reversed(list(COUNTERS)):
+        op.drop_column('testing_cycles', column)
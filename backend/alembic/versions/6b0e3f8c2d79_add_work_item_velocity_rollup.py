@@ -0,0 +1,47 @@
+"""add work_items_v2.completed_at and daily velocity rollup
+
+Revision ID: 6b0e3f8c2d79
+Revises: 5a9d2e7b1c68
+Create Date: 2026-10-17 18:52:40.771936
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b0e3f8c2d79'
+down_revision: Union[str, None] = '5a9d2e7b1c68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('work_items_v2', sa.Column('completed_at', sa.DateTime(), nullable=True))
+    # No completion history exists; creation time is the best available stand-in
+    op.execute("UPDATE work_items_v2 SET completed_at = created_at WHERE status = 'DONE'")
+
+    op.create_table('work_item_velocity_daily',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('team_id', sa.String(), nullable=False),
+    sa.Column('points', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('items', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['team_id'], ['team.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('day', 'team_id')
+    )
+    op.create_index(op.f('ix_work_item_velocity_daily_team_id'), 'work_item_velocity_daily', ['team_id'], unique=False)
+    op.execute("""
+        INSERT INTO work_item_velocity_daily (day, team_id, points, items)
+        SELECT CAST(completed_at AS DATE), team_id, sum(coalesce(story_points, 0)), count(*)
+        FROM work_items_v2
+        WHERE status = 'DONE' AND completed_at IS NOT NULL AND team_id IS NOT NULL
+        GROUP BY CAST(completed_at AS DATE), team_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_work_item_velocity_daily_team_id'), table_name='work_item_velocity_daily')
+    op.drop_table('work_item_velocity_daily')
+    op.drop_column('work_items_v2', 'completed_at')
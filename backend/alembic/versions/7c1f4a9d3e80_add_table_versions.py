@@ -0,0 +1,30 @@
+"""add table_versions for ETag support
+
+Revision ID: 7c1f4a9d3e80
+Revises: 6b0e3f8c2d79
+Create Date: 2026-10-17 20:14:08.315402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f4a9d3e80'
+down_revision: Union[str, None] = '6b0e3f8c2d79'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('table_versions',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('table_versions')
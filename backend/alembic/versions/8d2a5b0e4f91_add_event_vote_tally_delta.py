@@ -0,0 +1,40 @@
+"""add event_vote_tally_delta (durable pending tally changes)
+
+Revision ID: 8d2a5b0e4f91
+Revises: 7c1f4a9d3e80
+Create Date: 2026-10-18 09:12:31.508214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2a5b0e4f91'
+down_revision: Union[str, None] = '7c1f4a9d3e80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('event_vote_tally_delta',
+    sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+    sa.Column('event_id', sa.String(), nullable=False),
+    sa.Column('award_category', sa.String(), nullable=False),
+    sa.Column('nominee_id', sa.String(), nullable=False),
+    sa.Column('delta', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['event_id'], ['event.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['nominee_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_event_vote_tally_delta_event_id'), 'event_vote_tally_delta', ['event_id'], unique=False)
+    op.create_index(op.f('ix_event_vote_tally_delta_nominee_id'), 'event_vote_tally_delta', ['nominee_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_event_vote_tally_delta_nominee_id'), table_name='event_vote_tally_delta')
+    op.drop_index(op.f('ix_event_vote_tally_delta_event_id'), table_name='event_vote_tally_delta')
+    op.drop_table('event_vote_tally_delta')
@@ -0,0 +1,44 @@
+"""add like/comment counters to posts, events and endorsements
+
+Revision ID: c41d7e2a9b10
+Revises: b5cbee2d679b
+Create Date: 2026-10-17 09:12:41.118302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e2a9b10'
+down_revision: Union[str, None] = 'b5cbee2d679b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> foreign key column on "like"/"comment"
+TARGETS = {
+    'post': 'post_id',
+    'event': 'event_id',
+    'endorsements': 'endorsement_id',
+}
+
+
+def upgrade() -> None:
+    for table, fk in TARGETS.items():
+        op.add_column(table, sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+        op.add_column(table, sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+
+        # Backfill from the existing rows
+        op.execute(
+            f'UPDATE {table} SET '
+            f'like_count = (SELECT count(*) FROM "like" WHERE "like".{fk} = {table}.id), '
+            f'comment_count = (SELECT count(*) FROM comment WHERE comment.{fk} = {table}.id)'
+        )
+
+
+def downgrade() -> None:
+    for table in TARGETS:
+        op.drop_column(table, 'comment_count')
+        op.drop_column(table, 'like_count')
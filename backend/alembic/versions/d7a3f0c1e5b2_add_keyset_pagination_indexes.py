@@ -0,0 +1,39 @@
+"""add composite indexes for keyset pagination
+
+Revision ID: d7a3f0c1e5b2
+Revises: c41d7e2a9b10
+Create Date: 2026-10-17 10:03:27.540916
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3f0c1e5b2'
+down_revision: Union[str, None] = 'c41d7e2a9b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ('ix_post_created_at_id', 'post', ['created_at', 'id']),
+    ('ix_event_date_time_id', 'event', ['date_time', 'id']),
+    ('ix_endorsements_created_at_id', 'endorsements', ['created_at', 'id']),
+    ('ix_feedback_to_user_id_date_id', 'feedback', ['to_user_id', 'date', 'id']),
+    ('ix_feedback_from_user_id_date_id', 'feedback', ['from_user_id', 'date', 'id']),
+    ('ix_notifications_user_id_created_at_id', 'notifications', ['user_id', 'created_at', 'id']),
+    ('ix_teamupdate_team_id_created_at_id', 'teamupdate', ['team_id', 'created_at', 'id']),
+    ('ix_releases_v2_created_at_id', 'releases_v2', ['created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
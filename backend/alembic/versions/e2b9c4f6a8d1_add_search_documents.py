@@ -0,0 +1,75 @@
+"""add search_documents table with full-text and trigram indexes
+
+Revision ID: e2b9c4f6a8d1
+Revises: d7a3f0c1e5b2
+Create Date: 2026-10-17 11:26:04.318520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9c4f6a8d1'
+down_revision: Union[str, None] = 'd7a3f0c1e5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors SEARCH_SOURCES in app/models/v2/search_document.py
+BACKFILL = [
+    """SELECT 'RELEASE', id, 'Release ' || version, name, '/releases/' || id,
+              concat_ws(' ', version, name)
+       FROM releases_v2""",
+    """SELECT 'WORK_ITEM', id, title, type || ' - ' || status,
+              '/releases/' || coalesce(release_id, 'None') || '?item=' || id,
+              concat_ws(' ', title, description)
+       FROM work_items_v2""",
+    """SELECT 'TASK', id, title, priority || ' - ' || status, '/tasks',
+              concat_ws(' ', title, description)
+       FROM tasks""",
+    """SELECT 'EVENT', id, name, date_time::text, '/events/' || id,
+              concat_ws(' ', name, event_type, agenda)
+       FROM event""",
+    """SELECT 'USER', id, name, coalesce(role, 'Team Member'), '/profile/' || id,
+              concat_ws(' ', name, role)
+       FROM "user" """,
+]
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.create_table('search_documents',
+    sa.Column('entity_type', sa.String(), nullable=False),
+    sa.Column('entity_id', sa.String(), nullable=False),
+    sa.Column('title', sa.String(), nullable=False),
+    sa.Column('subtitle', sa.String(), nullable=True),
+    sa.Column('url', sa.String(), nullable=False),
+    sa.Column('body', sa.String(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+    sa.PrimaryKeyConstraint('entity_type', 'entity_id')
+    )
+    # Title words weigh more than body words in ts_rank
+    op.execute(
+        "ALTER TABLE search_documents ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple', coalesce(body, '')), 'B')"
+        ") STORED"
+    )
+    op.create_index('ix_search_documents_search_vector', 'search_documents', ['search_vector'], postgresql_using='gin')
+    op.create_index('ix_search_documents_title_trgm', 'search_documents', ['title'],
+                    postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+
+    for source in BACKFILL:
+        op.execute(
+            'INSERT INTO search_documents (entity_type, entity_id, title, subtitle, url, body) '
+            + source
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_search_documents_title_trgm', table_name='search_documents')
+    op.drop_index('ix_search_documents_search_vector', table_name='search_documents')
+    op.drop_table('search_documents')
@@ -0,0 +1,53 @@
+"""add materialized user_impact_scores table
+
+Revision ID: f3c8a1d5b7e9
+Revises: e2b9c4f6a8d1
+Create Date: 2026-10-17 12:48:19.602731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8a1d5b7e9'
+down_revision: Union[str, None] = 'e2b9c4f6a8d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_impact_scores',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('endorsements_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('work_items_done', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('tasks_done', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('impact_score', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index(op.f('ix_user_impact_scores_impact_score'), 'user_impact_scores', ['impact_score'], unique=False)
+
+    # Backfill; same weights as app/models/v2/impact_score.py (10 / 5 / 2)
+    op.execute("""
+        INSERT INTO user_impact_scores (user_id, endorsements_count, work_items_done, tasks_done, impact_score)
+        SELECT u.id,
+               coalesce(e.n, 0), coalesce(w.n, 0), coalesce(t.n, 0),
+               coalesce(e.n, 0) * 10 + coalesce(w.n, 0) * 5 + coalesce(t.n, 0) * 2
+        FROM "user" u
+        LEFT JOIN (SELECT receiver_id AS user_id, count(*) AS n FROM endorsements
+                   GROUP BY receiver_id) e ON e.user_id = u.id
+        LEFT JOIN (SELECT assignee_id AS user_id, count(*) AS n FROM work_items_v2
+                   WHERE status = 'DONE' GROUP BY assignee_id) w ON w.user_id = u.id
+        LEFT JOIN (SELECT assigned_to_id AS user_id, count(*) AS n FROM tasks
+                   WHERE status = 'DONE' GROUP BY assigned_to_id) t ON t.user_id = u.id
+        WHERE e.n IS NOT NULL OR w.n IS NOT NULL OR t.n IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_user_impact_scores_impact_score'), table_name='user_impact_scores')
+    op.drop_table('user_impact_scores')
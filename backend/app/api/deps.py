@@ -1,13 +1,14 @@
 from typing import AsyncGenerator
 from fastapi import Header, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, object_session, selectinload
 from app.db.session import AsyncSessionLocal
 from app.models.user import User
-from app.models.team import Team
+from app.models.team import Team, ART
 from app.core import security
+from app.core.cache import principal_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v2/auth/login-as")
 
@@ -21,7 +22,16 @@ async def get_current_user(
 ) -> User:
     """
     Get the current user based on the Bearer token.
+
+    Verified tokens are cached per process (see `principal_cache`), so repeat
+    requests skip both the HMAC check and the user/team/ART lookup.
     """
+    token_payload, _, signature = token.rpartition(".")
+    if signature:
+        cached_user = principal_cache.get_user(signature, token_payload)
+        if cached_user is not None:
+            return cached_user
+
     payload = security.verify_access_token(token)
     if not payload:
         raise HTTPException(
@@ -40,5 +50,49 @@ async def get_current_user(
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-        
+
+    # Shared by later requests, so detach it (and the team/ART it carries) from this request's session
+    for obj in (user, user.team, user.team and user.team.art):
+        if obj is not None:
+            db.expunge(obj)
+    principal_cache.set_user(signature, token_payload, user, expires_at=payload.get("exp"))
     return user
+
+
+# Cached principals embed the user's team and ART, so any committed write to
+# those (CRUD, direct ORM or bulk statements alike) drops the affected entries.
+# None in the set stands for "all of them".
+def _stale_principals(session) -> set:
+    return session.info.setdefault("stale_principals", set())
+
+def _user_changed(mapper, connection, target):
+    _stale_principals(object_session(target)).add(target.id)
+
+def _team_changed(mapper, connection, target):
+    _stale_principals(object_session(target)).add(None)
+
+for _event in ("after_update", "after_delete"):
+    event.listen(User, _event, _user_changed)
+    event.listen(Team, _event, _team_changed)
+    event.listen(ART, _event, _team_changed)
+
+@event.listens_for(Session, "do_orm_execute")
+def _principals_bulk_write(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if getattr(orm_execute_state.statement, "table", None) in (User.__table__, Team.__table__, ART.__table__):
+        _stale_principals(orm_execute_state.session).add(None)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_principals(session):
+    stale = session.info.pop("stale_principals", None)
+    if not stale:
+        return
+    if None in stale:
+        principal_cache.clear()
+    else:
+        principal_cache.invalidate_users(stale)
+
+@event.listens_for(Session, "after_rollback")
+def _keep_principals(session):
+    session.info.pop("stale_principals", None)
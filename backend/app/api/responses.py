@@ -0,0 +1,50 @@
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+from fastapi import Response
+from pydantic import TypeAdapter
+
+_BODY_HEADERS = (b"content-length", b"content-type")
+
+
+@lru_cache(maxsize=None)
+def type_adapter(type_: Any) -> TypeAdapter:
+    """One TypeAdapter (and so one compiled pydantic-core serializer) per response type."""
+    return TypeAdapter(type_)
+
+
+class ModelJSONResponse(Response):
+    """
+    JSON body produced by pydantic-core's serializer for `type_`, straight to bytes.
+
+    Returning it from an endpoint bypasses FastAPI's response_model handling
+    (validating the content again, jsonable_encoder, json.dumps), so `content`
+    must already be instances of `type_` - keep `response_model` on the route
+    for the OpenAPI schema.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, content: Any, type_: Any, status_code: int = 200, headers: Optional[Mapping[str, str]] = None):
+        self.type_ = type_
+        super().__init__(content, status_code=status_code, headers=headers)
+
+    def render(self, content: Any) -> bytes:
+        return type_adapter(self.type_).dump_json(content)
+
+
+def model_response(
+    type_: Any, content: Any, response: Optional[Response] = None, *, from_attributes: bool = False
+) -> ModelJSONResponse:
+    """
+    `ModelJSONResponse` for `content`, keeping headers the endpoint set on its
+    injected `response` (e.g. X-Next-Cursor), which FastAPI drops once an
+    endpoint returns a Response of its own.
+
+    `from_attributes=True` takes ORM objects and validates them once into `type_`.
+    """
+    if from_attributes:
+        content = type_adapter(type_).validate_python(content, from_attributes=True)
+    rendered = ModelJSONResponse(content, type_)
+    if response is not None:
+        rendered.raw_headers.extend((k, v) for k, v in response.raw_headers if k not in _BODY_HEADERS)
+    return rendered
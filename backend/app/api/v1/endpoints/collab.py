@@ -1,23 +1,27 @@
 
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, schemas
 from app.api import deps
+from app.crud import pagination
 
 router = APIRouter()
 
 @router.get("/awards", response_model=List[schemas.AwardCategory])
 async def read_awards(
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Retrieve award categories.
     """
-    awards = await crud.award_category.get_multi(db, skip=skip, limit=limit)
+    awards = await crud.award_category.get_multi(db, skip=skip, limit=limit, cursor=cursor, keyset_order=True)
+    pagination.set_next_cursor(response, awards, crud.award_category.cursor_keys, limit)
     return awards
 
 @router.post("/votes", response_model=schemas.Vote)
@@ -29,8 +33,8 @@ async def create_vote(
     """
     Create a new vote. Voting must be open.
     """
-    # Check if voting is open
-    voting_status = await crud.voting_status.get_current_status(db)
+    # Check if voting is open, holding the status until the vote commits
+    voting_status = await crud.voting_status.get_current_status(db, lock=True)
     if not voting_status or not voting_status.is_voting_open:
         raise HTTPException(
             status_code=403,
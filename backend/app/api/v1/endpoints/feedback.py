@@ -1,39 +1,46 @@
 
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, schemas
 from app.api import deps
+from app.crud import pagination
 
 router = APIRouter()
 
 
 @router.get("/received", response_model=List[schemas.Feedback])
 async def get_received_feedback(
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     user_id: str = Query(..., description="User ID to get received feedback for"),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Get feedback received by a specific user.
     """
-    feedbacks = await crud.feedback.get_received(db, user_id=user_id, skip=skip, limit=limit)
+    feedbacks = await crud.feedback.get_received(db, user_id=user_id, skip=skip, limit=limit, cursor=cursor)
+    pagination.set_next_cursor(response, feedbacks, crud.feedback.cursor_keys, limit)
     return feedbacks
 
 
 @router.get("/sent", response_model=List[schemas.Feedback])
 async def get_sent_feedback(
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     user_id: str = Query(..., description="User ID to get sent feedback for"),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Get feedback sent by a specific user.
     """
-    feedbacks = await crud.feedback.get_sent(db, user_id=user_id, skip=skip, limit=limit)
+    feedbacks = await crud.feedback.get_sent(db, user_id=user_id, skip=skip, limit=limit, cursor=cursor)
+    pagination.set_next_cursor(response, feedbacks, crud.feedback.cursor_keys, limit)
     return feedbacks
 
 
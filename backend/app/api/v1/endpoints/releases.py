@@ -1,22 +1,26 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from app import crud
 from app.api import deps
+from app.crud import pagination
 from app.schemas.release import ReleaseWorkItem, ReleaseWorkItemCreate, ReleaseWorkItemUpdate
 
 router = APIRouter()
 
 @router.get("/", response_model=List[ReleaseWorkItem])
 async def read_release_work_items(
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Retrieve release work items.
     """
-    work_items = await crud.release_work_item.get_multi(db, skip=skip, limit=limit)
+    work_items = await crud.release_work_item.get_multi(db, skip=skip, limit=limit, cursor=cursor, keyset_order=True)
+    pagination.set_next_cursor(response, work_items, crud.release_work_item.cursor_keys, limit)
     return work_items
 
 @router.post("/", response_model=ReleaseWorkItem)
@@ -1,26 +1,30 @@
-from typing import Any, List
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, models, schemas
 from app.api import deps
+from app.crud import pagination
 
 router = APIRouter()
 
 @router.get("/{team_id}/updates", response_model=List[schemas.TeamUpdateMessage])
 async def read_team_updates(
     team_id: str,
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Retrieve updates for a specific team.
     """
     updates = await crud.team_update.get_multi_by_team(
-        db, team_id=team_id, skip=skip, limit=limit
+        db, team_id=team_id, skip=skip, limit=limit, cursor=cursor
     )
+    pagination.set_next_cursor(response, updates, crud.team_update.cursor_keys, limit)
     return updates
 
 @router.post("/{team_id}/updates", response_model=schemas.TeamUpdateMessage)
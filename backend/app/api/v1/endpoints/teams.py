@@ -1,10 +1,11 @@
 
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, models, schemas
 from app.api import deps
+from app.crud import pagination
 
 router = APIRouter()
 
@@ -12,14 +13,17 @@ router = APIRouter()
 
 @router.get("/", response_model=List[schemas.Team])
 async def read_teams(
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Retrieve teams.
     """
-    teams = await crud.team.get_multi(db, skip=skip, limit=limit)
+    teams = await crud.team.get_multi(db, skip=skip, limit=limit, cursor=cursor, keyset_order=True)
+    pagination.set_next_cursor(response, teams, crud.team.cursor_keys, limit)
     return teams
 
 @router.post("/", response_model=schemas.Team)
@@ -73,14 +77,17 @@ async def delete_team(
 
 @router.get("/arts/", response_model=List[schemas.ART])
 async def read_arts(
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Retrieve ARTs.
     """
-    arts = await crud.art.get_multi(db, skip=skip, limit=limit)
+    arts = await crud.art.get_multi(db, skip=skip, limit=limit, cursor=cursor, keyset_order=True)
+    pagination.set_next_cursor(response, arts, crud.art.cursor_keys, limit)
     return arts
 
 @router.post("/arts/", response_model=schemas.ART)
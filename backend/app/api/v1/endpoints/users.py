@@ -1,23 +1,27 @@
 
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, models, schemas
 from app.api import deps
+from app.crud import pagination
 
 router = APIRouter()
 
 @router.get("/", response_model=List[schemas.User])
 async def read_users(
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
 ) -> Any:
     """
     Retrieve users.
     """
-    users = await crud.user.get_multi(db, skip=skip, limit=limit)
+    users = await crud.user.get_multi(db, skip=skip, limit=limit, cursor=cursor, keyset_order=True)
+    pagination.set_next_cursor(response, users, crud.user.cursor_keys, limit)
     return users
 
 @router.post("/", response_model=schemas.User)
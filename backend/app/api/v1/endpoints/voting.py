@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, schemas
 from app.api import deps
+from app.core.singleflight import Flight, coalesced
 
 router = APIRouter()
 
@@ -43,23 +44,23 @@ async def update_voting_status(
 
 @router.get("/results")
 async def get_all_results(
-    db: AsyncSession = Depends(deps.get_db),
+    flight: Flight = Depends(coalesced),
 ) -> Any:
     """
     Get top 3 results for all award categories.
     """
-    results = await crud.vote.get_all_category_results(db)
+    results = await flight(crud.vote.get_all_category_results)
     return results
 
 
 @router.get("/results/{category_id}")
 async def get_category_results(
     *,
-    db: AsyncSession = Depends(deps.get_db),
+    flight: Flight = Depends(coalesced),
     category_id: str,
 ) -> Any:
     """
     Get top 3 results for a specific category.
     """
-    results = await crud.vote.get_category_results(db, category_id=category_id)
+    results = await flight(lambda db: crud.vote.get_category_results(db, category_id=category_id))
     return results
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from .endpoints import events, endorsements, releases, testing, analytics, tasks, notifications, profiles, search, auth, posts
+from .endpoints import events, endorsements, releases, testing, analytics, tasks, notifications, profiles, search, auth, posts, system
 
 api_router = APIRouter()
 
@@ -14,6 +14,7 @@ api_router.include_router(profiles.router, prefix="/profiles", tags=["Profiles V
 api_router.include_router(search.router, prefix="/search", tags=["Search V2"])
 api_router.include_router(auth.router, prefix="/auth", tags=["Auth V2"])
 api_router.include_router(posts.router, prefix="/posts", tags=["Posts V2"])
+api_router.include_router(system.router, prefix="/system", tags=["System V2"])
 # api_router.include_router(releases.router, prefix="/releases", tags=["Releases V2"])
 # api_router.include_router(releases.router, prefix="/releases", tags=["Releases V2"])
 
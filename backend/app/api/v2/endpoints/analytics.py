@@ -1,36 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.api import deps
+from fastapi import APIRouter, Query
+from typing import Optional
 from app.services import analytics_service
 
 router = APIRouter()
 
+# Served from analytics_service's shared results cache, which opens its own
+# sessions when a metric needs computing
+
 @router.get("/dashboard")
-async def get_dashboard_metrics(
-    db: Session = Depends(deps.get_db)
-):
-    return await analytics_service.get_dashboard_metrics(db)
+async def get_dashboard_metrics():
+    return await analytics_service.get_dashboard_metrics()
 
 @router.get("/velocity")
 async def get_velocity_metrics(
-    db: Session = Depends(deps.get_db)
+    weeks: int = Query(8, ge=1, le=52),
+    team_id: Optional[str] = None,
+    art_id: Optional[str] = None,
 ):
-    return await analytics_service.get_velocity_metrics(db)
+    return await analytics_service.get_velocity_metrics(weeks=weeks, team_id=team_id, art_id=art_id)
 
 @router.get("/trends/releases")
 async def get_release_trends(
-    db: Session = Depends(deps.get_db)
+    months: int = Query(3, ge=1, le=24),
 ):
-    return await analytics_service.get_release_trends(db)
+    return await analytics_service.get_release_trends(months=months)
 
 @router.get("/insights/endorsements")
 async def get_endorsement_insights(
-    db: Session = Depends(deps.get_db)
+    days: int = Query(90, ge=1, le=365),
+    limit: int = Query(10, ge=1, le=50),
 ):
-    return await analytics_service.get_endorsement_insights(db)
+    return await analytics_service.get_endorsement_insights(days=days, limit=limit)
 
 @router.get("/heatmap/risk")
-async def get_risk_heatmap(
-    db: Session = Depends(deps.get_db)
-):
-    return await analytics_service.get_risk_heatmap(db)
+async def get_risk_heatmap():
+    return await analytics_service.get_risk_heatmap()
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy import select
-from typing import List, Any
+from typing import List, Any, Optional
 from app.api import deps
+from app.api.responses import model_response
+from app.crud import pagination
 from app.schemas.v2 import endorsement as schemas
-from app.services import endorsement_service
+from app.services import endorsement_service, social_service
 from app.models.user import User
+from app.models.v2.notification import NotificationType
 
 router = APIRouter()
 
@@ -19,12 +22,18 @@ async def create_endorsement(
 
 @router.get("/", response_model=List[schemas.EndorsementResponse])
 async def read_endorsements(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_user)
 ):
-    return await endorsement_service.get_endorsements_with_stats(db, current_user.id, skip=skip, limit=limit)
+    endorsements = await endorsement_service.get_endorsements_with_stats(
+        db, current_user.id, skip=skip, limit=limit, cursor=cursor
+    )
+    pagination.set_next_cursor(response, endorsements, endorsement_service.ENDORSEMENT_CURSOR_KEYS, limit)
+    return model_response(List[schemas.EndorsementResponse], endorsements, response)
 
 # Social Interactions
 from app.models.social import Like, Comment
@@ -47,12 +56,17 @@ async def like_endorsement(
 
     if existing_like:
         await db.delete(existing_like)
+        await social_service.adjust_like_count(db, "endorsement", endorsement_id, -1)
         await db.commit()
         return False
     else:
         new_like = Like(user_id=current_user_id, endorsement_id=endorsement_id)
         db.add(new_like)
+        await social_service.adjust_like_count(db, "endorsement", endorsement_id, 1)
         await db.commit()
+        await social_service.notify_owner(
+            "endorsement", endorsement_id, current_user_id, current_user.name, NotificationType.LIKE
+        )
         return True
 
 @router.get("/{endorsement_id}/likes", response_model=List[Any])
@@ -85,8 +99,12 @@ async def create_endorsement_comment(
         user_id=current_user_id
     )
     db.add(comment)
+    await social_service.adjust_comment_count(db, "endorsement", endorsement_id, 1)
     await db.commit()
     await db.refresh(comment)
+    await social_service.notify_owner(
+        "endorsement", endorsement_id, current_user_id, current_user.name, NotificationType.COMMENT
+    )
     
     from sqlalchemy.orm import selectinload
     stmt = select(Comment).options(selectinload(Comment.user)).where(Comment.id == comment.id)
@@ -1,18 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import select, func
-from typing import List, Any
+from typing import List, Any, Optional
 from app.api import deps
+from app.api.responses import model_response
+from app.core.singleflight import Flight, coalesced
+from app.crud import pagination
 from app.schemas.v2 import event as event_schemas
-from app.services import event_service
+from app.services import event_service, social_service
 from app.models.user import User
+from app.models.v2.notification import NotificationType
 from app.models.event import Event
 
 import uuid
 
 router = APIRouter()
 
+EVENT_CURSOR_KEYS = (Event.date_time, Event.id)
+
 @router.post("/", response_model=event_schemas.EventResponse, status_code=status.HTTP_201_CREATED)
 async def create_event(
     event_in: event_schemas.EventCreate,
@@ -21,71 +27,45 @@ async def create_event(
 ):
     return await event_service.create_event(db, event_in, current_user.id)
 
-@router.get("/", response_model=Any)
+@router.get("/", response_model=List[event_schemas.EventFeedResponse])
 async def list_events(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(deps.get_db),
+    cursor: Optional[str] = None,
+    flight: Flight = Depends(coalesced),
     current_user: User = Depends(deps.get_current_user)
 ):
-    """List all events with social stats"""
-    from sqlalchemy.orm import selectinload
-    from sqlalchemy import func, and_
-    from app.models.social import Like, Comment
+    """List all events with social stats (offset or `cursor` paging, see `X-Next-Cursor`)"""
+    from app.services.social_service import social_stats_columns
 
-    try:
-        # 1. Fetch Events
+    async def fetch(db: Session):
         stmt = (
-            select(Event)
+            select(Event, *social_stats_columns("event", Event.id, current_user.id))
             .options(selectinload(Event.organizer))
-            .offset(skip)
-            .limit(limit)
-            .order_by(Event.date_time.desc())
-        )
-        result = await db.execute(stmt)
-        events = result.scalars().all()
-
-        if not events:
-            return []
-
-        event_ids = [e.id for e in events]
-
-        # 2. Fetch Like Counts
-        stmt_likes = (
-            select(Like.event_id, func.count(Like.id))
-            .where(Like.event_id.in_(event_ids))
-            .group_by(Like.event_id)
-        )
-        result_likes = await db.execute(stmt_likes)
-        like_counts = {row[0]: row[1] for row in result_likes.all()}
-
-        # 3. Fetch Comment Counts
-        stmt_comments = (
-            select(Comment.event_id, func.count(Comment.id))
-            .where(Comment.event_id.in_(event_ids))
-            .group_by(Comment.event_id)
-        )
-        result_comments = await db.execute(stmt_comments)
-        comment_counts = {row[0]: row[1] for row in result_comments.all()}
-
-        # 4. Fetch User Likes
-        stmt_user_likes = (
-            select(Like.event_id)
-            .where(and_(Like.event_id.in_(event_ids), Like.user_id == current_user.id))
         )
-        result_user_likes = await db.execute(stmt_user_likes)
-        user_liked_event_ids = set(result_user_likes.scalars().all())
+        # Offset pages use the cursor order too; events often share a date_time
+        stmt = pagination.keyset(stmt, EVENT_CURSOR_KEYS, cursor)
+        if not cursor:
+            stmt = stmt.offset(skip)
+        result = await db.execute(stmt.limit(limit))
 
-        # 5. Assemble Response
-        response = []
-        for event in events:
-            event_dict = event_schemas.EventResponse.model_validate(event).model_dump()
-            event_dict['likes'] = like_counts.get(event.id, 0)
-            event_dict['comments'] = comment_counts.get(event.id, 0)
-            event_dict['liked_by_user'] = event.id in user_liked_event_ids
-            response.append(event_dict)
+        events = []
+        for event, likes, comments, liked_by_user in result.all():
+            item = event_schemas.EventFeedResponse.model_validate(event)
+            item.likes = likes
+            item.comments = comments
+            item.liked_by_user = liked_by_user
+            events.append(item)
+        return events
 
-        return response
+    try:
+        # Identical concurrent requests (same page, same token) share one query
+        events = await flight(fetch)
+        pagination.set_next_cursor(response, events, EVENT_CURSOR_KEYS, limit)
+        return model_response(List[event_schemas.EventFeedResponse], events, response)
+    except pagination.InvalidCursorError:
+        raise
     except Exception as e:
         import traceback
         error_trace = traceback.format_exc()
@@ -165,12 +145,17 @@ async def like_event(
 
     if existing_like:
         await db.delete(existing_like)
+        await social_service.adjust_like_count(db, "event", event_id, -1)
         await db.commit()
         return False
     else:
         new_like = Like(user_id=current_user.id, event_id=event_id)
         db.add(new_like)
+        await social_service.adjust_like_count(db, "event", event_id, 1)
         await db.commit()
+        await social_service.notify_owner(
+            "event", event_id, current_user.id, current_user.name, NotificationType.LIKE
+        )
         return True
 
 @router.get("/{event_id}/likes", response_model=List[Any])
@@ -201,8 +186,12 @@ async def create_event_comment(
         user_id=current_user.id
     )
     db.add(comment)
+    await social_service.adjust_comment_count(db, "event", event_id, 1)
     await db.commit()
     await db.refresh(comment)
+    await social_service.notify_owner(
+        "event", event_id, current_user.id, current_user.name, NotificationType.COMMENT
+    )
     
     # Eager load user
     from sqlalchemy.orm import selectinload
@@ -225,8 +214,10 @@ async def get_event_comments(
     return result.scalars().all()
 
 # Voting Endpoints
+from sqlalchemy.exc import IntegrityError
 from app.models.vote import EventVote
 from app.schemas.v2 import vote as vote_schemas
+from app.services import vote_tally_service
 
 @router.post("/{event_id}/vote", response_model=bool)
 async def cast_vote(
@@ -244,34 +235,46 @@ async def cast_vote(
     if not event.voting_required and not event.has_awards:
          raise HTTPException(status_code=400, detail="Voting is not enabled for this event")
 
-    # 2. Check if user already voted for this category
-    stmt = select(EventVote).where(
-        and_(
-            EventVote.event_id == event_id,
-            EventVote.voter_id == current_user.id,
-            EventVote.award_category == vote_in.award_category
-        )
-    )
-    result = await db.execute(stmt)
-    existing_vote = result.scalars().first()
+    # 2. Upsert the voter's vote for this category (one per voter per category)
+    for attempt in range(2):
+        stmt = select(EventVote).where(
+            and_(
+                EventVote.event_id == event_id,
+                EventVote.voter_id == current_user.id,
+                EventVote.award_category == vote_in.award_category
+            )
+        ).with_for_update()
+        result = await db.execute(stmt)
+        existing_vote = result.scalars().first()
+        previous_nominee_id = existing_vote.nominee_id if existing_vote else None
+
+        if existing_vote:
+            # Update existing vote
+            existing_vote.nominee_id = vote_in.nominee_id
+            existing_vote.reason = vote_in.reason
+        else:
+            # Create new vote
+            new_vote = EventVote(
+                id=str(uuid.uuid4()),
+                event_id=event_id,
+                voter_id=current_user.id,
+                nominee_id=vote_in.nominee_id,
+                award_category=vote_in.award_category,
+                reason=vote_in.reason
+            )
+            db.add(new_vote)
+        # Same transaction as the vote, so the count can't be lost or doubled
+        vote_tally_service.record_vote(db, event_id, vote_in.award_category, previous_nominee_id, vote_in.nominee_id)
+
+        try:
+            await db.commit()
+            break
+        except IntegrityError:
+            # A concurrent first vote from the same voter won; retry as an update
+            await db.rollback()
+            if attempt:
+                raise
 
-    if existing_vote:
-        # Update existing vote
-        existing_vote.nominee_id = vote_in.nominee_id
-        existing_vote.reason = vote_in.reason
-    else:
-        # Create new vote
-        new_vote = EventVote(
-            id=str(uuid.uuid4()),
-            event_id=event_id,
-            voter_id=current_user.id,
-            nominee_id=vote_in.nominee_id,
-            award_category=vote_in.award_category,
-            reason=vote_in.reason
-        )
-        db.add(new_vote)
-    
-    await db.commit()
     return True
 
 @router.get("/{event_id}/votes", response_model=List[vote_schemas.VoteCount])
@@ -288,39 +291,25 @@ async def get_event_votes(
     if event.organizer_id != current_user.id:
         raise HTTPException(status_code=403, detail="Only the organizer can view voting results")
 
-    # Aggregate votes
-    # Select nominee_id, count(*), category
-    # Also need nominee details
-    
-    stmt = (
-        select(
-            EventVote.nominee_id,
-            EventVote.award_category,
-            func.count(EventVote.id).label("count")
-        )
-        .where(EventVote.event_id == event_id)
-        .group_by(EventVote.nominee_id, EventVote.award_category)
-    )
-    
-    result = await db.execute(stmt)
-    rows = result.all()
+    # Counts come from the live tallies rather than re-aggregating event_vote
+    counts = await vote_tally_service.get_event_tallies(db, event_id)
     
     # Fetch user details for nominees
-    nominee_ids = [row.nominee_id for row in rows]
+    nominee_ids = {nominee_id for _, nominee_id in counts}
     stmt_users = select(User).where(User.id.in_(nominee_ids))
     result_users = await db.execute(stmt_users)
     users_map = {u.id: u for u in result_users.scalars().all()}
     
     response = []
-    for row in rows:
-        user = users_map.get(row.nominee_id)
+    for (award_category, nominee_id), count in counts.items():
+        user = users_map.get(nominee_id)
         if user:
             response.append({
-                "nominee_id": row.nominee_id,
+                "nominee_id": nominee_id,
                 "nominee_name": user.name,
                 "nominee_avatar": f"https://api.dicebear.com/7.x/adventurer/svg?seed={user.name}",
-                "award_category": row.award_category,
-                "count": row.count
+                "award_category": award_category,
+                "count": count
             })
             
     return response
@@ -1,11 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import select
-from typing import List
+from typing import List, Optional
 from app.api import deps
+from app.api.responses import model_response
+from app.crud import pagination
 from app.schemas.v2 import notification as schemas
-from app.services import notification_service
+from app.services import event_service, notification_service
 from app.models.user import User
+from app.schemas.user import UserRole
 from app.crud.v2 import notification as crud_notification
 
 router = APIRouter()
@@ -14,9 +18,11 @@ router = APIRouter()
 
 @router.get("/", response_model=List[schemas.NotificationResponse])
 async def read_notifications(
+    response: Response,
     skip: int = 0,
     limit: int = 50,
     unread_only: bool = False,
+    cursor: Optional[str] = None,
     db: Session = Depends(deps.get_db)
 ):
     # Mock user
@@ -29,7 +35,78 @@ async def read_notifications(
     if user:
         current_user_id = user.id
         
-    return await notification_service.get_my_notifications(db, current_user_id, unread_only)
+    notifications = await notification_service.get_my_notifications(
+        db, current_user_id, unread_only, skip=skip, limit=limit, cursor=cursor
+    )
+    pagination.set_next_cursor(response, notifications, crud_notification.notification.cursor_keys, limit)
+    return model_response(List[schemas.NotificationResponse], notifications, response, from_attributes=True)
+
+@router.get("/unread-count", response_model=int)
+async def read_unread_count(
+    db: Session = Depends(deps.get_db)
+):
+    # Mock user
+    current_user_id = "00000000-0000-0000-0000-000000000000"
+    
+    stmt = select(User)
+    result = await db.execute(stmt)
+    user = result.scalars().first()
+    
+    if user:
+        current_user_id = user.id
+        
+    return await notification_service.get_unread_count(db, current_user_id)
+
+@router.get("/stream")
+async def stream_notifications(
+    last_event_id: Optional[str] = Header(None),
+    since: Optional[str] = None,
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Push new notifications as server-sent events.
+
+    Reconnecting clients resume after the `Last-Event-ID` header (sent
+    automatically by EventSource) or the `since` query parameter.
+    """
+    # Mock user
+    current_user_id = "00000000-0000-0000-0000-000000000000"
+    
+    stmt = select(User)
+    result = await db.execute(stmt)
+    user = result.scalars().first()
+    
+    if user:
+        current_user_id = user.id
+
+    return StreamingResponse(
+        notification_service.stream_notifications(current_user_id, last_event_id or since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@router.post("/broadcast", response_model=int)
+async def broadcast_notification(
+    broadcast_in: schemas.NotificationBroadcast,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(deps.get_current_user),
+):
+    """
+    Notify a set of users, a team, an ART and/or an event's participants; returns the delivered count.
+
+    Admins may address any audience; an event's organizer may address that event's participants.
+    """
+    if current_user.role != UserRole.ADMIN:
+        audience = broadcast_in.audience
+        event = await event_service.get_event(db, audience.event_id) if audience.event_id else None
+        if (
+            audience.user_ids or audience.team_id or audience.art_id
+            or event is None or event.organizer_id != current_user.id
+        ):
+            raise HTTPException(
+                status_code=403, detail="Only admins, or an event's organizer for its participants, can broadcast"
+            )
+    return await notification_service.fan_out(db, broadcast_in)
 
 @router.post("/read-all", response_model=int)
 async def mark_all_read(
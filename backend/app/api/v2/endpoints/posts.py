@@ -1,83 +1,58 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, func, and_, delete
+from sqlalchemy import select, func, and_, delete
 from sqlalchemy.orm import selectinload
 
 from app.api import deps
+from app.api.responses import model_response
+from app.crud import pagination
 from app.models.post import Post
 from app.models.social import Like, Comment
 from app.models.user import User
+from app.models.v2.notification import NotificationType
 from app.schemas.v2.post import PostCreate, PostResponse, CommentCreate, CommentResponse
+from app.services import social_service
+from app.services.social_service import social_stats_columns
 
 router = APIRouter()
 
+POST_CURSOR_KEYS = (Post.created_at, Post.id)
+
 @router.get("/", response_model=List[PostResponse])
 async def read_posts(
+    response: Response,
     db: AsyncSession = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """
     Retrieve posts with like/comment counts and user status.
+
+    Pass the `X-Next-Cursor` response header back as `cursor` to page without offsets.
     """
-    # 1. Fetch posts
     stmt = (
-        select(Post)
+        select(Post, *social_stats_columns("post", Post.id, current_user.id))
         .options(selectinload(Post.author).selectinload(User.team))
-        .order_by(desc(Post.created_at))
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    posts = result.scalars().all()
-
-    if not posts:
-        return []
-
-    post_ids = [p.id for p in posts]
-
-    # 2. Fetch Like Counts
-    stmt_likes = (
-        select(Like.post_id, func.count(Like.id))
-        .where(Like.post_id.in_(post_ids))
-        .group_by(Like.post_id)
-    )
-    result_likes = await db.execute(stmt_likes)
-    like_counts = {row[0]: row[1] for row in result_likes.all()}
-
-    # 3. Fetch Comment Counts
-    stmt_comments = (
-        select(Comment.post_id, func.count(Comment.id))
-        .where(Comment.post_id.in_(post_ids))
-        .group_by(Comment.post_id)
     )
-    result_comments = await db.execute(stmt_comments)
-    comment_counts = {row[0]: row[1] for row in result_comments.all()}
-
-    # 4. Fetch User Likes
-    stmt_user_likes = (
-        select(Like.post_id)
-        .where(and_(Like.post_id.in_(post_ids), Like.user_id == current_user.id))
-    )
-    result_user_likes = await db.execute(stmt_user_likes)
-    user_liked_post_ids = set(result_user_likes.scalars().all())
-
-    # 5. Assemble Response
-    response = []
-    for post in posts:
-        # Create Pydantic model from ORM object
+    # Offset pages use the cursor order too, so X-Next-Cursor picks up exactly where they end
+    stmt = pagination.keyset(stmt, POST_CURSOR_KEYS, cursor)
+    if not cursor:
+        stmt = stmt.offset(skip)
+    result = await db.execute(stmt.limit(limit))
+
+    posts = []
+    for post, likes, comments, liked_by_user in result.all():
         post_response = PostResponse.model_validate(post)
-        
-        # Override fields
-        post_response.likes = like_counts.get(post.id, 0)
-        post_response.comments = comment_counts.get(post.id, 0)
-        post_response.liked_by_user = post.id in user_liked_post_ids
-        
-        response.append(post_response)
-    
-    return response
+        post_response.likes = likes
+        post_response.comments = comments
+        post_response.liked_by_user = liked_by_user
+        posts.append(post_response)
+
+    pagination.set_next_cursor(response, posts, POST_CURSOR_KEYS, limit)
+    return model_response(List[PostResponse], posts, response)
 
 @router.post("/", response_model=PostResponse)
 async def create_post(
@@ -121,12 +96,17 @@ async def like_post(
 
     if existing_like:
         await db.delete(existing_like)
+        await social_service.adjust_like_count(db, "post", post_id, -1)
         await db.commit()
         return False
     else:
         new_like = Like(user_id=current_user.id, post_id=post_id)
         db.add(new_like)
+        await social_service.adjust_like_count(db, "post", post_id, 1)
         await db.commit()
+        await social_service.notify_owner(
+            "post", post_id, current_user.id, current_user.name, NotificationType.LIKE
+        )
         return True
 
 @router.get("/{post_id}/likes", response_model=List[Any]) # Typed as Any to avoid circular import issues for now, or use UserBasicInfo if imported
@@ -166,8 +146,12 @@ async def create_comment(
         user_id=current_user.id
     )
     db.add(comment)
+    await social_service.adjust_comment_count(db, "post", post_id, 1)
     await db.commit()
     await db.refresh(comment)
+    await social_service.notify_owner(
+        "post", post_id, current_user.id, current_user.name, NotificationType.COMMENT
+    )
     
     # Eager load user for response
     stmt = select(Comment).options(selectinload(Comment.user)).where(Comment.id == comment.id)
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 from app.api import deps
 from app.schemas.v2 import profile as schemas
-from app.services import profile_service
+from app.services import impact_service, profile_service
 from app.models.user import User
 
 router = APIRouter()
@@ -45,6 +46,15 @@ async def update_my_profile(
         
     return await profile_service.update_my_profile(db, current_user_id, profile_in)
 
+@router.get("/leaderboard", response_model=List[schemas.LeaderboardEntry])
+async def read_leaderboard(
+    limit: int = Query(20, ge=1, le=100),
+    team_id: Optional[str] = None,
+    db: Session = Depends(deps.get_db)
+):
+    """Users ranked by their materialized impact score"""
+    return await impact_service.get_leaderboard(db, limit=limit, team_id=team_id)
+
 @router.get("/{user_id}", response_model=schemas.UserProfileFullResponse)
 async def read_user_profile(
     user_id: str,
@@ -62,15 +72,9 @@ async def list_users(
     db: Session = Depends(deps.get_db)
 ):
     """List all users for selection (e.g., in event organizer dropdown)"""
-    stmt = select(User).offset(skip).limit(limit)
+    stmt = select(User).options(selectinload(User.team)).offset(skip).limit(limit)
     result = await db.execute(stmt)
     users = result.scalars().all()
     
-    # Convert to profile responses
-    profiles = []
-    for user in users:
-        profile = await profile_service.get_full_profile(db, user.id)
-        if profile:
-            profiles.append(profile)
-    
-    return profiles
+    # Convert to profile responses in bulk
+    return await profile_service.build_profiles(db, users)
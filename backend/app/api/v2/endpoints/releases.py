@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List, Any
+from typing import List, Any, Optional
 from app.api import deps
+from app.api.responses import model_response
+from app.crud import pagination
+from app.crud.v2 import release as crud_release
 from app.schemas.v2 import release as schemas
 from app.services import release_service
 
@@ -19,11 +22,15 @@ async def create_release(
 
 @router.get("/", response_model=List[schemas.ReleaseResponse])
 async def read_releases(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     db: Session = Depends(deps.get_db)
 ):
-    return await release_service.get_releases(db, skip=skip, limit=limit)
+    releases = await release_service.get_releases(db, skip=skip, limit=limit, cursor=cursor)
+    pagination.set_next_cursor(response, releases, crud_release.release.cursor_keys, limit)
+    return model_response(List[schemas.ReleaseResponse], releases, response, from_attributes=True)
 
 @router.get("/{release_id}", response_model=schemas.ReleaseDetailResponse)
 async def read_release(
@@ -50,6 +57,18 @@ async def create_work_item(
     work_item_in.release_id = release_id
     return await release_service.create_work_item(db, work_item_in)
 
+@router.put("/{release_id}/work-items/{work_item_id}", response_model=schemas.WorkItemResponse)
+async def update_work_item(
+    release_id: str,
+    work_item_id: str,
+    work_item_in: schemas.WorkItemUpdate,
+    db: Session = Depends(deps.get_db)
+):
+    work_item = await release_service.update_work_item(db, release_id, work_item_id, work_item_in)
+    if not work_item:
+        raise HTTPException(status_code=404, detail="Work item not found")
+    return work_item
+
 @router.get("/{release_id}/work-items", response_model=List[schemas.WorkItemResponse])
 async def read_release_work_items(
     release_id: str,
@@ -0,0 +1,25 @@
+from fastapi import APIRouter
+from app.core.broker import broker
+from app.core.cache import principal_cache
+from app.core.jobs import job_queue
+from app.core.singleflight import singleflight
+from app.crud.crud_collab import voting_results_cache
+from app.services.analytics_service import analytics_cache
+from app.services.vote_tally_service import vote_tally
+
+router = APIRouter()
+
+@router.get("/metrics")
+async def get_runtime_metrics():
+    """
+    In-process cache and buffer counters for this worker.
+    """
+    return {
+        "principal_cache": principal_cache.stats(),
+        "voting_results_cache": voting_results_cache.stats(),
+        "analytics_cache": analytics_cache.stats(),
+        "vote_tally": vote_tally.stats(),
+        "broker": broker.stats(),
+        "jobs": job_queue.stats(),
+        "singleflight": singleflight.stats(),
+    }
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy import select
-from typing import List
+from typing import List, Optional
 from app.api import deps
+from app.crud import pagination
+from app.crud.v2 import testing as crud_testing
 from app.schemas.v2 import testing as schemas
 from app.services import testing_service
 from app.models.user import User
@@ -41,9 +43,67 @@ async def create_execution(
         
     return await testing_service.create_test_execution(db, execution_in, current_user_id)
 
+@router.post("/cycles/{cycle_id}/executions/import", response_model=schemas.TestExecutionImportResult)
+async def import_executions(
+    cycle_id: str,
+    request: Request,
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    db: Session = Depends(deps.get_db)
+):
+    """
+    Bulk import executions from the raw request body: CSV with a header row
+    (title,status,comments,defect_id) or NDJSON, one object per line. The
+    format comes from `format` or the Content-Type (text/csv, else NDJSON).
+    """
+    cycle = await crud_testing.testing_cycle.get(db, id=cycle_id)
+    if not cycle:
+        raise HTTPException(status_code=404, detail="Testing cycle not found")
+    if format is None:
+        format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+
+    # Mock user
+    current_user_id = "00000000-0000-0000-0000-000000000000"
+    
+    stmt = select(User)
+    result = await db.execute(stmt)
+    user = result.scalars().first()
+    
+    if user:
+        current_user_id = user.id
+
+    return await testing_service.import_executions(db, cycle_id, request.stream(), format, current_user_id)
+
+@router.put("/executions/{execution_id}", response_model=schemas.TestExecutionResponse)
+async def update_execution(
+    execution_id: str,
+    execution_in: schemas.TestExecutionUpdate,
+    db: Session = Depends(deps.get_db)
+):
+    execution = await testing_service.update_test_execution(db, execution_id, execution_in)
+    if not execution:
+        raise HTTPException(status_code=404, detail="Test execution not found")
+    return execution
+
 @router.get("/cycles/{cycle_id}/executions", response_model=List[schemas.TestExecutionResponse])
 async def read_cycle_executions(
+    cycle_id: str,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(deps.get_db)
+):
+    executions = await testing_service.get_cycle_executions(db, cycle_id, skip=skip, limit=limit, cursor=cursor)
+    pagination.set_next_cursor(response, executions, crud_testing.test_execution.cursor_keys, limit)
+    return executions
+
+@router.get("/cycles/{cycle_id}/summary", response_model=schemas.TestingCycleSummary)
+async def read_cycle_summary(
     cycle_id: str,
     db: Session = Depends(deps.get_db)
 ):
-    return await testing_service.get_cycle_executions(db, cycle_id)
+    """Status counts and pass rate for a cycle, without reading its executions"""
+    summary = await testing_service.get_cycle_summary(db, cycle_id)
+    if not summary:
+        raise HTTPException(status_code=404, detail="Testing cycle not found")
+    return summary
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Set, Tuple
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres caps NOTIFY payloads at 8000 bytes
+PG_NOTIFY_MAX_BYTES = 7900
+
+class Subscription:
+    """One connected client. `closed` is set when it fell too far behind."""
+
+    def __init__(self, maxsize: int):
+        self.queue: "asyncio.Queue[dict]" = asyncio.Queue(maxsize=maxsize)
+        self.closed = asyncio.Event()
+
+
+class Broker:
+    """
+    In-process pub/sub keyed by topic (e.g. a user id).
+
+    With the "local" backend, messages only reach subscribers in this worker.
+    The "postgres" backend sends every publish through LISTEN/NOTIFY so all
+    workers (including this one) deliver it to their own subscribers. That
+    needs a direct/session-mode connection; transaction-mode poolers drop
+    LISTEN registrations.
+    """
+
+    def __init__(self, backend: str = "local", channel: str = "elevate_events", queue_size: int = 100):
+        self.backend = backend
+        self.channel = channel
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self._listen_connection = None
+        self.published = 0
+        self.delivered = 0
+        self.dropped_subscribers = 0
+
+    @asynccontextmanager
+    async def subscribe(self, topic: str) -> AsyncIterator[Subscription]:
+        subscription = Subscription(self.queue_size)
+        self._subscribers.setdefault(topic, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            subscribers = self._subscribers.get(topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[topic]
+
+    def deliver(self, topic: str, message: dict) -> None:
+        """Hand a message to this worker's subscribers of `topic`."""
+        for subscription in list(self._subscribers.get(topic, ())):
+            try:
+                subscription.queue.put_nowait(message)
+                self.delivered += 1
+            except asyncio.QueueFull:
+                # Slow consumer: cut it off; the client resumes from its last-seen id
+                subscription.closed.set()
+                self.dropped_subscribers += 1
+
+    async def publish(self, topic: str, message: dict) -> None:
+        await self.publish_many([(topic, message)])
+
+    async def publish_many(self, messages: List[Tuple[str, dict]]) -> None:
+        """Publish several (topic, message) pairs; one round trip on the postgres backend."""
+        if not messages:
+            return
+        self.published += len(messages)
+        if self.backend != "postgres":
+            for topic, message in messages:
+                self.deliver(topic, message)
+            return
+
+        from app.db import session as db_session
+        from sqlalchemy import text
+
+        payloads = []
+        for topic, message in messages:
+            payload = json.dumps({"topic": topic, "message": message}, default=str)
+            if len(payload.encode()) > PG_NOTIFY_MAX_BYTES:
+                # Too big for NOTIFY: send the id only, subscribers load the rest
+                payload = json.dumps({"topic": topic, "message": {"id": message.get("id")}})
+            payloads.append({"channel": self.channel, "payload": payload})
+        async with db_session.engine.connect() as conn:
+            await conn.execute(text("SELECT pg_notify(:channel, :payload)"), payloads)
+            await conn.commit()
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        try:
+            data = json.loads(payload)
+            self.deliver(data["topic"], data["message"])
+        except (ValueError, KeyError):
+            logger.warning("Ignoring malformed broker payload on %s", channel)
+
+    async def start(self) -> None:
+        if self.backend != "postgres" or self._listen_connection is not None:
+            return
+        from app.db import session as db_session
+
+        # Hold one pooled connection for the lifetime of the worker
+        self._listen_connection = await db_session.engine.connect()
+        raw = await self._listen_connection.get_raw_connection()
+        await raw.driver_connection.add_listener(self.channel, self._on_notify)
+
+    async def stop(self) -> None:
+        if self._listen_connection is None:
+            return
+        raw = await self._listen_connection.get_raw_connection()
+        await raw.driver_connection.remove_listener(self.channel, self._on_notify)
+        await self._listen_connection.close()
+        self._listen_connection = None
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.backend,
+            "topics": len(self._subscribers),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped_subscribers": self.dropped_subscribers,
+        }
+
+
+broker = Broker(
+    backend=settings.BROKER_BACKEND,
+    channel=settings.BROKER_PG_CHANNEL,
+    queue_size=settings.BROKER_QUEUE_SIZE,
+)
@@ -0,0 +1,178 @@
+import hmac
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+from app.core.config import settings
+from app.core.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache with a per-entry time-to-live.
+
+    Not shared between workers; each process keeps its own copy.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None, valid: Optional[Callable[[Any], bool]] = None) -> Any:
+        """The cached value, or `default` (a miss) if absent, expired or rejected by `valid`."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+        if valid is not None and not valid(value):
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any:
+        entry = self._data.pop(key, None)
+        return entry[1] if entry else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class PrincipalCache(TTLCache):
+    """
+    Authenticated users keyed by token signature.
+
+    Entries hold the token payload next to the loaded User so a cached
+    signature is only honoured for the exact token it was issued with.
+    """
+
+    def get_user(self, signature: str, payload: str) -> Any:
+        # Same signature, different payload: not ours, so a miss
+        entry = self.get(signature, valid=lambda entry: hmac.compare_digest(entry[0], payload))
+        return entry[1] if entry is not None else None
+
+    def set_user(self, signature: str, payload: str, user: Any, expires_at: Optional[float] = None) -> None:
+        ttl = self.ttl
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        self.set(signature, (payload, user), ttl=ttl)
+
+    def invalidate_users(self, user_ids: Iterable[str]) -> None:
+        user_ids = set(user_ids)
+        stale = [key for key, (_, (_, user)) in self._data.items() if user.id in user_ids]
+        for key in stale:
+            del self._data[key]
+
+
+class SWRCache:
+    """
+    In-process cache for expensive async results, with stale-while-revalidate.
+
+    Entries younger than `ttl` are served as-is. Older entries still inside
+    the `stale` window are served immediately while a single background task
+    recomputes them. Concurrent misses for the same key share one computation
+    (see `SingleFlight`), so a burst of identical requests runs the query once.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, tuple[float, float, Any]]" = OrderedDict()
+        self._flights = SingleFlight()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+
+    async def get_or_compute(
+        self, key: Hashable, compute: Callable[[], Awaitable[Any]], ttl: float, stale: float = 0
+    ) -> Any:
+        entry = self._data.get(key)
+        if entry is not None:
+            fresh_until, stale_until, value = entry
+            now = time.monotonic()
+            if now < fresh_until:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            if now < stale_until:
+                self.stale_hits += 1
+                self._flights.task(key, lambda: self._store(key, compute, ttl, stale))
+                return value
+
+        self.misses += 1
+        return await self._flights.do(key, lambda: self._store(key, compute, ttl, stale))
+
+    async def _store(self, key: Hashable, compute: Callable[[], Awaitable[Any]], ttl: float, stale: float) -> Any:
+        try:
+            value = await compute()
+        except Exception as exc:
+            self.refresh_errors += 1
+            logger.warning("Cached computation failed: %r", exc)
+            raise
+        now = time.monotonic()
+        self._data[key] = (now + ttl, now + ttl + stale, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self._flights.coalesced,
+            "refresh_errors": self.refresh_errors,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,96 @@
+import asyncio
+import gzip
+from typing import Iterable, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            # "gzip;q=0" means the client refuses it
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+class CompressionMiddleware:
+    """
+    Gzip for complete (non-streaming) responses the client accepts it for.
+
+    Bodies under `minimum_size` go out as-is. Bodies of `thread_size` or more
+    are compressed in a worker thread so the event loop keeps serving.
+    Streaming responses (more than one body message), server-sent events,
+    already-encoded responses and `exclude_paths` prefixes pass through
+    untouched. Strong ETags become weak, since the bytes differ from the
+    identity representation; ETagMiddleware matches either form.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        thread_size: int = 64 * 1024,
+        level: int = 6,
+        exclude_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_size = thread_size
+        self.level = level
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"].startswith(self.exclude_paths)
+            or not _accepts_gzip(Headers(scope=scope).get("accept-encoding", ""))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    "content-encoding" in headers
+                    or headers.get("content-type", "").startswith("text/event-stream")
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # Held back until the body shows whether it is worth compressing
+                    start = message
+                return
+
+            body = message.get("body", b"")
+            if message.get("more_body", False) or len(body) < self.minimum_size:
+                # Streaming (or small): send the original response unchanged
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            if len(body) >= self.thread_size:
+                compressed = await asyncio.to_thread(gzip.compress, body, self.level)
+            else:
+                compressed = gzip.compress(body, self.level)
+
+            headers = MutableHeaders(scope=start)
+            headers["Content-Encoding"] = "gzip"
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
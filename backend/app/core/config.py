@@ -29,6 +29,56 @@ class Settings(BaseSettings):
 
     SECRET_KEY: str = "dev_secret_key_change_in_production"
 
+    # Authenticated user cache (per process)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 1024
+
+    # Voting results cache, used while voting is closed
+    VOTING_RESULTS_CACHE_TTL_SECONDS: int = 300
+
+    # Analytics results cache (per-metric TTLs live in analytics_service); expired
+    # results are still served this long while they refresh in the background
+    ANALYTICS_CACHE_STALE_SECONDS: int = 600
+    ANALYTICS_CACHE_MAX_SIZE: int = 256
+
+    # Event vote tallies: how often pending deltas are folded in, and how many per transaction
+    VOTE_TALLY_FLUSH_SECONDS: float = 2.0
+    VOTE_TALLY_FLUSH_BATCH_SIZE: int = 5000
+
+    # Real-time push: "local" (single worker) or "postgres" (LISTEN/NOTIFY fan-out)
+    BROKER_BACKEND: str = "local"
+    BROKER_PG_CHANNEL: str = "elevate_events"
+    BROKER_QUEUE_SIZE: int = 100
+    SSE_KEEPALIVE_SECONDS: int = 15
+
+    # Likes/comments on the same item merge into one notification per window
+    NOTIFICATION_COALESCE_WINDOW_MINUTES: int = 60
+
+    # Read notifications older than this move to notifications_archive
+    NOTIFICATION_RETENTION_DAYS: int = 90
+    NOTIFICATION_ARCHIVE_BATCH_SIZE: int = 1000
+
+    # Background jobs (app/core/jobs.py); set JOB_WORKER_IN_PROCESS=false when running `python -m app.worker`
+    JOB_WORKER_IN_PROCESS: bool = True
+    JOB_CONCURRENCY: int = 4
+    JOB_POLL_SECONDS: float = 1.0
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BASE_SECONDS: float = 5.0
+    JOB_LOCK_TIMEOUT_SECONDS: int = 300
+
+    # Bulk test execution import: rows per INSERT/commit, and per-row errors reported
+    TEST_IMPORT_BATCH_SIZE: int = 500
+    TEST_IMPORT_MAX_ERRORS: int = 1000
+
+    # Response gzip (app/core/compression.py): smallest body worth compressing, and
+    # the size from which compression runs in a worker thread
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_THREAD_SIZE: int = 65536
+    COMPRESSION_LEVEL: int = 6
+
+    # Concurrent read fan-out (app/db/parallel.py); keep below the pool size
+    PARALLEL_QUERY_CONCURRENCY: int = 8
+
 
     @computed_field
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
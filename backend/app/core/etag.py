@@ -0,0 +1,99 @@
+import hashlib
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.models.v2.table_version import VERSIONED_TABLES, get_versions
+
+logger = logging.getLogger(__name__)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses the weak comparison: W/"x" matches "x"
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in candidates)
+
+
+class ETagMiddleware:
+    """
+    Conditional GETs for read endpoints backed by versioned tables.
+
+    `routes` maps a path (FastAPI syntax, e.g. "/api/v2/events/{event_id}")
+    to the tables its response is built from. For a matching GET the
+    middleware looks up those tables' versions (one small query) and derives
+    a strong ETag from them plus the URL and Authorization header. A request
+    whose If-None-Match already carries it gets a 304 without the endpoint
+    running; otherwise the endpoint's 200 goes out with the ETag attached.
+    """
+
+    def __init__(self, app: ASGIApp, routes: Dict[str, Iterable[str]]):
+        self.app = app
+        self.routes: List[Tuple[object, Tuple[str, ...]]] = []
+        for path, tables in routes.items():
+            tables = tuple(sorted(tables))
+            unknown = set(tables) - VERSIONED_TABLES
+            if unknown:
+                raise ValueError(f"{path}: tables without version tracking: {sorted(unknown)}")
+            self.routes.append((compile_path(path)[0], tables))
+
+    def _tables(self, path: str) -> Optional[Tuple[str, ...]]:
+        for regex, tables in self.routes:
+            if regex.match(path):
+                return tables
+        return None
+
+    async def _etag(self, scope: Scope, tables: Tuple[str, ...]) -> str:
+        from app.db import session as db_session
+
+        async with db_session.AsyncSessionLocal() as db:
+            versions = await get_versions(db, tables)
+        headers = Headers(scope=scope)
+        digest = hashlib.sha256()
+        for part in (
+            scope["path"],
+            scope.get("query_string", b"").decode("latin-1"),
+            headers.get("authorization", ""),
+            *(f"{name}={versions[name]}" for name in tables),
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return f'"{digest.hexdigest()[:32]}"'
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        tables = self._tables(scope["path"])
+        if tables is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            etag = await self._etag(scope, tables)
+        except Exception:
+            logger.exception("Version lookup failed; serving %s without an ETag", scope["path"])
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            await send({
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [(b"etag", etag.encode()), (b"cache-control", b"private, no-cache")],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_etag(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                headers["ETag"] = etag
+                # Clients may keep the response but must revalidate it before reuse
+                headers.setdefault("Cache-Control", "private, no-cache")
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+from sqlalchemy import event, select, update, delete, or_, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.db.dialect import upsert
+from app.models.v2.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[..., Awaitable[None]]
+
+class JobQueue:
+    """
+    Durable job queue on the `jobs` table.
+
+    `enqueue` writes the job in the caller's transaction, so it exists exactly
+    when the write that needs it commits. Workers claim due jobs with
+    SELECT ... FOR UPDATE SKIP LOCKED, so any number of them (in-process or
+    `python -m app.worker`) can share the table without double-running a job.
+    A running job's lock is refreshed while its handler works, so only jobs
+    whose worker died are claimed again after JOB_LOCK_TIMEOUT_SECONDS.
+    Failures are retried with exponential backoff up to `max_attempts`.
+
+    Handlers are `async def handler(db, **payload)`, registered with
+    `@job_queue.handler("name")` in the service module that owns the work.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, Handler] = {}
+        self._wakeup = asyncio.Event()
+        self.running = 0
+        self.claimed = 0
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+
+    def handler(self, name: str) -> Callable[[Handler], Handler]:
+        def register(fn: Handler) -> Handler:
+            self._handlers[name] = fn
+            return fn
+        return register
+
+    def _enqueue_statement(self, bind, name: str, key: Optional[str], delay_seconds: float, payload: dict):
+        now = datetime.utcnow()
+        stmt = upsert(bind, Job.__table__).values(
+            id=str(uuid.uuid4()),
+            name=name,
+            key=key,
+            payload=payload,
+            status=JobStatus.QUEUED,
+            attempts=0,
+            max_attempts=settings.JOB_MAX_ATTEMPTS,
+            run_after=now + timedelta(seconds=delay_seconds),
+            created_at=now,
+        )
+        if key is not None:
+            # Updating (rather than skipping) the waiting job row-locks it until the
+            # caller commits; workers skip locked rows, so it can't run before then
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["name", "key"],
+                index_where=Job.status == JobStatus.QUEUED,
+                set_={"payload": stmt.excluded.payload, "run_after": stmt.excluded.run_after},
+            )
+        return stmt
+
+    async def enqueue(self, db, name: str, key: Optional[str] = None, delay_seconds: float = 0, **payload) -> None:
+        """
+        Add a job to the caller's transaction (it runs once that commits).
+
+        With a `key`, a job of the same name and key that is still waiting
+        to run absorbs this one, e.g. one metrics refresh per release. A job
+        already running doesn't: the new one runs again after it.
+        """
+        await db.execute(self._enqueue_statement(db, name, key, delay_seconds, payload))
+        db.info["jobs_enqueued"] = True
+
+    def enqueue_in_flush(self, session, name: str, key: Optional[str] = None, delay_seconds: float = 0, **payload) -> None:
+        """`enqueue` for flush event hooks, on the flushing (sync) session's connection."""
+        connection = session.connection()
+        connection.execute(self._enqueue_statement(connection, name, key, delay_seconds, payload))
+        session.info["jobs_enqueued"] = True
+
+    async def _claim(self, db, limit: int) -> List[Job]:
+        now = datetime.utcnow()
+        stale = now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS)
+        stmt = (
+            select(Job)
+            .where(or_(
+                and_(Job.status == JobStatus.QUEUED, Job.run_after <= now),
+                # Claimed by a worker that died mid-job
+                and_(Job.status == JobStatus.RUNNING, Job.locked_at < stale),
+            ))
+            .order_by(Job.run_after)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        jobs = (await db.execute(stmt)).scalars().all()
+        for job in jobs:
+            job.status = JobStatus.RUNNING
+            job.locked_at = now
+            job.attempts += 1
+        await db.commit()
+        self.claimed += len(jobs)
+        return jobs
+
+    @staticmethod
+    def _owned(job: Job):
+        """`job`'s row while still held by this claim (every claim bumps `attempts`)."""
+        return and_(Job.id == job.id, Job.status == JobStatus.RUNNING, Job.attempts == job.attempts)
+
+    async def _heartbeat(self, job: Job) -> None:
+        """Refresh `job`'s lock while its handler runs, so it never looks abandoned."""
+        from app.db import session as db_session
+
+        while True:
+            await asyncio.sleep(settings.JOB_LOCK_TIMEOUT_SECONDS / 3)
+            now = datetime.utcnow()
+            try:
+                async with db_session.AsyncSessionLocal() as db:
+                    result = await db.execute(update(Job).where(self._owned(job)).values(locked_at=now))
+                    await db.commit()
+            except Exception:
+                logger.exception("Refreshing the lock of job %s failed; will retry", job.id)
+                continue
+            if not result.rowcount:
+                logger.warning("Job %s (%s) lost its lock while running", job.id, job.name)
+                return
+
+    async def _run(self, job: Job) -> None:
+        from app.db import session as db_session
+
+        self.running += 1
+        try:
+            handler = self._handlers.get(job.name)
+            if handler is None:
+                raise LookupError(f"No handler registered for job {job.name!r}")
+            heartbeat = asyncio.create_task(self._heartbeat(job))
+            try:
+                async with db_session.AsyncSessionLocal() as db:
+                    await handler(db, **(job.payload or {}))
+            finally:
+                heartbeat.cancel()
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed on attempt %d", job.id, job.name, job.attempts)
+            async with db_session.AsyncSessionLocal() as db:
+                await self._record_failure(db, job, f"{type(exc).__name__}: {exc}")
+        else:
+            async with db_session.AsyncSessionLocal() as db:
+                await db.execute(delete(Job).where(self._owned(job)))
+                await db.commit()
+            self.succeeded += 1
+        finally:
+            self.running -= 1
+            self._wakeup.set()
+
+    async def _record_failure(self, db, job: Job, error: str) -> None:
+        if job.attempts >= job.max_attempts:
+            values = {"status": JobStatus.FAILED}
+            self.failed += 1
+        else:
+            delay = settings.JOB_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1)
+            values = {"status": JobStatus.QUEUED, "run_after": datetime.utcnow() + timedelta(seconds=delay)}
+            self.retried += 1
+        try:
+            await db.execute(
+                update(Job).where(self._owned(job)).values(last_error=error[:2000], locked_at=None, **values)
+            )
+            await db.commit()
+        except IntegrityError:
+            # A newer job with the same key is already queued and will do the work
+            await db.rollback()
+            await db.execute(delete(Job).where(self._owned(job)))
+            await db.commit()
+
+    async def run_worker(self, concurrency: Optional[int] = None, poll_seconds: Optional[float] = None) -> None:
+        """Claim and run jobs until cancelled; waits for in-flight jobs on the way out."""
+        from app.db import session as db_session
+
+        concurrency = concurrency or settings.JOB_CONCURRENCY
+        poll_seconds = poll_seconds or settings.JOB_POLL_SECONDS
+        in_flight: Set[asyncio.Task] = set()
+        try:
+            while True:
+                self._wakeup.clear()
+                free = concurrency - len(in_flight)
+                if free > 0:
+                    try:
+                        async with db_session.AsyncSessionLocal() as db:
+                            jobs = await self._claim(db, free)
+                    except Exception:
+                        logger.exception("Claiming jobs failed; will retry")
+                        jobs = []
+                    for job in jobs:
+                        task = asyncio.create_task(self._run(job))
+                        in_flight.add(task)
+                        task.add_done_callback(in_flight.discard)
+                # Woken early by new jobs and by finished ones freeing a slot
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "handlers": len(self._handlers),
+            "running": self.running,
+            "claimed": self.claimed,
+            "succeeded": self.succeeded,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+job_queue = JobQueue()
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_workers(session):
+    # Only now are the new jobs visible to the workers' claim queries
+    if session.info.pop("jobs_enqueued", False):
+        job_queue._wakeup.set()
+
+@event.listens_for(Session, "after_rollback")
+def _forget_jobs(session):
+    session.info.pop("jobs_enqueued", None)
@@ -0,0 +1,109 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from fastapi import Request
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one in-flight computation.
+
+    The first caller for a key starts the work as a task; everyone arriving
+    before it finishes awaits that same task and gets the same result (or
+    exception). Nothing is kept afterwards - this is not a cache, it only
+    stops a burst of identical requests from running identical queries.
+
+    Waiters are shielded, so a caller that disconnects doesn't cancel the
+    work for the rest. The computation therefore must not use anything owned
+    by a single request, such as its `get_db` session.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def task(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """The in-flight task for `key`, starting `compute` if there is none."""
+        self.calls += 1
+        task = self._tasks.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+
+        async def run():
+            try:
+                return await compute()
+            finally:
+                self._tasks.pop(key, None)
+
+        task = asyncio.create_task(run())
+        # Marks the exception as retrieved when nobody is left waiting on it
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._tasks[key] = task
+        return task
+
+    async def do(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        return await asyncio.shield(self.task(key, compute))
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._tasks),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalescing_ratio": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+        }
+
+
+singleflight = SingleFlight()
+
+
+def request_key(request: Request) -> tuple:
+    """Route, query parameters and authorization scope of a request."""
+    route = request.scope.get("route")
+    return (
+        request.method,
+        getattr(route, "path", request.url.path),
+        tuple(sorted(request.path_params.items())),
+        tuple(sorted(request.query_params.multi_items())),
+        request.headers.get("authorization"),
+    )
+
+
+class Flight:
+    """Runs a computation for one request, shared with identical concurrent requests."""
+
+    def __init__(self, key: Hashable):
+        self.key = key
+
+    async def __call__(self, compute: Callable[..., Awaitable[Any]]) -> Any:
+        """
+        `compute(db)` gets a session of its own, since the request that
+        starts it may go away before the others are served.
+        """
+        from app.db import session as db_session
+
+        async def run():
+            async with db_session.AsyncSessionLocal() as db:
+                return await compute(db)
+
+        return await singleflight.do(self.key, run)
+
+
+async def coalesced(request: Request) -> Flight:
+    """
+    Dependency: `flight: Flight = Depends(coalesced)`, then
+    `return await flight(lambda db: ...)` in the endpoint.
+    """
+    return Flight(request_key(request))
+
+
+def single_flight(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Decorator for async functions whose arguments are hashable values (no
+    sessions): concurrent calls with equal arguments share one execution.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+        return await singleflight.do(key, lambda: fn(*args, **kwargs))
+    return wrapper
@@ -4,7 +4,8 @@ from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Select, select
+from app.crud.pagination import keyset
 from app.db.base_class import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
@@ -24,14 +25,66 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    @property
+    def cursor_keys(self) -> tuple:
+        """
+        Keyset sort columns for cursor pagination: (created_at, id) newest first when
+        available, otherwise (name, id) alphabetically, never the bare random-UUID id.
+        """
+        if hasattr(self.model, "created_at"):
+            return (self.model.created_at, self.model.id)
+        if hasattr(self.model, "name"):
+            return (self.model.name, self.model.id)
+        return (self.model.id,)
+
+    @property
+    def cursor_descending(self) -> bool:
+        return hasattr(self.model, "created_at")
+
+    @property
+    def default_order(self) -> tuple:
+        """Order for plain (non-keyset) listings: oldest first, or alphabetical for models without a timestamp."""
+        return tuple(key.asc() for key in self.cursor_keys)
+
+    def paginate(
+        self,
+        stmt: Select,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        keyset_order: bool = False,
+    ) -> Select:
+        """
+        Apply keyset pagination when a cursor is given, otherwise classic offset/limit.
+
+        Listings that hand out an X-Next-Cursor pass `keyset_order=True` so their
+        offset pages use the cursor order too and the cursor continues exactly
+        where the page ended. Other offset queries keep their own ORDER BY, with
+        `default_order` appended so ties (or a missing ORDER BY) stay stable.
+        """
+        if cursor or keyset_order:
+            stmt = keyset(stmt, self.cursor_keys, cursor, self.cursor_descending)
+        else:
+            stmt = stmt.order_by(*self.default_order)
+        if cursor:
+            return stmt.limit(limit)
+        return stmt.offset(skip).limit(limit)
+
     async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
         result = await db.execute(select(self.model).filter(self.model.id == id))
         return result.scalars().first()
 
     async def get_multi(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        keyset_order: bool = False,
     ) -> List[ModelType]:
-        result = await db.execute(select(self.model).offset(skip).limit(limit))
+        stmt = self.paginate(select(self.model), skip=skip, limit=limit, cursor=cursor, keyset_order=keyset_order)
+        result = await db.execute(stmt)
         return result.scalars().all()
 
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
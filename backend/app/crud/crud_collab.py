@@ -1,13 +1,40 @@
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import event, select, func
+from sqlalchemy.orm import Session, object_session, selectinload
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.crud.base import CRUDBase
+from app.crud.crud_voting_status import voting_status
 from app.models.feedback import AwardCategory, Vote
+from app.models.user import User
+from app.models.voting_status import VotingStatus
 from app.schemas.collab import AwardCategoryCreate, VoteCreate
 import uuid
 
+# Voting results, cached only while voting is closed (see CRUDVote._results_cache_key)
+voting_results_cache = TTLCache(maxsize=256, ttl=settings.VOTING_RESULTS_CACHE_TTL_SECONDS)
+
+# Any write to a category or to the voting status, however it is made, drops
+# the cached results once it commits (clearing at flush time would let a
+# concurrent read cache the pre-commit state again).
+def _results_changed(mapper, connection, target):
+    object_session(target).info["voting_results_changed"] = True
+
+for _model in (AwardCategory, VotingStatus):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, _results_changed)
+
+@event.listens_for(Session, "after_commit")
+def _clear_voting_results(session):
+    if session.info.pop("voting_results_changed", False):
+        voting_results_cache.clear()
+
+@event.listens_for(Session, "after_rollback")
+def _keep_voting_results(session):
+    session.info.pop("voting_results_changed", None)
+
 class CRUDAwardCategory(CRUDBase[AwardCategory, AwardCategoryCreate, AwardCategoryCreate]):
     pass
 
@@ -42,58 +69,94 @@ class CRUDVote(CRUDBase[Vote, VoteCreate, VoteCreate]):
         )
         return result.scalars().first()
     
-    async def get_category_results(
-        self, db: AsyncSession, *, category_id: str
-    ) -> List[Dict]:
-        """Get top 3 voted users for a specific category"""
-        from sqlalchemy import desc
-        
-        # Count votes per nominee for this category
-        stmt = (
+    async def _results_cache_key(self, db: AsyncSession, *parts) -> Optional[tuple]:
+        """
+        Cache key for results, or None while voting is open.
+
+        Results are frozen while voting is closed. The key includes the status'
+        `updated_at`, so reopening/closing voting in any process starts a new
+        generation of cache entries.
+        """
+        status = await voting_status.get_current_status(db)
+        if status and status.is_voting_open:
+            return None
+        return (status.updated_at if status else None, *parts)
+
+    async def _ranked_results(
+        self, db: AsyncSession, *, category_id: Optional[str] = None, top_n: int = 3
+    ) -> Dict[str, List[Dict]]:
+        """Top `top_n` nominees per category in one query, keyed by category id"""
+        vote_count = func.count(Vote.id)
+        ranked = (
             select(
+                Vote.award_category_id,
                 Vote.nominee_id,
-                func.count(Vote.id).label('vote_count')
+                vote_count.label("vote_count"),
+                func.row_number().over(
+                    partition_by=Vote.award_category_id,
+                    order_by=(vote_count.desc(), Vote.nominee_id),
+                ).label("position"),
             )
-            .filter(Vote.award_category_id == category_id)
-            .group_by(Vote.nominee_id)
-            .order_by(desc('vote_count'))
-            .limit(3)
+            .group_by(Vote.award_category_id, Vote.nominee_id)
+        )
+        if category_id:
+            ranked = ranked.filter(Vote.award_category_id == category_id)
+        ranked = ranked.subquery()
+
+        stmt = (
+            select(ranked.c.award_category_id, ranked.c.nominee_id, ranked.c.vote_count, User.name)
+            .join(User, User.id == ranked.c.nominee_id)
+            .filter(ranked.c.position <= top_n)
+            .order_by(ranked.c.award_category_id, ranked.c.position)
         )
-        
         result = await db.execute(stmt)
-        rows = result.all()
-        
-        # Load user details for each nominee
-        from app.models.user import User
-        results = []
-        for row in rows:
-            user_result = await db.execute(
-                select(User).filter(User.id == row.nominee_id)
-            )
-            user = user_result.scalars().first()
-            if user:
-                results.append({
-                    'nominee_id': row.nominee_id,
-                    'nominee_name': user.name,
-                    'vote_count': row.vote_count
-                })
-        
+
+        results: Dict[str, List[Dict]] = {}
+        for row in result.all():
+            results.setdefault(row.award_category_id, []).append({
+                'nominee_id': row.nominee_id,
+                'nominee_name': row.name,
+                'vote_count': row.vote_count
+            })
+        return results
+
+    async def get_category_results(
+        self, db: AsyncSession, *, category_id: str
+    ) -> List[Dict]:
+        """Get top 3 voted users for a specific category"""
+        cache_key = await self._results_cache_key(db, "category", category_id)
+        if cache_key is not None:
+            cached = voting_results_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        results = (await self._ranked_results(db, category_id=category_id)).get(category_id, [])
+        if cache_key is not None:
+            voting_results_cache.set(cache_key, results)
         return results
     
     async def get_all_category_results(self, db: AsyncSession) -> Dict[str, List[Dict]]:
         """Get top 3 results for all categories"""
+        cache_key = await self._results_cache_key(db, "all")
+        if cache_key is not None:
+            cached = voting_results_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Get all categories
         categories = await award_category.get_multi(db, skip=0, limit=100)
+        ranked = await self._ranked_results(db)
         
         results = {}
         for category in categories:
-            category_results = await self.get_category_results(db, category_id=category.id)
             results[category.id] = {
                 'category_name': category.name,
                 'category_icon': category.icon,
-                'top_3': category_results
+                'top_3': ranked.get(category.id, [])
             }
-        
+
+        if cache_key is not None:
+            voting_results_cache.set(cache_key, results)
         return results
 
 award_category = CRUDAwardCategory(AwardCategory)
@@ -1,8 +1,8 @@
 
-from typing import List
+from typing import List, Optional
 import uuid
 
-from sqlalchemy import select, desc
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,32 +12,36 @@ from app.schemas.feedback import FeedbackCreate, FeedbackUpdate
 
 
 class CRUDFeedback(CRUDBase[Feedback, FeedbackCreate, FeedbackUpdate]):
+    @property
+    def cursor_keys(self) -> tuple:
+        return (Feedback.date, Feedback.id)
+
+    @property
+    def cursor_descending(self) -> bool:
+        return True
+
     async def get_received(
-        self, db: AsyncSession, *, user_id: str, skip: int = 0, limit: int = 100
+        self, db: AsyncSession, *, user_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
     ) -> List[Feedback]:
         """Get feedback received by a user"""
-        result = await db.execute(
+        stmt = (
             select(Feedback)
             .options(selectinload(Feedback.from_user), selectinload(Feedback.to_user))
             .filter(Feedback.to_user_id == user_id)
-            .order_by(desc(Feedback.date))
-            .offset(skip)
-            .limit(limit)
-        )
+                    )
+        result = await db.execute(self.paginate(stmt, skip=skip, limit=limit, cursor=cursor, keyset_order=True))
         return result.scalars().all()
 
     async def get_sent(
-        self, db: AsyncSession, *, user_id: str, skip: int = 0, limit: int = 100
+        self, db: AsyncSession, *, user_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
     ) -> List[Feedback]:
         """Get feedback sent by a user"""
-        result = await db.execute(
+        stmt = (
             select(Feedback)
             .options(selectinload(Feedback.from_user), selectinload(Feedback.to_user))
             .filter(Feedback.from_user_id == user_id)
-            .order_by(desc(Feedback.date))
-            .offset(skip)
-            .limit(limit)
-        )
+                    )
+        result = await db.execute(self.paginate(stmt, skip=skip, limit=limit, cursor=cursor, keyset_order=True))
         return result.scalars().all()
 
     async def create(
@@ -7,6 +7,10 @@ from app.models.release import ReleaseWorkItem
 from app.schemas.release import ReleaseWorkItemCreate, ReleaseWorkItemUpdate
 
 class CRUDReleaseWorkItem(CRUDBase[ReleaseWorkItem, ReleaseWorkItemCreate, ReleaseWorkItemUpdate]):
+    @property
+    def cursor_keys(self) -> tuple:
+        return (ReleaseWorkItem.title, ReleaseWorkItem.id)
+
     async def update(
         self,
         db: AsyncSession,
@@ -17,11 +17,15 @@ class CRUDTeam(CRUDBase[Team, TeamCreate, TeamUpdate]):
         return result.scalars().first()
 
     async def get_multi(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        keyset_order: bool = False,
     ) -> List[Team]:
-        result = await db.execute(
-            select(Team).options(selectinload(Team.members), selectinload(Team.art)).offset(skip).limit(limit)
-        )
+        stmt = select(Team).options(selectinload(Team.members), selectinload(Team.art))
+        result = await db.execute(self.paginate(stmt, skip=skip, limit=limit, cursor=cursor, keyset_order=keyset_order))
         return result.scalars().all()
 
     async def create(self, db: AsyncSession, *, obj_in: TeamCreate) -> Team:
@@ -39,11 +43,15 @@ class CRUDART(CRUDBase[ART, ARTCreate, ARTUpdate]):
         return result.scalars().first()
 
     async def get_multi(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        keyset_order: bool = False,
     ) -> List[ART]:
-        result = await db.execute(
-            select(ART).options(selectinload(ART.teams).selectinload(Team.members)).offset(skip).limit(limit)
-        )
+        stmt = select(ART).options(selectinload(ART.teams).selectinload(Team.members))
+        result = await db.execute(self.paginate(stmt, skip=skip, limit=limit, cursor=cursor, keyset_order=keyset_order))
         return result.scalars().all()
 
     async def create(self, db: AsyncSession, *, obj_in: ARTCreate) -> ART:
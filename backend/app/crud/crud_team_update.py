@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional
 
-from sqlalchemy import select, desc
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -10,16 +10,14 @@ from app.schemas.team_update import TeamUpdateCreate, TeamUpdateUpdate
 
 class CRUDTeamUpdate(CRUDBase[TeamUpdate, TeamUpdateCreate, TeamUpdateUpdate]):
     async def get_multi_by_team(
-        self, db: AsyncSession, *, team_id: str, skip: int = 0, limit: int = 100
+        self, db: AsyncSession, *, team_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
     ) -> List[TeamUpdate]:
-        result = await db.execute(
+        stmt = (
             select(TeamUpdate)
             .options(selectinload(TeamUpdate.user))
             .filter(TeamUpdate.team_id == team_id)
-            .order_by(desc(TeamUpdate.created_at))
-            .offset(skip)
-            .limit(limit)
         )
+        result = await db.execute(self.paginate(stmt, skip=skip, limit=limit, cursor=cursor, keyset_order=True))
         return result.scalars().all()
 
     async def get(self, db: AsyncSession, id: str) -> TeamUpdate:
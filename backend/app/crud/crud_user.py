@@ -20,14 +20,15 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         return result.scalars().first()
 
     async def get_multi(
-        self, db: AsyncSession, skip: int = 0, limit: int = 100
+        self,
+        db: AsyncSession,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        keyset_order: bool = False,
     ) -> List[User]:
-        result = await db.execute(
-            select(User)
-            .options(selectinload(User.team).selectinload(Team.art))
-            .offset(skip)
-            .limit(limit)
-        )
+        stmt = select(User).options(selectinload(User.team).selectinload(Team.art))
+        result = await db.execute(self.paginate(stmt, skip=skip, limit=limit, cursor=cursor, keyset_order=keyset_order))
         return result.scalars().all()
 
     async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
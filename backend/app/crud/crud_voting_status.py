@@ -10,11 +10,18 @@ from app.schemas.voting_status import VotingStatusUpdate
 
 
 class CRUDVotingStatus:
-    async def get_current_status(self, db: AsyncSession) -> Optional[VotingStatus]:
-        """Get the current voting status (single row)"""
-        result = await db.execute(
-            select(VotingStatus).filter(VotingStatus.id == "default")
-        )
+    async def get_current_status(self, db: AsyncSession, *, lock: bool = False) -> Optional[VotingStatus]:
+        """
+        Get the current voting status (single row).
+
+        `lock=True` share-locks the row until the caller's transaction ends, so
+        voting can't be closed (or reopened) between this check and the write
+        that depends on it. Share locks don't block each other, only the update.
+        """
+        stmt = select(VotingStatus).filter(VotingStatus.id == "default")
+        if lock:
+            stmt = stmt.with_for_update(read=True)
+        result = await db.execute(stmt)
         return result.scalars().first()
     
     async def update_status(
@@ -0,0 +1,68 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Select, tuple_
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor for a keyset position, e.g. (created_at, id) of the last row."""
+    raw = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(raw, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> list:
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(raw, list) or len(raw) != len(keys):
+            raise ValueError("cursor does not match sort keys")
+        values = []
+        for key, value in zip(keys, raw):
+            if key.type.python_type is datetime:
+                value = datetime.fromisoformat(value)
+            values.append(value)
+        return values
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {e}") from e
+
+
+def keyset(stmt: Select, keys: Sequence[Any], cursor: Optional[str], descending: bool = True) -> Select:
+    """
+    Order `stmt` by `keys` (newest first unless `descending` is False) and, if a cursor is given, seek past it.
+
+    `keys` must end with a unique column (normally the primary key) so the
+    order is total, and should be backed by a matching composite index.
+    """
+    stmt = stmt.order_by(None).order_by(*(key.desc() if descending else key.asc() for key in keys))
+    if cursor:
+        values = decode_cursor(cursor, keys)
+        if len(keys) == 1:
+            stmt = stmt.where(keys[0] < values[0] if descending else keys[0] > values[0])
+        else:
+            stmt = stmt.where(tuple_(*keys) < tuple_(*values) if descending else tuple_(*keys) > tuple_(*values))
+    return stmt
+
+
+def next_cursor(items: Sequence[Any], keys: Sequence[Any], limit: int) -> Optional[str]:
+    """Cursor for the page after `items`, or None when this was the last page."""
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    if isinstance(last, dict):
+        return encode_cursor([last[key.key] for key in keys])
+    return encode_cursor([getattr(last, key.key) for key in keys])
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor(response: Any, items: Sequence[Any], keys: Sequence[Any], limit: int) -> None:
+    """Expose the next-page cursor as a response header so list bodies keep their shape."""
+    cursor = next_cursor(items, keys, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -1,25 +1,140 @@
+from datetime import datetime
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import select, update
+from sqlalchemy import select, update, tuple_, func, literal
+from app.db.dialect import upsert
 from app.crud.base import CRUDBase
-from app.models.v2.notification import Notification, NotificationPreference
+from app.models.v2.notification import Notification, NotificationPreference, NotificationUnreadCount
 from app.schemas.v2.notification import NotificationCreate, NotificationPreferenceUpdate
 
 class CRUDNotification(CRUDBase[Notification, NotificationCreate, NotificationCreate]):
-    async def get_by_user(self, db: Session, user_id: str, skip: int = 0, limit: int = 50, only_unread: bool = False) -> List[Notification]:
+    async def get_by_user(self, db: Session, user_id: str, skip: int = 0, limit: int = 50, only_unread: bool = False, cursor: Optional[str] = None) -> List[Notification]:
         stmt = select(Notification).where(Notification.user_id == user_id)
         if only_unread:
             stmt = stmt.where(Notification.is_read == False)
-        stmt = stmt.order_by(Notification.created_at.desc()).offset(skip).limit(limit)
+        stmt = self.paginate(stmt, skip=skip, limit=limit, cursor=cursor, keyset_order=True)
         result = await db.execute(stmt)
         return result.scalars().all()
 
+    async def get_since(self, db: Session, user_id: str, last_id: str, limit: int = 100) -> List[Notification]:
+        """The user's notifications created after `last_id`, oldest first (for stream resume)"""
+        anchor = (await db.execute(
+            select(Notification.created_at, Notification.id)
+            .where(Notification.id == last_id, Notification.user_id == user_id)
+        )).first()
+        if not anchor:
+            return []
+        stmt = (
+            select(Notification)
+            .where(
+                Notification.user_id == user_id,
+                tuple_(Notification.created_at, Notification.id) > tuple_(anchor.created_at, anchor.id),
+            )
+            .order_by(Notification.created_at, Notification.id)
+            .limit(limit)
+        )
+        result = await db.execute(stmt)
+        return result.scalars().all()
+
+    def _seed_unread_count(self, db: Session, user_id: str):
+        """
+        INSERT of the user's counter, counted from the partial unread index in
+        the same statement. Racing writers and readers all go through this
+        INSERT, so each one either creates the row or conflicts on it and waits
+        for the other to commit - no write slips in between count and seed.
+        """
+        unread = (
+            select(func.count()).select_from(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read == False)
+            .scalar_subquery()
+        )
+        return upsert(db, NotificationUnreadCount.__table__).values(
+            user_id=user_id, unread_count=unread, updated_at=datetime.utcnow()
+        )
+
+    async def adjust_unread_count(self, db: Session, user_id: str, delta: int) -> None:
+        """Shift the stored unread counter; call after flushing the notification write, before committing."""
+        if not delta:
+            return
+        counter = NotificationUnreadCount.__table__
+        shifted = {"unread_count": counter.c.unread_count + delta, "updated_at": datetime.utcnow()}
+        result = await db.execute(update(counter).where(counter.c.user_id == user_id).values(**shifted))
+        if result.rowcount:
+            return
+        # Not counted yet: the count already includes this write, unless another transaction seeds first
+        await db.execute(
+            self._seed_unread_count(db, user_id).on_conflict_do_update(index_elements=["user_id"], set_=shifted)
+        )
+
+    async def increment_unread_counts(self, db: Session, user_ids: List[str]) -> None:
+        """
+        Count one new unread notification (written, not yet committed) for each
+        of `user_ids`, seeding the counters that don't exist yet.
+        """
+        counter = NotificationUnreadCount.__table__
+        now = datetime.utcnow()
+        unread = (
+            select(Notification.user_id, func.count(), literal(now))
+            .where(Notification.user_id.in_(user_ids), Notification.is_read == False)
+            .group_by(Notification.user_id)
+        )
+        await db.execute(
+            upsert(db, counter)
+            .from_select(["user_id", "unread_count", "updated_at"], unread)
+            .on_conflict_do_update(
+                index_elements=["user_id"], set_={"unread_count": counter.c.unread_count + 1, "updated_at": now}
+            )
+        )
+
+    async def get_unread_count(self, db: Session, user_id: str) -> int:
+        stmt = select(NotificationUnreadCount.unread_count).where(NotificationUnreadCount.user_id == user_id)
+        count = (await db.execute(stmt)).scalar()
+        if count is not None:
+            return count
+
+        # Not counted yet: seed the counter (unless a writer got there first) and read it back
+        await db.execute(self._seed_unread_count(db, user_id).on_conflict_do_nothing(index_elements=["user_id"]))
+        await db.commit()
+        return (await db.execute(stmt)).scalar() or 0
+
+    async def reconcile_unread_counts(self, db: Session) -> int:
+        """Recount every stored unread counter and fix drifted ones; returns the number corrected."""
+        counter = NotificationUnreadCount.__table__
+        actual = (
+            select(func.count()).select_from(Notification)
+            .where(Notification.user_id == counter.c.user_id, Notification.is_read == False)
+            .scalar_subquery()
+        )
+        result = await db.execute(
+            update(counter).where(counter.c.unread_count != actual).values(unread_count=actual, updated_at=datetime.utcnow())
+        )
+        await db.commit()
+        return result.rowcount
+
+    async def mark_as_read(self, db: Session, notification_id: str) -> Optional[Notification]:
+        """Mark one notification read, decrementing the counter only if it was unread."""
+        db_obj = await self.get(db, id=notification_id)
+        if not db_obj:
+            return None
+        result = await db.execute(
+            update(Notification)
+            .where(Notification.id == notification_id, Notification.is_read == False)
+            .values(is_read=True)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            await self.adjust_unread_count(db, db_obj.user_id, -result.rowcount)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
     async def mark_all_as_read(self, db: Session, user_id: str) -> int:
         stmt = update(Notification).where(
             Notification.user_id == user_id, 
             Notification.is_read == False
         ).values(is_read=True)
         result = await db.execute(stmt)
+        await self.adjust_unread_count(db, user_id, -result.rowcount)
         await db.commit()
         return result.rowcount
 
@@ -12,8 +12,9 @@ class CRUDTestingCycle(CRUDBase[TestingCycle, TestingCycleCreate, TestingCycleUp
         return result.scalars().all()
 
 class CRUDTestExecution(CRUDBase[TestExecution, TestExecutionCreate, TestExecutionUpdate]):
-    async def get_by_cycle(self, db: Session, cycle_id: str) -> List[TestExecution]:
+    async def get_by_cycle(self, db: Session, cycle_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[TestExecution]:
         stmt = select(TestExecution).where(TestExecution.cycle_id == cycle_id)
+        stmt = self.paginate(stmt, skip=skip, limit=limit, cursor=cursor, keyset_order=True)
         result = await db.execute(stmt)
         return result.scalars().all()
 
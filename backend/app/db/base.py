@@ -7,6 +7,7 @@ from app.models.team_update import TeamUpdate
 from app.models.event import Event
 from app.models.voting_status import VotingStatus
 from app.models.release import ReleaseWorkItem
+from app.models.vote import EventVote, EventVoteTally, EventVoteTallyDelta
 
 # V2 Models
 from app.models.v2.endorsement import Endorsement
@@ -14,6 +15,12 @@ from app.models.v2.release import Release
 from app.models.v2.work_item import WorkItem
 from app.models.v2.testing import TestingCycle, TestExecution
 from app.models.v2.task import Task
-from app.models.v2.notification import Notification, NotificationPreference
+from app.models.v2.notification import Notification, NotificationPreference, NotificationUnreadCount, NotificationArchive
 from app.models.v2.profile import Profile
 from app.models.v2.event_participant import EventParticipant
+from app.models.v2.search_document import SearchDocument
+from app.models.v2.impact_score import UserImpactScore
+from app.models.v2.job import Job
+from app.models.v2.velocity import WorkItemVelocityDaily
+from app.models.v2.table_version import TableVersion
+import app.models.v2.release_metrics  # noqa: F401 (mapper hooks)
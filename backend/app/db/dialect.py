@@ -0,0 +1,44 @@
+from typing import Any
+from sqlalchemy import Date, cast, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def dialect_name(bind: Any) -> str:
+    """Dialect name ("postgresql", "sqlite", ...) for a session, connection or engine."""
+    if isinstance(bind, AsyncSession):
+        return bind.get_bind().dialect.name
+    return bind.dialect.name
+
+
+def is_postgres(bind: Any) -> bool:
+    return dialect_name(bind) == "postgresql"
+
+
+def upsert(bind: Any, table: Any):
+    """
+    INSERT for `table` that supports `.on_conflict_do_update()` / `.on_conflict_do_nothing()`.
+
+    Production runs on Postgres; SQLite is accepted so local/test databases work too.
+    """
+    if dialect_name(bind) == "sqlite":
+        return sqlite.insert(table)
+    return postgresql.insert(table)
+
+
+# SQLite date() modifiers that land on the start of each unit (weeks start on Monday)
+_SQLITE_TRUNC = {
+    "day": (),
+    "week": ("weekday 0", "-6 days"),
+    "month": ("start of month",),
+    "year": ("start of year",),
+}
+
+
+def date_trunc(bind: Any, unit: str, column: Any):
+    """`date_trunc(unit, column)` as a DATE, for GROUP BY on Postgres and SQLite alike."""
+    if unit not in _SQLITE_TRUNC:
+        raise ValueError(f"Unsupported date_trunc unit: {unit}")
+    if dialect_name(bind) == "sqlite":
+        return func.date(column, *_SQLITE_TRUNC[unit], type_=Date)
+    return cast(func.date_trunc(unit, column), Date)
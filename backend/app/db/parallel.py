@@ -0,0 +1,39 @@
+import asyncio
+from typing import Any, Awaitable, Callable, List
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db import session as db_session
+
+ReadQuery = Callable[[AsyncSession], Awaitable[Any]]
+
+# Process-wide cap on extra sessions opened by fan-outs, so concurrent requests
+# can't drain the connection pool between them.
+_fan_out_slots = asyncio.Semaphore(settings.PARALLEL_QUERY_CONCURRENCY)
+
+async def _run_on_own_session(query: ReadQuery) -> Any:
+    async with _fan_out_slots:
+        async with db_session.AsyncSessionLocal() as session:
+            return await query(session)
+
+async def gather_reads(db: AsyncSession, *queries: ReadQuery) -> List[Any]:
+    """
+    Run independent read-only queries concurrently and return their results in order.
+
+    An AsyncSession can't run statements concurrently, so the first query runs
+    on the caller's `db` and every other one on its own short-lived session.
+    Queries should return plain values (scalars, rows, eagerly loaded objects)
+    since those extra sessions are closed once the query returns.
+
+    If one query fails, the others are cancelled and awaited before its error
+    is raised, so nothing is still running on `db` when the caller cleans up.
+    """
+    if not queries:
+        return []
+    first, *rest = queries
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(first(db))]
+            tasks += [group.create_task(_run_on_own_session(q)) for q in rest]
+    except ExceptionGroup as errors:
+        raise errors.exceptions[0]
+    return [task.result() for task in tasks]
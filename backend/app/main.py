@@ -1,13 +1,60 @@
 
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.core.config import settings
 from app.api.v1.api import api_router as api_router_v1
 from app.api.v2.api import api_router as api_router_v2
+from app.crud.pagination import InvalidCursorError, NEXT_CURSOR_HEADER
+from app.core.broker import broker
+from app.core.compression import CompressionMiddleware
+from app.core.etag import ETagMiddleware
+from app.core.jobs import job_queue
+from app.services import vote_tally_service
+from app.services import release_metrics_service  # noqa: F401 (registers its job handler)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await broker.start()
+    # Background loops, cancelled (and given a chance to flush) on shutdown
+    tasks = [
+        asyncio.create_task(vote_tally_service.run_flusher()),
+    ]
+    if settings.JOB_WORKER_IN_PROCESS:
+        tasks.append(asyncio.create_task(job_queue.run_worker()))
+    yield
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await broker.stop()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
+)
+
+# Conditional GETs: path -> tables the response is built from (see app/core/etag.py)
+app.add_middleware(
+    ETagMiddleware,
+    routes={
+        f"{settings.API_V1_STR}/teams/": ("team", "art", "user"),
+        f"{settings.API_V1_STR}/teams/arts/": ("art", "team", "user"),
+        f"{settings.API_V1_STR}/collab/awards": ("awardcategory",),
+        f"{settings.API_V2_STR}/releases/": ("releases_v2",),
+        f"{settings.API_V2_STR}/events/{{event_id}}": ("event", "event_participants", "endorsements", "user"),
+    },
+)
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    thread_size=settings.COMPRESSION_THREAD_SIZE,
+    level=settings.COMPRESSION_LEVEL,
+    # Server-sent events must reach the client as they are written
+    exclude_paths=[f"{settings.API_V2_STR}/notifications/stream"],
 )
 
 # Set all CORS enabled origins
@@ -18,8 +65,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(status_code=400, content={"detail": str(exc)})
+
 app.include_router(api_router_v1, prefix=settings.API_V1_STR)
 if settings.ENABLE_V2_API:
     app.include_router(api_router_v2, prefix=settings.API_V2_STR)
@@ -6,4 +6,4 @@ from .social import Comment, Like
 from .event import Event
 from .v2.event_participant import EventParticipant
 from .v2.endorsement import Endorsement
-from .vote import EventVote
+from .vote import EventVote, EventVoteTally, EventVoteTallyDelta
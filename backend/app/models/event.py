@@ -1,10 +1,14 @@
 
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, String, Boolean
+from sqlalchemy import DateTime, ForeignKey, String, Boolean, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 
 class Event(Base):
+    __table_args__ = (
+        Index("ix_event_date_time_id", "date_time", "id"),
+    )
+
     id: Mapped[str] = mapped_column(primary_key=True, index=True)
     name: Mapped[str]
     date_time: Mapped[datetime] = mapped_column(DateTime)
@@ -25,6 +29,10 @@ class Event(Base):
     voting_required: Mapped[bool] = mapped_column(Boolean, default=False)
     award_categories: Mapped[str | None] = mapped_column(String, nullable=True) # JSON string or comma-separated
 
+    # Social counters, kept in step with Like/Comment rows by the toggle/comment endpoints
+    like_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
     # Relationships
     organizer: Mapped["User"] = relationship("User", foreign_keys=[organizer_id])
     participants: Mapped[list["EventParticipant"]] = relationship("EventParticipant", back_populates="event", cascade="all, delete-orphan") # Linked in V2 model
@@ -2,12 +2,17 @@
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import ForeignKey, DateTime, String, Integer
+from sqlalchemy import ForeignKey, DateTime, String, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 import uuid
 
 class Feedback(Base):
+    __table_args__ = (
+        Index("ix_feedback_to_user_id_date_id", "to_user_id", "date", "id"),
+        Index("ix_feedback_from_user_id_date_id", "from_user_id", "date", "id"),
+    )
+
     id: Mapped[str] = mapped_column(primary_key=True, index=True)
     from_user_id: Mapped[str] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), index=True)
     to_user_id: Mapped[str] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), index=True)
@@ -1,16 +1,24 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import ForeignKey, DateTime, String, JSON
+from sqlalchemy import ForeignKey, DateTime, String, JSON, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 from typing import Optional, List
 
 class Post(Base):
+    __table_args__ = (
+        Index("ix_post_created_at_id", "created_at", "id"),
+    )
+
     id: Mapped[str] = mapped_column(primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     content: Mapped[str] = mapped_column(String, index=True)
     author_id: Mapped[str] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     images: Mapped[Optional[List[str]]] = mapped_column(JSON, default=list)
+
+    # Social counters, kept in step with Like/Comment rows by the toggle/comment endpoints
+    like_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     
     # Relationships
     author: Mapped["User"] = relationship("User", backref="posts")
@@ -7,5 +7,11 @@ from .release import Release
 from .work_item import WorkItem
 from .testing import TestingCycle, TestExecution
 from .task import Task
-from .notification import Notification, NotificationPreference
+from .notification import Notification, NotificationPreference, NotificationUnreadCount, NotificationArchive
 from .profile import Profile
+from .search_document import SearchDocument
+from .impact_score import UserImpactScore
+from .job import Job
+from . import release_metrics  # noqa: F401 (mapper hooks)
+from .velocity import WorkItemVelocityDaily
+from .table_version import TableVersion
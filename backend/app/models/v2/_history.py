@@ -0,0 +1,18 @@
+from sqlalchemy import inspect
+
+
+def previous_value(target, attr: str):
+    """
+    Value of `attr` as of the last load/flush, for mapper hooks that undo an old contribution.
+
+    Only reliable for columns mapped with active_history=True: otherwise an
+    unloaded or expired value is never fetched before being overwritten, the
+    history has no deleted entry and the new value is returned instead.
+    """
+    history = inspect(target).attrs[attr].history
+    return history.deleted[0] if history.deleted else getattr(target, attr)
+
+
+def status_is_done(status) -> bool:
+    """Whether a work item / task status (enum member or raw string) is DONE."""
+    return getattr(status, "value", status) == "DONE"
@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey, DateTime, Text
+from sqlalchemy import String, ForeignKey, DateTime, Text, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from app.db.base_class import Base
@@ -6,12 +6,15 @@ import uuid
 
 class Endorsement(Base):
     __tablename__ = "endorsements"
+    __table_args__ = (
+        Index("ix_endorsements_created_at_id", "created_at", "id"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     
     # Who linked
     giver_id: Mapped[str] = mapped_column(ForeignKey("user.id"), index=True)
-    receiver_id: Mapped[str] = mapped_column(ForeignKey("user.id"), index=True)
+    receiver_id: Mapped[str] = mapped_column(ForeignKey("user.id"), index=True, active_history=True) # active_history: impact score hooks read the old value
     
     # Context
     category: Mapped[str] = mapped_column(String, nullable=False)
@@ -19,6 +22,10 @@ class Endorsement(Base):
     project_id: Mapped[str] = mapped_column(String, nullable=True) # Mocked FK for now
     event_id: Mapped[str] = mapped_column(ForeignKey("event.id", ondelete="CASCADE"), index=True, nullable=True)
     skills: Mapped[str] = mapped_column(String, nullable=True) # JSON string or comma-separated
+
+    # Social counters, kept in step with Like/Comment rows by the toggle/comment endpoints
+    like_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    comment_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     
     # Metadata
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,97 @@
+from sqlalchemy import ForeignKey, DateTime, Integer, event
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from app.db.base_class import Base
+from app.db.dialect import upsert
+from app.models.v2.endorsement import Endorsement
+from app.models.v2.work_item import WorkItem
+from app.models.v2.task import Task
+from app.models.v2._history import previous_value, status_is_done
+
+# Points per contribution
+ENDORSEMENT_POINTS = 10
+WORK_ITEM_POINTS = 5
+TASK_POINTS = 2
+
+class UserImpactScore(Base):
+    """
+    Materialized impact score per user.
+
+    Kept current by the mapper hooks below; rebuild with
+    `impact_service.recompute_all` (scripts/recompute_impact_scores.py).
+    """
+    __tablename__ = "user_impact_scores"
+
+    user_id: Mapped[str] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+
+    endorsements_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    work_items_done: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    tasks_done: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    impact_score: Mapped[int] = mapped_column(Integer, default=0, server_default="0", index=True)
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+def apply_impact_delta(connection, user_id: str, endorsements: int = 0, work_items: int = 0, tasks: int = 0) -> None:
+    """Shift one user's counters and score in place (creating the row if needed)."""
+    if not user_id or not (endorsements or work_items or tasks):
+        return
+    table = UserImpactScore.__table__
+    stmt = upsert(connection, table).values(
+        user_id=user_id,
+        endorsements_count=endorsements,
+        work_items_done=work_items,
+        tasks_done=tasks,
+        impact_score=endorsements * ENDORSEMENT_POINTS + work_items * WORK_ITEM_POINTS + tasks * TASK_POINTS,
+        updated_at=datetime.utcnow(),
+    )
+    counters = ("endorsements_count", "work_items_done", "tasks_done", "impact_score")
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id"],
+        set_={**{c: table.c[c] + stmt.excluded[c] for c in counters}, "updated_at": stmt.excluded.updated_at},
+    )
+    connection.execute(stmt)
+
+
+# Endorsements: +1 for the receiver
+@event.listens_for(Endorsement, "after_insert")
+def _endorsement_created(mapper, connection, target):
+    apply_impact_delta(connection, target.receiver_id, endorsements=1)
+
+@event.listens_for(Endorsement, "after_delete")
+def _endorsement_deleted(mapper, connection, target):
+    apply_impact_delta(connection, previous_value(target, "receiver_id"), endorsements=-1)
+
+@event.listens_for(Endorsement, "after_update")
+def _endorsement_updated(mapper, connection, target):
+    previous = previous_value(target, "receiver_id")
+    if previous != target.receiver_id:
+        apply_impact_delta(connection, previous, endorsements=-1)
+        apply_impact_delta(connection, target.receiver_id, endorsements=1)
+
+
+# Work items and tasks: +1 for the assignee while the status is DONE
+def _track_done(model, user_attr: str, counter: str):
+    @event.listens_for(model, "after_insert")
+    def created(mapper, connection, target):
+        if status_is_done(target.status):
+            apply_impact_delta(connection, getattr(target, user_attr), **{counter: 1})
+
+    @event.listens_for(model, "after_delete")
+    def deleted(mapper, connection, target):
+        if status_is_done(previous_value(target, "status")):
+            apply_impact_delta(connection, previous_value(target, user_attr), **{counter: -1})
+
+    @event.listens_for(model, "after_update")
+    def updated(mapper, connection, target):
+        was_done, is_done = status_is_done(previous_value(target, "status")), status_is_done(target.status)
+        previous_user, user = previous_value(target, user_attr), getattr(target, user_attr)
+        if (was_done, previous_user) == (is_done, user):
+            return
+        if was_done:
+            apply_impact_delta(connection, previous_user, **{counter: -1})
+        if is_done:
+            apply_impact_delta(connection, user, **{counter: 1})
+
+_track_done(WorkItem, "assignee_id", "work_items")
+_track_done(Task, "assigned_to_id", "tasks")
@@ -0,0 +1,43 @@
+from sqlalchemy import String, DateTime, Integer, JSON, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from typing import Optional
+from app.db.base_class import Base
+import uuid
+import enum
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    FAILED = "FAILED"  # Out of attempts; kept for inspection
+
+class Job(Base):
+    """
+    Durable background job (see app/core/jobs.py).
+
+    Enqueued in the same transaction as the write that needs it and deleted
+    once it succeeds, so the table only holds pending, running and failed work.
+    """
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+        # Keyed jobs (e.g. "recompute cycle X") are queued at most once
+        Index(
+            "uq_jobs_name_key_queued", "name", "key", unique=True,
+            postgresql_where=text("status = 'QUEUED'"), sqlite_where=text("status = 'QUEUED'"),
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    name: Mapped[str] = mapped_column(String)
+    key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    payload: Mapped[dict] = mapped_column(JSON, default=dict)
+
+    status: Mapped[JobStatus] = mapped_column(String, default=JobStatus.QUEUED)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    max_attempts: Mapped[int] = mapped_column(Integer, default=5, server_default="5")
+    last_error: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    run_after: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    locked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -1,6 +1,7 @@
-from sqlalchemy import String, ForeignKey, DateTime, Boolean, Enum
+from sqlalchemy import String, ForeignKey, DateTime, Boolean, Enum, Index, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
+from typing import Optional
 from app.db.base_class import Base
 import uuid
 import enum
@@ -12,6 +13,8 @@ class NotificationType(str, enum.Enum):
     SUCCESS = "SUCCESS"
     MENTION = "MENTION"
     ASSIGNMENT = "ASSIGNMENT"
+    LIKE = "LIKE"
+    COMMENT = "COMMENT"
 
 class NotificationChannel(str, enum.Enum):
     IN_APP = "IN_APP"
@@ -19,6 +22,24 @@ class NotificationChannel(str, enum.Enum):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Fallback source for unread counts
+        Index(
+            "ix_notifications_user_id_unread", "user_id",
+            postgresql_where=text("is_read = false"), sqlite_where=text("is_read = 0"),
+        ),
+        # Archival candidates (notification_service.archive_read_notifications)
+        Index(
+            "ix_notifications_created_at_read", "created_at",
+            postgresql_where=text("is_read = true"), sqlite_where=text("is_read = 1"),
+        ),
+        # At most one open (unread) row per coalescing key; the upsert target in notify_coalesced
+        Index(
+            "uq_notifications_user_id_coalesce_key_unread", "user_id", "coalesce_key", unique=True,
+            postgresql_where=text("is_read = false"), sqlite_where=text("is_read = 0"),
+        ),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     user_id: Mapped[str] = mapped_column(ForeignKey("user.id"), index=True)
@@ -30,11 +51,62 @@ class Notification(Base):
     related_entity_type: Mapped[str] = mapped_column(String, nullable=True) # e.g. "task", "release"
     related_entity_id: Mapped[str] = mapped_column(String, nullable=True)
     
+    # Coalesced activity ("Ana and 41 others liked your post"); NULL key = standalone notification
+    coalesce_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    actor_count: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
+    latest_actor_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    latest_actor_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     
     # recipient: Mapped["User"] = relationship("User")
 
+class NotificationArchive(Base):
+    """
+    Read notifications past the retention age, moved out of the hot table.
+
+    Same columns as `notifications`; filled by
+    `notification_service.archive_read_notifications` (scripts/archive_notifications.py).
+    """
+    __tablename__ = "notifications_archive"
+    __table_args__ = (
+        Index("ix_notifications_archive_user_id_created_at", "user_id", "created_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    user_id: Mapped[str] = mapped_column(String)
+
+    title: Mapped[str] = mapped_column(String)
+    message: Mapped[str] = mapped_column(String)
+    type: Mapped[NotificationType] = mapped_column(String)
+
+    related_entity_type: Mapped[str] = mapped_column(String, nullable=True)
+    related_entity_id: Mapped[str] = mapped_column(String, nullable=True)
+
+    coalesce_key: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    actor_count: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
+    latest_actor_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    latest_actor_name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+
+    is_read: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime)
+    archived_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+class NotificationUnreadCount(Base):
+    """
+    Unread notifications per user, for the notification bell.
+
+    Adjusted in the same transaction as the notification writes. A missing row
+    means "not counted yet"; the first reader or writer to need it seeds it
+    from the partial unread index. scripts/reconcile_unread_counts.py repairs drift.
+    """
+    __tablename__ = "notification_unread_counts"
+
+    user_id: Mapped[str] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    unread_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
 class NotificationPreference(Base):
     __tablename__ = "notification_preferences"
     
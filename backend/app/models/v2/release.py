@@ -1,4 +1,4 @@
-from sqlalchemy import String, ForeignKey, DateTime, Enum, Boolean, Integer
+from sqlalchemy import String, ForeignKey, DateTime, Enum, Boolean, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from app.db.base_class import Base
@@ -15,6 +15,9 @@ class ReleaseStatus(str, enum.Enum):
 
 class Release(Base):
     __tablename__ = "releases_v2"
+    __table_args__ = (
+        Index("ix_releases_v2_created_at_id", "created_at", "id"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     version: Mapped[str] = mapped_column(String, unique=True, index=True)
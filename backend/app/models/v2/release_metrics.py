@@ -0,0 +1,49 @@
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+from app.models.v2.work_item import WorkItem
+from app.models.v2._history import previous_value
+
+# Release metrics (completion_percentage, health_score) are refreshed by the
+# "releases.update_metrics" job (release_metrics_service). Writes to their
+# inputs mark the release stale on the session - work items by the hooks
+# below, test executions by the cycle counter hooks in testing.py - and each
+# flush then queues one job per stale release, keyed per release.
+
+WORK_ITEM_INPUTS = ("status", "story_points", "type", "release_id")
+
+def mark_metrics_stale(session, release_id) -> None:
+    """Have the next flush end of `session` queue a metrics refresh for `release_id`."""
+    if session is not None and release_id:
+        session.info.setdefault("stale_release_metrics", set()).add(release_id)
+
+def _changed(target, attrs) -> bool:
+    state = inspect(target)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+@event.listens_for(WorkItem, "after_insert")
+def _work_item_created(mapper, connection, target):
+    mark_metrics_stale(object_session(target), target.release_id)
+
+@event.listens_for(WorkItem, "after_delete")
+def _work_item_deleted(mapper, connection, target):
+    mark_metrics_stale(object_session(target), previous_value(target, "release_id"))
+
+@event.listens_for(WorkItem, "after_update")
+def _work_item_updated(mapper, connection, target):
+    if not _changed(target, WORK_ITEM_INPUTS):
+        return
+    for release_id in {previous_value(target, "release_id"), target.release_id}:
+        mark_metrics_stale(object_session(target), release_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _queue_refreshes(session, flush_context):
+    release_ids = session.info.pop("stale_release_metrics", None)
+    if not release_ids:
+        return
+    from app.core.jobs import job_queue  # imported late: app.core.jobs itself imports the models package
+
+    # Sorted, so concurrent flushes lock the queued jobs in the same order
+    for release_id in sorted(release_ids):
+        job_queue.enqueue_in_flush(session, "releases.update_metrics", key=release_id, release_id=release_id)
@@ -0,0 +1,107 @@
+from sqlalchemy import String, DateTime, Index, event, delete
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from app.db.base_class import Base
+from app.db.dialect import upsert
+from app.models.user import User
+from app.models.event import Event
+from app.models.v2.release import Release
+from app.models.v2.work_item import WorkItem
+from app.models.v2.task import Task
+
+class SearchDocument(Base):
+    """
+    One row per searchable entity, feeding the global search box.
+
+    On Postgres the table also has a generated `search_vector` tsvector column
+    (GIN indexed) and a trigram index on `title`; both are created by migration
+    only, since SQLite has neither.
+    """
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        Index("ix_search_documents_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
+
+    entity_type: Mapped[str] = mapped_column(String, primary_key=True)  # SearchResultType value
+    entity_id: Mapped[str] = mapped_column(String, primary_key=True)
+
+    title: Mapped[str] = mapped_column(String)
+    subtitle: Mapped[str] = mapped_column(String, nullable=True)
+    url: Mapped[str] = mapped_column(String)
+    body: Mapped[str] = mapped_column(String, nullable=True)  # Extra text matched but not displayed
+
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+def _text(value) -> str:
+    # Enum-typed columns hold the enum member until reloaded from the database
+    value = getattr(value, "value", value)
+    return "" if value is None else str(value)
+
+def _join(*parts) -> str:
+    return " ".join(_text(p) for p in parts if p)
+
+# Model -> (entity type, document builder). Keep in step with the backfill in the
+# add_search_documents migration.
+SEARCH_SOURCES = {
+    Release: ("RELEASE", lambda r: dict(
+        title=f"Release {r.version}",
+        subtitle=r.name,
+        url=f"/releases/{r.id}",
+        body=_join(r.version, r.name),
+    )),
+    WorkItem: ("WORK_ITEM", lambda w: dict(
+        title=w.title,
+        subtitle=f"{_text(w.type)} - {_text(w.status)}",
+        url=f"/releases/{w.release_id}?item={w.id}",
+        body=_join(w.title, w.description),
+    )),
+    Task: ("TASK", lambda t: dict(
+        title=t.title,
+        subtitle=f"{_text(t.priority)} - {_text(t.status)}",
+        url="/tasks",
+        body=_join(t.title, t.description),
+    )),
+    Event: ("EVENT", lambda e: dict(
+        title=e.name,
+        subtitle=str(e.date_time),
+        url=f"/events/{e.id}",
+        body=_join(e.name, e.event_type, e.agenda),
+    )),
+    User: ("USER", lambda u: dict(
+        title=u.name,
+        subtitle=u.role or "Team Member",
+        url=f"/profile/{u.id}",
+        body=_join(u.name, u.role),
+    )),
+}
+
+def search_document_values(target) -> dict:
+    entity_type, build = SEARCH_SOURCES[type(target)]
+    return dict(entity_type=entity_type, entity_id=target.id, updated_at=datetime.utcnow(), **build(target))
+
+
+# Keep documents in step with ORM writes, inside the same transaction.
+# Bulk UPDATE/DELETE statements and database-level cascades bypass these hooks;
+# scripts/rebuild_search_index.py repairs any drift.
+def _sync_document(mapper, connection, target):
+    values = search_document_values(target)
+    stmt = upsert(connection, SearchDocument.__table__).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["entity_type", "entity_id"],
+        set_={key: stmt.excluded[key] for key in ("title", "subtitle", "url", "body", "updated_at")},
+    )
+    connection.execute(stmt)
+
+def _drop_document(mapper, connection, target):
+    entity_type, _ = SEARCH_SOURCES[type(target)]
+    connection.execute(
+        delete(SearchDocument.__table__).where(
+            SearchDocument.entity_type == entity_type, SearchDocument.entity_id == target.id
+        )
+    )
+
+for _model in SEARCH_SOURCES:
+    event.listen(_model, "after_insert", _sync_document)
+    event.listen(_model, "after_update", _sync_document)
+    event.listen(_model, "after_delete", _drop_document)
@@ -0,0 +1,86 @@
+from sqlalchemy import String, BigInteger, event, inspect, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+from typing import Dict, Iterable, Set
+from app.db.base_class import Base
+from app.db.dialect import upsert
+
+# Tables whose contents back conditional (ETag) responses, see app/core/etag.py
+VERSIONED_TABLES = frozenset({
+    "user", "team", "art", "awardcategory", "event", "event_participants", "endorsements", "releases_v2",
+})
+
+# Denormalized social counters; no ETag'd response shows them, so changing them alone bumps nothing.
+# Core UPDATEs of them opt out with .execution_options(table_version=False).
+COUNTER_COLUMNS = frozenset({"like_count", "comment_count"})
+
+class TableVersion(Base):
+    """
+    Change counter per table, bumped by every transaction that wrote to it.
+
+    The bump is the last statement before COMMIT, so it commits (or rolls back)
+    with the data it versions, and writers only hold these rows for the commit
+    itself rather than for their whole transaction.
+    """
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, default=0, server_default="0")
+
+
+def _touched(session) -> Set[str]:
+    return session.info.setdefault("touched_versioned_tables", set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    touched = _touched(session)
+    for obj in (*session.new, *session.deleted):
+        touched.add(obj.__table__.name)
+    for obj in session.dirty:
+        state = inspect(obj)
+        changed = {attr.key for attr in state.attrs if attr.history.has_changes()}
+        if changed - COUNTER_COLUMNS:
+            touched.add(obj.__table__.name)
+    touched.intersection_update(VERSIONED_TABLES)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_statement(orm_execute_state):
+    # Core-style INSERT/UPDATE/DELETE run through session.execute()
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if not orm_execute_state.execution_options.get("table_version", True):
+        return
+    table_name = getattr(orm_execute_state.statement.table, "name", None)
+    if table_name in VERSIONED_TABLES:
+        _touched(orm_execute_state.session).add(table_name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget(session):
+    session.info.pop("touched_versioned_tables", None)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_before_commit(session):
+    # Flush first so writes still pending at commit are tracked too
+    session.flush()
+    tables = session.info.pop("touched_versioned_tables", None)
+    if not tables:
+        return
+    connection = session.connection()
+    table = TableVersion.__table__
+    for table_name in sorted(tables):  # sorted, so concurrent bumps never deadlock
+        stmt = upsert(connection, table).values(table_name=table_name, version=1)
+        stmt = stmt.on_conflict_do_update(index_elements=["table_name"], set_={"version": table.c.version + 1})
+        connection.execute(stmt)
+
+
+async def get_versions(db, tables: Iterable[str]) -> Dict[str, int]:
+    """Current version of each table (0 for tables never written since tracking began)."""
+    tables = list(tables)
+    result = await db.execute(
+        select(TableVersion.table_name, TableVersion.version).where(TableVersion.table_name.in_(tables))
+    )
+    versions = dict(result.all())
+    return {name: versions.get(name, 0) for name in tables}
@@ -22,12 +22,12 @@ class Task(Base):
     title: Mapped[str] = mapped_column(String)
     description: Mapped[str] = mapped_column(String, nullable=True)
     
-    status: Mapped[TaskStatus] = mapped_column(String, default=TaskStatus.TODO)
+    status: Mapped[TaskStatus] = mapped_column(String, default=TaskStatus.TODO, active_history=True) # active_history: impact score hooks read the old value
     priority: Mapped[TaskPriority] = mapped_column(String, default=TaskPriority.MEDIUM)
     due_date: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     
     # Ownership
-    assigned_to_id: Mapped[str] = mapped_column(ForeignKey("user.id"), nullable=True)
+    assigned_to_id: Mapped[str] = mapped_column(ForeignKey("user.id"), nullable=True, active_history=True)
     created_by_id: Mapped[str] = mapped_column(ForeignKey("user.id"), nullable=True)
     
     # Linking
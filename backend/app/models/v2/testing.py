@@ -1,9 +1,12 @@
-from sqlalchemy import String, ForeignKey, DateTime, Integer, Enum
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, ForeignKey, DateTime, Integer, Enum, Index, case, event
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
 from datetime import datetime
 from app.db.base_class import Base
+from app.models.v2.release_metrics import mark_metrics_stale
+from app.models.v2._history import previous_value
 import uuid
 import enum
+from typing import Optional
 
 class TestCycleStatus(str, enum.Enum):
     PLANNED = "PLANNED"
@@ -29,8 +32,13 @@ class TestingCycle(Base):
     start_date: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     end_date: Mapped[datetime] = mapped_column(DateTime, nullable=True)
     
-    # Metrics
-    pass_rate: Mapped[float] = mapped_column(Integer, default=0) # Percentage
+    # Metrics, maintained by the TestExecution hooks below
+    pass_rate: Mapped[float] = mapped_column(Integer, default=0) # Percentage of PASS/FAIL/BLOCKED that passed
+    pass_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    fail_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    blocked_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    skipped_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    pending_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     
@@ -40,12 +48,15 @@ class TestingCycle(Base):
 
 class TestExecution(Base):
     __tablename__ = "test_executions"
+    __table_args__ = (
+        Index("ix_test_executions_cycle_id_created_at_id", "cycle_id", "created_at", "id"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
-    cycle_id: Mapped[str] = mapped_column(ForeignKey("testing_cycles.id"), index=True)
+    cycle_id: Mapped[str] = mapped_column(ForeignKey("testing_cycles.id"), index=True, active_history=True) # active_history: cycle counter hooks read the old value
     
     title: Mapped[str] = mapped_column(String)
-    status: Mapped[TestExecutionStatus] = mapped_column(String, default=TestExecutionStatus.PENDING)
+    status: Mapped[TestExecutionStatus] = mapped_column(String, default=TestExecutionStatus.PENDING, active_history=True)
     
     executed_by_id: Mapped[str] = mapped_column(ForeignKey("user.id"), nullable=True)
     executed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True)
@@ -58,3 +69,69 @@ class TestExecution(Base):
     # Relationships
     cycle: Mapped["TestingCycle"] = relationship("TestingCycle") # back_populates="executions"
     executed_by: Mapped["User"] = relationship("User")
+
+
+# Execution status -> TestingCycle counter column
+STATUS_COUNTERS = {
+    TestExecutionStatus.PASS: "pass_count",
+    TestExecutionStatus.FAIL: "fail_count",
+    TestExecutionStatus.BLOCKED: "blocked_count",
+    TestExecutionStatus.SKIPPED: "skipped_count",
+    TestExecutionStatus.PENDING: "pending_count",
+}
+
+def pass_rate_expression(passed, failed, blocked):
+    """Rounded percentage of executed (PASS/FAIL/BLOCKED) tests that passed, in integer SQL."""
+    executed = passed + failed + blocked
+    return case((executed > 0, (passed * 200 + executed) // (executed * 2)), else_=0)
+
+def apply_cycle_delta(connection, cycle_id: str, deltas: dict) -> Optional[str]:
+    """
+    Shift a cycle's status counters by {status: delta} and re-derive its pass
+    rate. Returns the cycle's release, whose metrics are now stale.
+    """
+    deltas = {STATUS_COUNTERS[TestExecutionStatus(s)]: d for s, d in deltas.items() if d}
+    if not cycle_id or not deltas:
+        return None
+    table = TestingCycle.__table__
+    # SET expressions see the old values, so derive the pass rate from old + delta
+    counts = {column: table.c[column] + deltas.get(column, 0) for column in STATUS_COUNTERS.values()}
+    return connection.execute(
+        table.update()
+        .where(table.c.id == cycle_id)
+        .values(
+            **counts,
+            pass_rate=pass_rate_expression(counts["pass_count"], counts["fail_count"], counts["blocked_count"]),
+        )
+        .returning(table.c.release_id)
+    ).scalar()
+
+def _status(value) -> str:
+    return getattr(value, "value", value) or TestExecutionStatus.PENDING.value
+
+
+@event.listens_for(TestExecution, "after_insert")
+def _execution_created(mapper, connection, target):
+    release_id = apply_cycle_delta(connection, target.cycle_id, {_status(target.status): 1})
+    mark_metrics_stale(object_session(target), release_id)
+
+@event.listens_for(TestExecution, "after_delete")
+def _execution_deleted(mapper, connection, target):
+    release_id = apply_cycle_delta(connection, previous_value(target, "cycle_id"), {_status(previous_value(target, "status")): -1})
+    mark_metrics_stale(object_session(target), release_id)
+
+@event.listens_for(TestExecution, "after_update")
+def _execution_updated(mapper, connection, target):
+    previous_cycle, cycle = previous_value(target, "cycle_id"), target.cycle_id
+    previous_status, status = _status(previous_value(target, "status")), _status(target.status)
+    if (previous_cycle, previous_status) == (cycle, status):
+        return
+    if previous_cycle == cycle:
+        release_ids = [apply_cycle_delta(connection, cycle, {previous_status: -1, status: 1})]
+    else:
+        release_ids = [
+            apply_cycle_delta(connection, previous_cycle, {previous_status: -1}),
+            apply_cycle_delta(connection, cycle, {status: 1}),
+        ]
+    for release_id in release_ids:
+        mark_metrics_stale(object_session(target), release_id)
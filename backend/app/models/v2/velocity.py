@@ -0,0 +1,86 @@
+from sqlalchemy import ForeignKey, Date, Integer, event, inspect
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import date, datetime
+from typing import Optional, Tuple
+from app.db.base_class import Base
+from app.db.dialect import upsert
+from app.models.v2.work_item import WorkItem
+from app.models.v2._history import previous_value, status_is_done
+
+class WorkItemVelocityDaily(Base):
+    """
+    Story points (and items) completed per team per day.
+
+    Kept current by the WorkItem hooks below; rebuild with
+    `analytics_service.rebuild_velocity_rollup` (scripts/rebuild_velocity_rollup.py).
+    Items without a team are not counted.
+    """
+    __tablename__ = "work_item_velocity_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    team_id: Mapped[str] = mapped_column(ForeignKey("team.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+    points: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    items: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
+
+def apply_velocity_delta(connection, day: date, team_id: str, points: int, items: int) -> None:
+    """Shift one (day, team) bucket in place (creating it if needed)."""
+    if not (points or items):
+        return
+    table = WorkItemVelocityDaily.__table__
+    stmt = upsert(connection, table).values(day=day, team_id=team_id, points=points, items=items)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["day", "team_id"],
+        set_={c: table.c[c] + stmt.excluded[c] for c in ("points", "items")},
+    )
+    connection.execute(stmt)
+
+
+def _contribution(status, completed_at, team_id, story_points) -> Optional[Tuple[date, str, int]]:
+    if not (status_is_done(status) and completed_at and team_id):
+        return None
+    return completed_at.date(), team_id, story_points or 0
+
+def _current(target):
+    return _contribution(target.status, target.completed_at, target.team_id, target.story_points)
+
+def _before(target):
+    return _contribution(*(previous_value(target, a) for a in ("status", "completed_at", "team_id", "story_points")))
+
+def _move(connection, old, new) -> None:
+    if old == new:
+        return
+    if old:
+        apply_velocity_delta(connection, old[0], old[1], -old[2], -1)
+    if new:
+        apply_velocity_delta(connection, new[0], new[1], new[2], 1)
+
+
+# completed_at follows the status: stamped on the way into DONE, cleared on the way out
+@event.listens_for(WorkItem, "before_insert")
+def _stamp_new(mapper, connection, target):
+    if status_is_done(target.status) and not target.completed_at:
+        target.completed_at = datetime.utcnow()
+
+@event.listens_for(WorkItem, "before_update")
+def _stamp_changed(mapper, connection, target):
+    if not inspect(target).attrs.status.history.has_changes():
+        return
+    if not status_is_done(target.status):
+        target.completed_at = None
+    elif not status_is_done(previous_value(target, "status")):
+        target.completed_at = datetime.utcnow()
+
+
+@event.listens_for(WorkItem, "after_insert")
+def _work_item_created(mapper, connection, target):
+    _move(connection, None, _current(target))
+
+@event.listens_for(WorkItem, "after_delete")
+def _work_item_deleted(mapper, connection, target):
+    _move(connection, _before(target), None)
+
+@event.listens_for(WorkItem, "after_update")
+def _work_item_updated(mapper, connection, target):
+    _move(connection, _before(target), _current(target))
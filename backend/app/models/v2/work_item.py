@@ -23,20 +23,21 @@ class WorkItem(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
     
     # Links
-    release_id: Mapped[str] = mapped_column(ForeignKey("releases_v2.id"), index=True, nullable=True)
-    assignee_id: Mapped[str] = mapped_column(ForeignKey("user.id"), index=True, nullable=True)
-    team_id: Mapped[str] = mapped_column(ForeignKey("team.id"), index=True, nullable=True)
+    release_id: Mapped[str] = mapped_column(ForeignKey("releases_v2.id"), index=True, nullable=True, active_history=True) # active_history: release metrics hooks read the old value
+    assignee_id: Mapped[str] = mapped_column(ForeignKey("user.id"), index=True, nullable=True, active_history=True) # active_history: impact score hooks read the old value
+    team_id: Mapped[str] = mapped_column(ForeignKey("team.id"), index=True, nullable=True, active_history=True) # active_history: velocity rollup hooks read the old value
     
     # Content
     title: Mapped[str] = mapped_column(String)
     description: Mapped[str] = mapped_column(String, nullable=True)
     type: Mapped[WorkItemType] = mapped_column(String, default=WorkItemType.FEATURE)
-    status: Mapped[WorkItemStatus] = mapped_column(String, default=WorkItemStatus.TODO)
+    status: Mapped[WorkItemStatus] = mapped_column(String, default=WorkItemStatus.TODO, active_history=True)
     priority: Mapped[str] = mapped_column(String, default="Medium") # Low, Medium, High, Critical
     
     # Metadata
-    story_points: Mapped[int] = mapped_column(Integer, nullable=True)
+    story_points: Mapped[int] = mapped_column(Integer, nullable=True, active_history=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    completed_at: Mapped[datetime] = mapped_column(DateTime, nullable=True, active_history=True) # Set when status becomes DONE (models/v2/velocity.py)
     
     # Relationships
     release: Mapped["Release"] = relationship("Release") # back_populates="work_items"
@@ -1,10 +1,14 @@
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, String, Boolean
+from sqlalchemy import DateTime, ForeignKey, String, Boolean, Integer, BigInteger, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base_class import Base
 
 class EventVote(Base):
     __tablename__ = "event_vote"
+    __table_args__ = (
+        # One vote per voter per award category
+        Index("uq_event_vote_event_voter_category", "event_id", "voter_id", "award_category", unique=True),
+    )
     
     id: Mapped[str] = mapped_column(primary_key=True, index=True)
     event_id: Mapped[str] = mapped_column(ForeignKey("event.id", ondelete="CASCADE"), index=True)
@@ -19,3 +23,38 @@ class EventVote(Base):
     event: Mapped["Event"] = relationship("Event", back_populates="votes")
     voter: Mapped["User"] = relationship("User", foreign_keys=[voter_id])
     nominee: Mapped["User"] = relationship("User", foreign_keys=[nominee_id])
+
+
+class EventVoteTally(Base):
+    """
+    Vote count per (event, award category, nominee).
+
+    Fed from `event_vote_tally_delta` by `vote_tally_service` and checked
+    against `event_vote` by its reconcile job.
+    """
+    __tablename__ = "event_vote_tally"
+
+    event_id: Mapped[str] = mapped_column(ForeignKey("event.id", ondelete="CASCADE"), primary_key=True)
+    award_category: Mapped[str] = mapped_column(String, primary_key=True)
+    nominee_id: Mapped[str] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+
+    vote_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class EventVoteTallyDelta(Base):
+    """
+    Pending change to one tally, written in the same transaction as the vote.
+
+    The flusher folds these into `event_vote_tally` and deletes them in one
+    transaction, so a committed vote's count is never lost, and readers add
+    the rows still pending on top of the stored tallies.
+    """
+    __tablename__ = "event_vote_tally_delta"
+
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    event_id: Mapped[str] = mapped_column(ForeignKey("event.id", ondelete="CASCADE"), index=True)
+    award_category: Mapped[str] = mapped_column(String)
+    nominee_id: Mapped[str] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), index=True)
+    delta: Mapped[int] = mapped_column(Integer)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -73,6 +73,12 @@ class EventResponse(EventBase):
     class Config:
         from_attributes = True
 
+class EventFeedResponse(EventResponse):
+    # Social stats
+    likes: int = 0
+    comments: int = 0
+    liked_by_user: bool = False
+
 class EventDetailResponse(EventResponse):
     participants: List[ParticipantResponse] = []
     # linked_releases: List[ReleaseSummary] = []
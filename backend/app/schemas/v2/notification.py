@@ -10,6 +10,8 @@ class NotificationType(str, Enum):
     SUCCESS = "SUCCESS"
     MENTION = "MENTION"
     ASSIGNMENT = "ASSIGNMENT"
+    LIKE = "LIKE"
+    COMMENT = "COMMENT"
 
 class NotificationChannel(str, Enum):
     IN_APP = "IN_APP"
@@ -25,11 +27,24 @@ class NotificationBase(BaseModel):
 class NotificationCreate(NotificationBase):
     user_id: str
 
+class NotificationAudience(BaseModel):
+    """Recipients; the union of everything given"""
+    user_ids: List[str] = []
+    team_id: Optional[str] = None
+    art_id: Optional[str] = None
+    event_id: Optional[str] = None  # Participants who haven't declined
+
+class NotificationBroadcast(NotificationBase):
+    audience: NotificationAudience
+
 class NotificationResponse(NotificationBase):
     id: str
     user_id: str
     is_read: bool
     created_at: datetime
+    actor_count: int = 1
+    latest_actor_id: Optional[str] = None
+    latest_actor_name: Optional[str] = None
     
     class Config:
         from_attributes = True
@@ -38,3 +38,14 @@ class UserProfileFullResponse(BaseModel):
     endorsements_count: int = 0
     work_items_count: int = 0
     tasks_count: int = 0
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    user_id: str
+    name: str
+    role: Optional[str] = None
+    team: Optional[str] = None
+    impact_score: int = 0
+    endorsements_count: int = 0
+    work_items_count: int = 0
+    tasks_count: int = 0
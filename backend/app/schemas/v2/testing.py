@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
 
@@ -66,3 +66,21 @@ class TestingCycleResponse(TestingCycleBase):
     
     class Config:
         from_attributes = True
+
+class TestingCycleSummary(BaseModel):
+    cycle_id: str
+    name: str
+    status: TestCycleStatus
+    total: int
+    counts: Dict[TestExecutionStatus, int]
+    pass_rate: float
+
+class TestExecutionImportError(BaseModel):
+    row: int  # Row in the upload: line for NDJSON, record for CSV (header is 1)
+    error: str
+
+class TestExecutionImportResult(BaseModel):
+    cycle_id: str
+    imported: int = 0
+    failed: int = 0
+    errors: List[TestExecutionImportError] = []  # Capped at TEST_IMPORT_MAX_ERRORS
@@ -1,32 +1,58 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, select
+from sqlalchemy import func, select, delete, insert, case, or_, Date
+from app.core.cache import SWRCache
+from app.core.config import settings
+from app.db import session as db_session
+from app.db.dialect import date_trunc
+from app.db.parallel import gather_reads
+from app.models.v2.endorsement import Endorsement
 from app.models.v2.release import Release, ReleaseStatus
-from app.models.v2.testing import TestingCycle
+from app.models.v2.testing import TestingCycle, TestExecution
 from app.models.v2.work_item import WorkItem, WorkItemStatus
-from datetime import datetime, timedelta
+from app.models.v2.velocity import WorkItemVelocityDaily
+from app.models.team import Team
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Optional
 
-async def get_dashboard_metrics(db: Session):
+# Seconds each metric is served from cache before it is recomputed. Past that,
+# the old value is still served for ANALYTICS_CACHE_STALE_SECONDS while one
+# background refresh runs, so a crowd opening the page never queues on SQL.
+METRIC_TTLS = {
+    "dashboard": 30,
+    "velocity": 300,
+    "release_trends": 900,
+    "endorsement_insights": 300,
+    "risk_heatmap": 60,
+}
+
+analytics_cache = SWRCache(maxsize=settings.ANALYTICS_CACHE_MAX_SIZE)
+
+async def _cached(metric: str, compute: Callable[..., Awaitable[Any]], *args) -> Any:
+    # Computations outlive the request that triggered them, so they use their own session
+    async def run():
+        async with db_session.AsyncSessionLocal() as db:
+            return await compute(db, *args)
+
+    return await analytics_cache.get_or_compute(
+        (metric, *args), run, ttl=METRIC_TTLS[metric], stale=settings.ANALYTICS_CACHE_STALE_SECONDS
+    )
+
+async def _active_release_health(db: Session):
     # 1. Active Releases Health
-    stmt = select(Release).filter(
+    stmt = select(func.count(Release.id), func.avg(Release.health_score)).filter(
         Release.status.in_([ReleaseStatus.PLANNING, ReleaseStatus.DEVELOPMENT, ReleaseStatus.TESTING])
     )
     result = await db.execute(stmt)
-    active_releases = result.scalars().all()
-    
-    avg_health = 0
-    if active_releases:
-        avg_health = sum(r.health_score for r in active_releases) / len(active_releases)
-        
+    return result.one()
+
+async def _recent_pass_rate(db: Session):
     # 2. Overall Testing Pass Rate (Last 30 days)
     thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    stmt = select(TestingCycle).filter(TestingCycle.created_at >= thirty_days_ago)
+    stmt = select(func.avg(TestingCycle.pass_rate)).filter(TestingCycle.created_at >= thirty_days_ago)
     result = await db.execute(stmt)
-    recent_cycles = result.scalars().all()
-    
-    avg_pass_rate = 0
-    if recent_cycles:
-        avg_pass_rate = sum(c.pass_rate for c in recent_cycles) / len(recent_cycles)
-        
+    return result.scalar() or 0
+
+async def _items_completed_this_month(db: Session):
     # 3. Work Items Completed (This Month)
     first_of_month = datetime.utcnow().replace(day=1)
     stmt = select(func.count(WorkItem.id)).filter(
@@ -34,47 +60,164 @@ async def get_dashboard_metrics(db: Session):
         WorkItem.created_at >= first_of_month
     )
     result = await db.execute(stmt)
-    completed_items = result.scalar() or 0
-    
+    return result.scalar() or 0
+
+async def _dashboard_metrics(db: Session):
+    (active_count, avg_health), avg_pass_rate, completed_items = await gather_reads(
+        db, _active_release_health, _recent_pass_rate, _items_completed_this_month
+    )
+
     return {
-        "active_releases_count": len(active_releases),
-        "average_release_health": round(avg_health, 1),
-        "testing_pass_rate": round(avg_pass_rate, 1),
+        "active_releases_count": active_count,
+        "average_release_health": round(float(avg_health or 0), 1),
+        "testing_pass_rate": round(float(avg_pass_rate), 1),
         "items_completed_this_month": completed_items
     }
 
-async def get_velocity_metrics(db: Session):
-    # Mock velocity data for the last 4 sprints (weeks)
-    # In a real app, we'd group WorkItems by closed date
-    return [
-        {"period": "Week 1", "points": 24},
-        {"period": "Week 2", "points": 32},
-        {"period": "Week 3", "points": 28},
-        {"period": "Current", "points": 15}, # In progress
-    ]
+async def get_dashboard_metrics():
+    return await _cached("dashboard", _dashboard_metrics)
 
-async def get_release_trends(db: Session, months: int = 3):
-    # Mock trend data - in reality would aggregate from Release table
-    return [
-        {"month": "Jan", "success_rate": 95, "avg_health": 88},
-        {"month": "Feb", "success_rate": 88, "avg_health": 82},
-        {"month": "Mar", "success_rate": 92, "avg_health": 90},
-    ]
+async def _velocity_metrics(db: Session, weeks: int, team_id: Optional[str], art_id: Optional[str]):
+    today = datetime.utcnow().date()
+    first_week = today - timedelta(days=today.weekday(), weeks=weeks - 1)
 
-async def get_endorsement_insights(db: Session):
-    # Mock cultural values data
+    stmt = (
+        select(
+            WorkItemVelocityDaily.day,
+            func.sum(WorkItemVelocityDaily.points),
+            func.sum(WorkItemVelocityDaily.items),
+        )
+        .where(WorkItemVelocityDaily.day >= first_week)
+        .group_by(WorkItemVelocityDaily.day)
+    )
+    if team_id:
+        stmt = stmt.where(WorkItemVelocityDaily.team_id == team_id)
+    if art_id:
+        stmt = stmt.join(Team, Team.id == WorkItemVelocityDaily.team_id).where(Team.art_id == art_id)
+    result = await db.execute(stmt)
+
+    buckets = {first_week + timedelta(weeks=i): [0, 0] for i in range(weeks)}
+    for day, points, items in result.all():
+        week = day - timedelta(days=day.weekday())
+        buckets[week][0] += points or 0
+        buckets[week][1] += items or 0
     return [
-        {"value": "Team Player", "count": 45},
-        {"value": "Innovation", "count": 30},
-        {"value": "Customer Obsession", "count": 25},
-        {"value": "Ownership", "count": 35},
+        {"period": week.isoformat(), "points": points, "items": items}
+        for week, (points, items) in buckets.items()
     ]
 
-async def get_risk_heatmap(db: Session):
-    # Mock risk data
+async def get_velocity_metrics(weeks: int = 8, team_id: Optional[str] = None, art_id: Optional[str] = None):
+    """
+    Story points completed per week (Monday-based), oldest first, current week last.
+
+    Reads the daily per-team rollup, so the cost depends on `weeks`, not on
+    how many work items exist.
+    """
+    return await _cached("velocity", _velocity_metrics, weeks, team_id, art_id)
+
+async def rebuild_velocity_rollup(db: Session) -> int:
+    """Rebuild `work_item_velocity_daily` from completed work items. Returns the number of buckets."""
+    day = func.date(WorkItem.completed_at, type_=Date)
+    source = (
+        select(day, WorkItem.team_id, func.sum(func.coalesce(WorkItem.story_points, 0)), func.count())
+        .where(
+            WorkItem.status == WorkItemStatus.DONE,
+            WorkItem.completed_at.is_not(None),
+            WorkItem.team_id.is_not(None),
+        )
+        .group_by(day, WorkItem.team_id)
+    )
+    await db.execute(delete(WorkItemVelocityDaily))
+    await db.execute(
+        insert(WorkItemVelocityDaily).from_select(["day", "team_id", "points", "items"], source)
+    )
+    await db.commit()
+    return (await db.execute(select(func.count()).select_from(WorkItemVelocityDaily))).scalar()
+
+def _month_starts(months: int) -> list[date]:
+    """First day of each of the last `months` months, oldest first, current month last."""
+    today = datetime.utcnow().date()
+    starts = [today.replace(day=1)]
+    for _ in range(months - 1):
+        starts.append((starts[-1] - timedelta(days=1)).replace(day=1))
+    return starts[::-1]
+
+async def _release_trends(db: Session, months: int):
+    starts = _month_starts(months)
+    month = date_trunc(db, "month", Release.actual_release_date)
+    on_time = case(
+        (or_(Release.release_date.is_(None), Release.actual_release_date <= Release.release_date), 1),
+        else_=0,
+    )
+    stmt = (
+        select(month, func.count(), func.sum(on_time), func.avg(Release.health_score))
+        .where(Release.actual_release_date >= datetime.combine(starts[0], datetime.min.time()))
+        .group_by(month)
+    )
+    result = await db.execute(stmt)
+    rows = {bucket: (released, shipped_on_time, health) for bucket, released, shipped_on_time, health in result.all()}
+
+    trends = []
+    for start in starts:
+        released, shipped_on_time, health = rows.get(start, (0, 0, None))
+        trends.append({
+            "month": start.strftime("%b %Y"),
+            "releases": released,
+            "success_rate": round(100 * (shipped_on_time or 0) / released) if released else 0,
+            "avg_health": round(float(health or 0)),
+        })
+    return trends
+
+async def get_release_trends(months: int = 3):
+    """
+    Shipped releases per calendar month, oldest first: how many went out,
+    the share that shipped on or before their planned date, and their
+    average health score.
+    """
+    return await _cached("release_trends", _release_trends, months)
+
+async def _endorsement_insights(db: Session, days: int, limit: int):
+    since = datetime.utcnow() - timedelta(days=days)
+    count = func.count(Endorsement.id)
+    stmt = (
+        select(Endorsement.category, count)
+        .where(Endorsement.created_at >= since)
+        .group_by(Endorsement.category)
+        .order_by(count.desc(), Endorsement.category)
+        .limit(limit)
+    )
+    result = await db.execute(stmt)
+    return [{"value": category, "count": total} for category, total in result.all()]
+
+async def get_endorsement_insights(days: int = 90, limit: int = 10):
+    """Most endorsed values (endorsement categories) over the last `days` days."""
+    return await _cached("endorsement_insights", _endorsement_insights, days, limit)
+
+async def _risk_heatmap(db: Session):
+    defects = (
+        select(TestingCycle.release_id, func.count(func.distinct(TestExecution.defect_id)).label("defect_count"))
+        .join(TestExecution, TestExecution.cycle_id == TestingCycle.id)
+        .where(TestExecution.defect_id.is_not(None))
+        .group_by(TestingCycle.release_id)
+        .subquery()
+    )
+    risk = 100 - func.coalesce(Release.health_score, 100)
+    stmt = (
+        select(
+            func.coalesce(Release.name, Release.version),
+            risk,
+            func.coalesce(defects.c.defect_count, 0),
+        )
+        .outerjoin(defects, defects.c.release_id == Release.id)
+        .where(Release.status != ReleaseStatus.COMPLETED)
+        .order_by(risk.desc(), Release.version)
+    )
+    result = await db.execute(stmt)
     return [
-        {"component": "Auth Service", "risk_score": 12, "defect_count": 3},
-        {"component": "Payment Gateway", "risk_score": 85, "defect_count": 15}, # High risk
-        {"component": "User Profile", "risk_score": 5, "defect_count": 1},
-        {"component": "Notification Engine", "risk_score": 45, "defect_count": 8},
+        {"component": component, "risk_score": risk_score, "defect_count": defect_count}
+        for component, risk_score, defect_count in result.all()
     ]
+
+async def get_risk_heatmap():
+    """Open releases by risk (100 - health score), with distinct defects logged against their test runs."""
+    return await _cached("risk_heatmap", _risk_heatmap)
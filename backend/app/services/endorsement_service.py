@@ -1,11 +1,13 @@
 from sqlalchemy.orm import Session, selectinload
+from app.crud import pagination
 from app.crud.v2 import endorsement as crud_endorsement
 from app.schemas.v2 import endorsement as schemas
 from app.models.v2.endorsement import Endorsement
 from app.models.user import User
-from app.models.social import Like, Comment
-from sqlalchemy import select, func, and_, desc
+from app.services.social_service import social_stats_columns
+from sqlalchemy import select
 import uuid
+from typing import Optional
 
 async def create_endorsement(db: Session, endorsement_in: schemas.EndorsementCreate, giver_id: str) -> dict:
     endorsement_data = endorsement_in.model_dump()
@@ -57,57 +59,25 @@ async def create_endorsement(db: Session, endorsement_in: schemas.EndorsementCre
 async def get_endorsements(db: Session, skip: int = 0, limit: int = 100) -> list[Endorsement]:
     return await crud_endorsement.endorsement.get_multi(db, skip=skip, limit=limit)
 
-async def get_endorsements_with_stats(db: Session, current_user_id: str, skip: int = 0, limit: int = 100) -> list[dict]:
-    # 1. Fetch Endorsements
+ENDORSEMENT_CURSOR_KEYS = (Endorsement.created_at, Endorsement.id)
+
+async def get_endorsements_with_stats(db: Session, current_user_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> list[schemas.EndorsementResponse]:
     stmt = (
-        select(Endorsement)
+        select(Endorsement, *social_stats_columns("endorsement", Endorsement.id, current_user_id))
         .options(
             selectinload(Endorsement.giver).selectinload(User.team),
             selectinload(Endorsement.receiver).selectinload(User.team),
             selectinload(Endorsement.event)
         )
-        .order_by(desc(Endorsement.created_at))
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(stmt)
-    endorsements = result.scalars().all()
-    
-    if not endorsements:
-        return []
-        
-    endorsement_ids = [e.id for e in endorsements]
-    
-    # 2. Fetch Like Counts
-    stmt_likes = (
-        select(Like.endorsement_id, func.count(Like.id))
-        .where(Like.endorsement_id.in_(endorsement_ids))
-        .group_by(Like.endorsement_id)
-    )
-    result_likes = await db.execute(stmt_likes)
-    like_counts = {row[0]: row[1] for row in result_likes.all()}
-    
-    # 3. Fetch Comment Counts
-    stmt_comments = (
-        select(Comment.endorsement_id, func.count(Comment.id))
-        .where(Comment.endorsement_id.in_(endorsement_ids))
-        .group_by(Comment.endorsement_id)
-    )
-    result_comments = await db.execute(stmt_comments)
-    comment_counts = {row[0]: row[1] for row in result_comments.all()}
-    
-    # 4. Fetch User Likes
-    stmt_user_likes = (
-        select(Like.endorsement_id)
-        .where(and_(Like.endorsement_id.in_(endorsement_ids), Like.user_id == current_user_id))
     )
-    result_user_likes = await db.execute(stmt_user_likes)
-    user_liked_ids = set(result_user_likes.scalars().all())
+    stmt = pagination.keyset(stmt, ENDORSEMENT_CURSOR_KEYS, cursor)
+    if not cursor:
+        stmt = stmt.offset(skip)
+    result = await db.execute(stmt.limit(limit))
     
-    # 5. Assemble Response
     response = []
-    for endorsement in endorsements:
-        # Build dict manually with all required fields
+    for endorsement, likes, comments, liked_by_user in result.all():
+        # Every field is filled from the row, so construct without re-validating
         endorsement_dict = {
             "id": endorsement.id,
             "giver_id": endorsement.giver_id,
@@ -125,12 +95,12 @@ async def get_endorsements_with_stats(db: Session, current_user_id: str, skip: i
             "event_name": endorsement.event.name if endorsement.event else None,
             "giver_avatar": f"https://api.dicebear.com/7.x/adventurer/svg?seed={endorsement.giver.name if endorsement.giver else 'Unknown'}",
             "receiver_avatar": f"https://api.dicebear.com/7.x/adventurer/svg?seed={endorsement.receiver.name if endorsement.receiver else 'Unknown'}",
-            "likes": like_counts.get(endorsement.id, 0),
-            "comments": comment_counts.get(endorsement.id, 0),
-            "liked_by_user": endorsement.id in user_liked_ids
+            "likes": likes,
+            "comments": comments,
+            "liked_by_user": liked_by_user
         }
         
-        response.append(endorsement_dict)
+        response.append(schemas.EndorsementResponse.model_construct(**endorsement_dict))
         
     return response
 
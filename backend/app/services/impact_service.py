@@ -0,0 +1,87 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, delete, literal, or_
+from sqlalchemy.orm import selectinload
+from app.models.user import User
+from app.models.v2.endorsement import Endorsement
+from app.models.v2.work_item import WorkItem, WorkItemStatus
+from app.models.v2.task import Task, TaskStatus
+from app.models.v2.impact_score import (
+    UserImpactScore, ENDORSEMENT_POINTS, WORK_ITEM_POINTS, TASK_POINTS,
+)
+from app.schemas.v2.profile import LeaderboardEntry
+from datetime import datetime
+from typing import List, Optional
+
+def _grouped_count(user_column, *criteria):
+    return (
+        select(user_column.label("user_id"), func.count().label("n"))
+        .where(user_column.is_not(None), *criteria)
+        .group_by(user_column)
+        .subquery()
+    )
+
+async def recompute_all(db: AsyncSession) -> int:
+    """
+    Rebuild `user_impact_scores` from endorsements and done work items/tasks.
+    Returns the number of users with a non-zero score.
+    """
+    endorsements = _grouped_count(Endorsement.receiver_id)
+    work_items = _grouped_count(WorkItem.assignee_id, WorkItem.status == WorkItemStatus.DONE)
+    tasks = _grouped_count(Task.assigned_to_id, Task.status == TaskStatus.DONE)
+
+    e_count = func.coalesce(endorsements.c.n, 0)
+    w_count = func.coalesce(work_items.c.n, 0)
+    t_count = func.coalesce(tasks.c.n, 0)
+    source = (
+        select(
+            User.id,
+            e_count,
+            w_count,
+            t_count,
+            e_count * ENDORSEMENT_POINTS + w_count * WORK_ITEM_POINTS + t_count * TASK_POINTS,
+            literal(datetime.utcnow()),
+        )
+        .outerjoin(endorsements, endorsements.c.user_id == User.id)
+        .outerjoin(work_items, work_items.c.user_id == User.id)
+        .outerjoin(tasks, tasks.c.user_id == User.id)
+        .where(or_(endorsements.c.n.is_not(None), work_items.c.n.is_not(None), tasks.c.n.is_not(None)))
+    )
+
+    await db.execute(delete(UserImpactScore))
+    result = await db.execute(
+        UserImpactScore.__table__.insert().from_select(
+            ["user_id", "endorsements_count", "work_items_done", "tasks_done", "impact_score", "updated_at"],
+            source,
+        )
+    )
+    await db.commit()
+    return result.rowcount
+
+async def get_leaderboard(db: AsyncSession, limit: int = 20, team_id: Optional[str] = None) -> List[LeaderboardEntry]:
+    rank = func.rank().over(order_by=UserImpactScore.impact_score.desc())
+    stmt = (
+        select(UserImpactScore, User, rank.label("rank"))
+        .join(User, User.id == UserImpactScore.user_id)
+        .options(selectinload(User.team))
+        .where(UserImpactScore.impact_score > 0)
+        .order_by(UserImpactScore.impact_score.desc(), User.name)
+        .limit(limit)
+    )
+    if team_id:
+        stmt = stmt.where(User.team_id == team_id)
+    result = await db.execute(stmt)
+
+    return [
+        LeaderboardEntry(
+            rank=position,
+            user_id=user.id,
+            name=user.name,
+            role=user.role,
+            team=user.team_name,
+            impact_score=score.impact_score,
+            endorsements_count=score.endorsements_count,
+            work_items_count=score.work_items_done,
+            tasks_count=score.tasks_done,
+        )
+        for score, user, position in result.all()
+    ]
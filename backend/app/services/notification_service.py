@@ -1,8 +1,83 @@
 from sqlalchemy.orm import Session
 from app.crud.v2 import notification as crud_notification
 from app.schemas.v2 import notification as schemas
-from app.models.v2.notification import Notification, NotificationPreference, NotificationType, NotificationChannel
+from app.models.v2.notification import (
+    Notification, NotificationPreference, NotificationType, NotificationChannel,
+    NotificationArchive,
+)
+from app.models.v2.event_participant import EventParticipant, RSVPStatus
+from app.models.user import User
+from app.models.team import Team
+from sqlalchemy import select, insert, delete, union, exists, case, cast, literal, String
+from app.db.dialect import upsert
+from datetime import datetime, timedelta
+from app.core.broker import broker
+from app.core.jobs import job_queue
+from app.core.config import settings
+from app.db import session as db_session
+import asyncio
+import json
+import logging
 import uuid
+from typing import AsyncIterator, Optional
+
+logger = logging.getLogger(__name__)
+
+def _topic(user_id: str) -> str:
+    return f"notifications:{user_id}"
+
+def _sse(notification: dict) -> str:
+    return f"id: {notification['id']}\nevent: notification\ndata: {json.dumps(notification)}\n\n"
+
+async def publish_notification(notification: Notification) -> None:
+    """Push a committed notification to the recipient's open streams."""
+    payload = schemas.NotificationResponse.model_validate(notification).model_dump(mode="json")
+    await broker.publish(_topic(notification.user_id), payload)
+
+async def stream_notifications(user_id: str, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+    """
+    Server-sent events for a user's new notifications.
+
+    Subscribes before replaying anything missed since `last_event_id`, so
+    nothing published in between is lost; replayed ids are not sent twice.
+    """
+    async with broker.subscribe(_topic(user_id)) as subscription:
+        sent = set()
+        if last_event_id:
+            async with db_session.AsyncSessionLocal() as db:
+                missed = await crud_notification.notification.get_since(db, user_id, last_event_id)
+            for notification in missed:
+                sent.add(notification.id)
+                yield _sse(schemas.NotificationResponse.model_validate(notification).model_dump(mode="json"))
+
+        while not subscription.closed.is_set():
+            try:
+                message = await asyncio.wait_for(subscription.queue.get(), timeout=settings.SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if message["id"] in sent:
+                continue
+            if "user_id" not in message:
+                # Reference-only message (payload was too large for NOTIFY)
+                async with db_session.AsyncSessionLocal() as db:
+                    notification = await crud_notification.notification.get(db, id=message["id"])
+                if not notification:
+                    continue
+                message = schemas.NotificationResponse.model_validate(notification).model_dump(mode="json")
+            yield _sse(message)
+
+async def _email_recipients(db: Session, user_ids: list[str], type: NotificationType) -> list[str]:
+    """Those of `user_ids` who enabled the EMAIL channel for `type`."""
+    result = await db.execute(
+        select(NotificationPreference.user_id).where(
+            NotificationPreference.user_id.in_(user_ids),
+            NotificationPreference.notification_type == type,
+            NotificationPreference.channel == NotificationChannel.EMAIL,
+            NotificationPreference.enabled == True,
+        )
+    )
+    return result.scalars().all()
 
 async def send_notification(db: Session, notification_in: schemas.NotificationCreate) -> Notification:
     # 1. Check preferences (mock logic: always send in-app if no pref exists)
@@ -15,24 +90,236 @@ async def send_notification(db: Session, notification_in: schemas.NotificationCr
     
     db_obj = Notification(**notification_data)
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    await db.flush()
+    await crud_notification.notification.adjust_unread_count(db, db_obj.user_id, 1)
+    # 3. Email (if the user opted in) goes out from the job queue
+    if await _email_recipients(db, [db_obj.user_id], db_obj.type):
+        await job_queue.enqueue(db, "notifications.send_email", notification_id=db_obj.id)
+    await db.commit()
+    await db.refresh(db_obj)
     
-    # 3. If email enabled, trigger email (mock print)
-    # print(f"Sending email to {notification_in.user_id}: {notification_in.title}")
+    # 4. Push to connected clients
+    await publish_notification(db_obj)
     
     return db_obj
 
-async def get_my_notifications(db: Session, user_id: str, unread_only: bool = False) -> list[Notification]:
-    return await crud_notification.notification.get_by_user(db, user_id, only_unread=unread_only)
+@job_queue.handler("notifications.send_email")
+async def send_notification_email(db: Session, notification_id: str) -> None:
+    """Email a notification to users who enabled the EMAIL channel for its type."""
+    notification = await crud_notification.notification.get(db, id=notification_id)
+    if not notification:
+        return
+    result = await db.execute(
+        select(NotificationPreference.enabled).where(
+            NotificationPreference.user_id == notification.user_id,
+            NotificationPreference.notification_type == notification.type,
+            NotificationPreference.channel == NotificationChannel.EMAIL,
+        )
+    )
+    if not result.scalar():
+        return
+    # No mail transport is configured yet; this is where it plugs in
+    logger.info("Sending email to %s: %s", notification.user_id, notification.title)
+
+def _coalesce_key(type: NotificationType, related_entity_type: str, related_entity_id: str, now: datetime) -> str:
+    # Fixed windows: a new key (and row) starts every NOTIFICATION_COALESCE_WINDOW_MINUTES
+    window = max(settings.NOTIFICATION_COALESCE_WINDOW_MINUTES, 1) * 60
+    bucket = int(now.timestamp()) // window
+    return f"{type.value}:{related_entity_type}:{related_entity_id}:{bucket}"
+
+async def notify_coalesced(
+    db: Session,
+    user_id: str,
+    type: NotificationType,
+    title: str,
+    action: str,
+    related_entity_type: str,
+    related_entity_id: str,
+    actor_id: str,
+    actor_name: str,
+) -> Optional[dict]:
+    """
+    Record activity by `actor_id` on an item of `user_id`, e.g. action="liked your post".
+
+    Repeats of the same type on the same entity within the coalescing window
+    update the user's open (unread) row in place - one INSERT .. ON CONFLICT
+    against the partial unique index - so the message becomes
+    "Ana and 41 others liked your post". Returns the stored row, or None when
+    nothing changed (self-activity, or the same actor twice in a row).
+    """
+    if actor_id == user_id:
+        return None
+
+    now = datetime.utcnow()
+    table = Notification.__table__
+    stmt = upsert(db, table).values(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        title=title,
+        message=f"{actor_name} {action}",
+        type=type,
+        related_entity_type=related_entity_type,
+        related_entity_id=related_entity_id,
+        coalesce_key=_coalesce_key(type, related_entity_type, related_entity_id, now),
+        actor_count=1,
+        latest_actor_id=actor_id,
+        latest_actor_name=actor_name,
+        is_read=False,
+        created_at=now,
+    )
+    # Column references below read the stored (pre-update) values
+    others = case(
+        (table.c.actor_count == 1, literal(" and 1 other ")),
+        else_=literal(" and ") + cast(table.c.actor_count, String) + literal(" others "),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "coalesce_key"],
+        index_where=table.c.is_read == False,
+        set_={
+            "actor_count": table.c.actor_count + 1,
+            "latest_actor_id": stmt.excluded.latest_actor_id,
+            "latest_actor_name": stmt.excluded.latest_actor_name,
+            "message": stmt.excluded.latest_actor_name + others + literal(action),
+            "created_at": stmt.excluded.created_at,
+        },
+        # Re-liking straight after an unlike shouldn't count the same person twice
+        where=table.c.latest_actor_id != stmt.excluded.latest_actor_id,
+    ).returning(*table.c)
+
+    row = (await db.execute(stmt)).mappings().first()
+    if row is None:
+        await db.rollback()
+        return None
+    if row["actor_count"] == 1:
+        # New row rather than a merge into an already-counted unread one
+        await crud_notification.notification.adjust_unread_count(db, user_id, 1)
+    await db.commit()
+
+    payload = schemas.NotificationResponse.model_validate(dict(row)).model_dump(mode="json")
+    await broker.publish(_topic(user_id), payload)
+    return payload
+
+def _audience_query(audience: schemas.NotificationAudience):
+    """Union of user-id selects for everything in the audience"""
+    parts = []
+    if audience.user_ids:
+        parts.append(select(User.id.label("user_id")).where(User.id.in_(audience.user_ids)))
+    if audience.team_id:
+        parts.append(select(User.id.label("user_id")).where(User.team_id == audience.team_id))
+    if audience.art_id:
+        parts.append(
+            select(User.id.label("user_id")).join(Team, Team.id == User.team_id).where(Team.art_id == audience.art_id)
+        )
+    if audience.event_id:
+        parts.append(
+            select(EventParticipant.user_id.label("user_id")).where(
+                EventParticipant.event_id == audience.event_id,
+                EventParticipant.rsvp_status != RSVPStatus.DECLINED,
+            )
+        )
+    if not parts:
+        return None
+    return union(*parts).subquery() if len(parts) > 1 else parts[0].subquery()
+
+async def fan_out(db: Session, broadcast: schemas.NotificationBroadcast) -> int:
+    """
+    Notify a whole audience at once. Returns the number of notifications delivered.
+
+    The audience is resolved, and users who switched this type off for the
+    in-app channel are dropped, in a single query; the rows go in with one
+    multi-row INSERT.
+    """
+    audience = _audience_query(broadcast.audience)
+    if audience is None:
+        return 0
+
+    opted_out = exists().where(
+        NotificationPreference.user_id == audience.c.user_id,
+        NotificationPreference.notification_type == broadcast.type,
+        NotificationPreference.channel == NotificationChannel.IN_APP,
+        NotificationPreference.enabled == False,
+    )
+    result = await db.execute(select(audience.c.user_id).distinct().where(~opted_out))
+    recipients = result.scalars().all()
+    if not recipients:
+        return 0
+
+    now = datetime.utcnow()
+    content = broadcast.model_dump(exclude={"audience"})
+    rows = [
+        {**content, "id": str(uuid.uuid4()), "user_id": user_id, "is_read": False, "created_at": now}
+        for user_id in recipients
+    ]
+    await db.execute(insert(Notification), rows)
+    await crud_notification.notification.increment_unread_counts(db, recipients)
+    # Email goes out from the job queue, as for single notifications
+    emailed = set(await _email_recipients(db, recipients, broadcast.type))
+    for row in rows:
+        if row["user_id"] in emailed:
+            await job_queue.enqueue(db, "notifications.send_email", notification_id=row["id"])
+    await db.commit()
+
+    await broker.publish_many([
+        (_topic(row["user_id"]), schemas.NotificationResponse.model_validate(row).model_dump(mode="json"))
+        for row in rows
+    ])
+    return len(rows)
+
+async def get_my_notifications(db: Session, user_id: str, unread_only: bool = False, skip: int = 0, limit: int = 50, cursor: Optional[str] = None) -> list[Notification]:
+    return await crud_notification.notification.get_by_user(
+        db, user_id, skip=skip, limit=limit, only_unread=unread_only, cursor=cursor
+    )
 
 async def mark_read(db: Session, notification_id: str) -> Notification:
-    db_obj = await crud_notification.notification.get(db, id=notification_id)
-    if db_obj:
-        db_obj.is_read = True
-        db.commit()
-        db.refresh(db_obj)
-    return db_obj
+    return await crud_notification.notification.mark_as_read(db, notification_id)
+
+async def get_unread_count(db: Session, user_id: str) -> int:
+    return await crud_notification.notification.get_unread_count(db, user_id)
+
+async def reconcile_unread_counts(db: Session) -> int:
+    """Recount the stored unread counters; returns how many had drifted."""
+    return await crud_notification.notification.reconcile_unread_counts(db)
 
 async def mark_all_read(db: Session, user_id: str):
     return await crud_notification.notification.mark_all_as_read(db, user_id)
+
+async def archive_read_notifications(db: Session, older_than_days: Optional[int] = None, batch_size: Optional[int] = None) -> int:
+    """
+    Move read notifications older than the retention age into `notifications_archive`.
+
+    Works in batches of `batch_size`, one transaction each, so locks stay short
+    and the job can be stopped at any point. Returns the number of rows moved.
+    """
+    days = settings.NOTIFICATION_RETENTION_DAYS if older_than_days is None else older_than_days
+    batch_size = batch_size or settings.NOTIFICATION_ARCHIVE_BATCH_SIZE
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    columns = [c.name for c in Notification.__table__.c]
+
+    moved = 0
+    while True:
+        result = await db.execute(
+            select(Notification.id)
+            .where(Notification.is_read == True, Notification.created_at < cutoff)
+            .order_by(Notification.created_at)
+            .limit(batch_size)
+        )
+        ids = result.scalars().all()
+        if not ids:
+            break
+
+        source = select(*Notification.__table__.c).where(Notification.id.in_(ids))
+        await db.execute(
+            upsert(db, NotificationArchive.__table__)
+            .from_select(columns, source)
+            .on_conflict_do_nothing(index_elements=["id"])
+        )
+        result = await db.execute(
+            delete(Notification)
+            .where(Notification.id.in_(ids), Notification.is_read == True)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        moved += result.rowcount
+        if len(ids) < batch_size:
+            break
+    return moved
@@ -1,62 +1,65 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from app.crud.v2 import profile as crud_profile
+from app.db.parallel import gather_reads
 from app.schemas.v2 import profile as schemas
 from app.models.v2.profile import Profile
 from app.models.user import User
-from app.models.v2.endorsement import Endorsement
-from app.models.v2.work_item import WorkItem, WorkItemStatus
-from app.models.v2.task import Task, TaskStatus
+from app.models.v2.impact_score import UserImpactScore
 import uuid
+from typing import Dict, List, Sequence
+
+async def _profiles_by_user(db: AsyncSession, user_ids: List[str]) -> Dict[str, Profile]:
+    result = await db.execute(select(Profile).where(Profile.user_id.in_(user_ids)))
+    return {p.user_id: p for p in result.scalars().all()}
+
+async def _scores_by_user(db: AsyncSession, user_ids: List[str]) -> Dict[str, UserImpactScore]:
+    result = await db.execute(select(UserImpactScore).where(UserImpactScore.user_id.in_(user_ids)))
+    return {s.user_id: s for s in result.scalars().all()}
+
+async def build_profiles(db: AsyncSession, users: Sequence[User]) -> List[schemas.UserProfileFullResponse]:
+    """
+    Full profiles for a set of users, in the given order.
+
+    Uses one `IN` query for profiles and one for the materialized impact
+    scores, however many users there are. `users` must have `team` loaded.
+    """
+    if not users:
+        return []
+    user_ids = [u.id for u in users]
+
+    profiles, scores = await gather_reads(
+        db,
+        lambda session: _profiles_by_user(session, user_ids),
+        lambda session: _scores_by_user(session, user_ids),
+    )
+
+    results = []
+    for user in users:
+        score = scores.get(user.id)
+        results.append(schemas.UserProfileFullResponse(
+            user_id=user.id,
+            name=user.name,
+            role=user.role,
+            team=user.team_name,
+            # email=None, # Removed from User model
+            profile=profiles.get(user.id),
+            impact_score=score.impact_score if score else 0,
+            endorsements_count=score.endorsements_count if score else 0,
+            work_items_count=score.work_items_done if score else 0,
+            tasks_count=score.tasks_done if score else 0
+        ))
+    return results
 
 async def get_full_profile(db: AsyncSession, user_id: str) -> schemas.UserProfileFullResponse:
-    # 1. Get User
     stmt = select(User).options(selectinload(User.team)).where(User.id == user_id)
     result = await db.execute(stmt)
     user = result.scalars().first()
     if not user:
         return None
-        
-    # 2. Get Profile (create empty if not exists for non-null response)
-    profile = await crud_profile.profile.get_by_user_id(db, user_id)
-    
-    # 3. Calculate Score components
-    stmt = select(func.count(Endorsement.id)).where(Endorsement.receiver_id == user_id)
-    result = await db.execute(stmt)
-    endorsements_count = result.scalar() or 0
-    
-    # Work Items (Done)
-    stmt = select(func.count(WorkItem.id)).where(
-        WorkItem.assignee_id == user_id, 
-        WorkItem.status == WorkItemStatus.DONE
-    )
-    result = await db.execute(stmt)
-    work_items_count = result.scalar() or 0
-    
-    # Tasks (Done)
-    stmt = select(func.count(Task.id)).where(
-        Task.assigned_to_id == user_id, 
-        Task.status == TaskStatus.DONE
-    )
-    result = await db.execute(stmt)
-    tasks_count = result.scalar() or 0
-    
-    # Simple algorithm
-    score = (endorsements_count * 10) + (work_items_count * 5) + (tasks_count * 2)
-    
-    return schemas.UserProfileFullResponse(
-        user_id=user.id,
-        name=user.name,
-        role=user.role,
-        team=user.team_name,
-        # email=None, # Removed from User model
-        profile=profile,
-        impact_score=score,
-        endorsements_count=endorsements_count,
-        work_items_count=work_items_count,
-        tasks_count=tasks_count
-    )
+
+    return (await build_profiles(db, [user]))[0]
 
 async def update_my_profile(db: AsyncSession, user_id: str, profile_in: schemas.ProfileUpdate) -> Profile:
     profile = await crud_profile.profile.get_by_user_id(db, user_id)
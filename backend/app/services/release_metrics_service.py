@@ -0,0 +1,58 @@
+from sqlalchemy import select, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.jobs import job_queue
+from app.models.v2.release import Release
+from app.models.v2.testing import TestingCycle
+from app.models.v2.work_item import WorkItem, WorkItemStatus, WorkItemType
+
+# Health points lost per bug still open in the release
+OPEN_BUG_PENALTY = 5
+
+def completion_percentage(done_points: int, total_points: int) -> int:
+    return round(100 * done_points / total_points) if total_points else 0
+
+def health_score(passed: int, executed: int, open_bugs: int) -> int:
+    """Tested pass rate (100 until something ran) minus a penalty per open bug, within 0..100."""
+    pass_rate = 100 * passed / executed if executed else 100
+    return max(0, min(100, round(pass_rate - OPEN_BUG_PENALTY * open_bugs)))
+
+@job_queue.handler("releases.update_metrics")
+async def update_release_metrics(db: AsyncSession, release_id: str) -> None:
+    """
+    Recompute one release's completion percentage and health score.
+
+    Completion is weighted by story points (unestimated items count as 1).
+    Health uses the release's testing cycle counters and its open bugs.
+    Queued by the hooks in models/v2/release_metrics.py.
+    """
+    points = func.coalesce(WorkItem.story_points, 1)
+    is_done = WorkItem.status == WorkItemStatus.DONE
+    work = select(
+        func.coalesce(func.sum(points).filter(is_done), 0),
+        func.coalesce(func.sum(points), 0),
+        func.count().filter(WorkItem.type == WorkItemType.BUG, ~is_done),
+    ).where(WorkItem.release_id == release_id)
+    done_points, total_points, open_bugs = (await db.execute(work)).one()
+
+    tests = select(
+        func.coalesce(func.sum(TestingCycle.pass_count), 0),
+        func.coalesce(func.sum(TestingCycle.pass_count + TestingCycle.fail_count + TestingCycle.blocked_count), 0),
+    ).where(TestingCycle.release_id == release_id)
+    passed, executed = (await db.execute(tests)).one()
+
+    await db.execute(
+        update(Release)
+        .where(Release.id == release_id)
+        .values(
+            completion_percentage=completion_percentage(done_points, total_points),
+            health_score=health_score(passed, executed, open_bugs),
+        )
+    )
+    await db.commit()
+
+async def recompute_all(db: AsyncSession) -> int:
+    """Recompute metrics for every release. Returns the number of releases updated."""
+    release_ids = (await db.execute(select(Release.id))).scalars().all()
+    for release_id in release_ids:
+        await update_release_metrics(db, release_id)
+    return len(release_ids)
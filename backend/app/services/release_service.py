@@ -4,6 +4,7 @@ from app.schemas.v2 import release as schemas
 from app.models.v2.release import Release
 from app.models.v2.work_item import WorkItem
 import uuid
+from typing import Optional
 
 async def create_release(db: Session, release_in: schemas.ReleaseCreate) -> Release:
     # Check if version exists
@@ -21,8 +22,8 @@ async def create_release(db: Session, release_in: schemas.ReleaseCreate) -> Rele
     
     return db_obj
 
-async def get_releases(db: Session, skip: int = 0, limit: int = 100) -> list[Release]:
-    return await crud_release.release.get_multi(db, skip=skip, limit=limit)
+async def get_releases(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> list[Release]:
+    return await crud_release.release.get_multi(db, skip=skip, limit=limit, cursor=cursor, keyset_order=True)
 
 async def get_release_details(db: Session, release_id: str) -> Release:
     release = await crud_release.release.get(db, id=release_id)
@@ -44,5 +45,11 @@ async def create_work_item(db: Session, work_item_in: schemas.WorkItemCreate) ->
     
     return db_obj
 
+async def update_work_item(db: Session, release_id: str, work_item_id: str, work_item_in: schemas.WorkItemUpdate) -> Optional[WorkItem]:
+    db_obj = await crud_release.work_item.get(db, id=work_item_id)
+    if not db_obj or db_obj.release_id != release_id:
+        return None
+    return await crud_release.work_item.update(db, db_obj=db_obj, obj_in=work_item_in)
+
 async def get_release_work_items(db: Session, release_id: str) -> list[WorkItem]:
     return await crud_release.work_item.get_by_release(db, release_id=release_id)
@@ -1,98 +1,97 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import or_, select
+from sqlalchemy import or_, select, func, case, delete, literal_column
+from app.db.dialect import is_postgres
 from app.schemas.v2.search import SearchResult, SearchResultType
-from app.models.v2.release import Release
-from app.models.v2.work_item import WorkItem
-from app.models.v2.task import Task
-from app.models.event import Event
-from app.models.user import User
+from app.models.v2.search_document import SearchDocument, SEARCH_SOURCES, search_document_values
 from typing import List
 
-async def search_all(db: AsyncSession, query: str) -> List[SearchResult]:
-    results = []
-    if not query or len(query) < 2:
-        return results
-        
-    search_term = f"%{query}%"
-    
-    # 1. Releases
-    stmt = select(Release).filter(
-        or_(Release.version.ilike(search_term), Release.theme.ilike(search_term))
-    ).limit(5)
-    result = await db.execute(stmt)
-    releases = result.scalars().all()
-    
-    for r in releases:
-        results.append(SearchResult(
-            id=r.id,
-            title=f"Release {r.version}",
-            subtitle=r.theme,
-            type=SearchResultType.RELEASE,
-            url=f"/releases/{r.id}"
-        ))
-        
-    # 2. Work Items
-    stmt = select(WorkItem).filter(
-        or_(WorkItem.title.ilike(search_term))
-    ).limit(5)
-    result = await db.execute(stmt)
-    work_items = result.scalars().all()
-    
-    for w in work_items:
-        results.append(SearchResult(
-            id=w.id,
-            title=w.title,
-            subtitle=f"{w.type} - {w.status}",
-            type=SearchResultType.WORK_ITEM,
-            url=f"/releases/{w.release_id}?item={w.id}" # Simplification
-        ))
+# Generated tsvector column, only present on Postgres (see add_search_documents migration)
+SEARCH_VECTOR = literal_column("search_documents.search_vector")
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
 
-    # 3. Tasks
-    stmt = select(Task).filter(
-        Task.title.ilike(search_term)
-    ).limit(5)
-    result = await db.execute(stmt)
-    tasks = result.scalars().all()
-    
-    for t in tasks:
-        results.append(SearchResult(
-            id=t.id,
-            title=t.title,
-            subtitle=f"{t.priority} - {t.status}",
-            type=SearchResultType.TASK,
-            url=f"/tasks" # Task list
-        ))
-        
-    # 4. Events
-    stmt = select(Event).filter(
-        Event.name.ilike(search_term) # Event uses name, not title
-    ).limit(5)
-    result = await db.execute(stmt)
-    events = result.scalars().all()
-    
-    for e in events:
-        results.append(SearchResult(
-            id=e.id,
-            title=e.name,
-            subtitle=str(e.date_time),
-            type=SearchResultType.EVENT,
-            url=f"/events/{e.id}"
-        ))
-        
-    # 5. Users
-    stmt = select(User).filter(
-        User.name.ilike(search_term)
-    ).limit(5)
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _rank_and_match(db: AsyncSession, query: str):
+    pattern = f"%{_escape_like(query)}%"
+    if is_postgres(db):
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank(SEARCH_VECTOR, ts_query) + func.similarity(SearchDocument.title, query)
+        match = or_(SEARCH_VECTOR.op("@@")(ts_query), SearchDocument.title.ilike(pattern, escape="\\"))
+        return rank, match
+
+    # SQLite (tests/local): substring match, titles ranked above body-only hits
+    title_lower, query_lower = func.lower(SearchDocument.title), query.lower()
+    rank = case(
+        (title_lower == query_lower, 3),
+        (title_lower.like(f"{_escape_like(query_lower)}%", escape="\\"), 2),
+        (SearchDocument.title.like(pattern, escape="\\"), 1),
+        else_=0,
+    )
+    match = or_(SearchDocument.title.like(pattern, escape="\\"), SearchDocument.body.like(pattern, escape="\\"))
+    return rank, match
+
+async def search_all(db: AsyncSession, query: str, per_type: int = 5) -> List[SearchResult]:
+    """
+    Ranked search across releases, work items, tasks, events and users.
+
+    A single query over `search_documents`: matches are ranked within each
+    entity type, capped at `per_type` per type, and returned best-first.
+    """
+    query = (query or "").strip()
+    if len(query) < 2:
+        return []
+
+    rank, match = _rank_and_match(db, query)
+    ranked = (
+        select(
+            SearchDocument.entity_type,
+            SearchDocument.entity_id,
+            SearchDocument.title,
+            SearchDocument.subtitle,
+            SearchDocument.url,
+            rank.label("rank"),
+            func.row_number().over(
+                partition_by=SearchDocument.entity_type,
+                order_by=(rank.desc(), SearchDocument.title),
+            ).label("position"),
+        )
+        .where(match)
+        .subquery()
+    )
+    stmt = (
+        select(ranked)
+        .where(ranked.c.position <= per_type)
+        .order_by(ranked.c.rank.desc(), ranked.c.position, ranked.c.entity_type)
+    )
     result = await db.execute(stmt)
-    users = result.scalars().all()
-    
-    for u in users:
-        results.append(SearchResult(
-            id=u.id,
-            title=u.name,
-            subtitle=u.role or "Team Member",
-            type=SearchResultType.USER,
-            url=f"/profile/{u.id}"
-        ))
-        
-    return results
+
+    return [
+        SearchResult(
+            id=row.entity_id,
+            title=row.title,
+            subtitle=row.subtitle,
+            type=SearchResultType(row.entity_type),
+            url=row.url,
+        )
+        for row in result.all()
+    ]
+
+async def rebuild_index(db: AsyncSession, batch_size: int = 500) -> dict:
+    """
+    Rebuild `search_documents` from the source tables.
+    Returns the number of documents written per entity type.
+    """
+    counts = {}
+    await db.execute(delete(SearchDocument))
+    for model, (entity_type, _) in SEARCH_SOURCES.items():
+        rows = (await db.execute(select(model))).scalars().all()
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            await db.execute(
+                SearchDocument.__table__.insert(),
+                [search_document_values(obj) for obj in batch],
+            )
+        counts[entity_type] = len(rows)
+    await db.commit()
+    return counts
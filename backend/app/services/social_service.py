@@ -0,0 +1,115 @@
+from sqlalchemy import select, func, exists, and_, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.social import Like, Comment
+from app.models.post import Post
+from app.models.event import Event
+from app.models.v2.endorsement import Endorsement
+from app.models.v2.notification import NotificationType
+from app.services import notification_service
+from app.db import session as db_session
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Feed target -> (model, Like FK column, Comment FK column)
+SOCIAL_TARGETS = {
+    "post": (Post, Like.post_id, Comment.post_id),
+    "event": (Event, Like.event_id, Comment.event_id),
+    "endorsement": (Endorsement, Like.endorsement_id, Comment.endorsement_id),
+}
+
+# Feed target -> user notified about likes/comments on it
+SOCIAL_OWNERS = {
+    "post": Post.author_id,
+    "event": Event.organizer_id,
+    "endorsement": Endorsement.receiver_id,
+}
+
+# Notification type -> (title, action text)
+ACTIVITY_MESSAGES = {
+    NotificationType.LIKE: ("New like", "liked your {target}"),
+    NotificationType.COMMENT: ("New comment", "commented on your {target}"),
+}
+
+def social_stats_columns(target: str, target_id_column, current_user_id: str) -> tuple:
+    """
+    Like count, comment count and liked-by-user flag as extra result columns.
+
+    Add them to a feed's page query, e.g. `select(Post, *social_stats_columns("post", Post.id, user_id))`,
+    so the entities and their stats come back in a single round trip. Counts are
+    read from the denormalized `like_count`/`comment_count` columns.
+    """
+    model, like_fk, _ = SOCIAL_TARGETS[target]
+
+    liked_by_user = (
+        exists()
+        .where(and_(like_fk == target_id_column, Like.user_id == current_user_id))
+        .correlate_except(Like)
+        .label("liked_by_user")
+    )
+    return model.like_count.label("likes"), model.comment_count.label("comments"), liked_by_user
+
+async def adjust_like_count(db: AsyncSession, target: str, target_id: str, delta: int) -> None:
+    """Shift the stored like counter; call before committing the Like insert/delete."""
+    model = SOCIAL_TARGETS[target][0]
+    await db.execute(
+        update(model).where(model.id == target_id).values(like_count=model.like_count + delta)
+        .execution_options(table_version=False)
+    )
+
+async def adjust_comment_count(db: AsyncSession, target: str, target_id: str, delta: int) -> None:
+    """Shift the stored comment counter; call before committing the Comment insert/delete."""
+    model = SOCIAL_TARGETS[target][0]
+    await db.execute(
+        update(model).where(model.id == target_id).values(comment_count=model.comment_count + delta)
+        .execution_options(table_version=False)
+    )
+
+async def reconcile_counters(db: AsyncSession) -> dict:
+    """
+    Recount likes/comments from the source tables and fix drifted counters.
+    Returns the number of corrected rows per target.
+    """
+    corrected = {}
+    for target, (model, like_fk, comment_fk) in SOCIAL_TARGETS.items():
+        actual_likes = select(func.count(Like.id)).where(like_fk == model.id).scalar_subquery()
+        actual_comments = select(func.count(Comment.id)).where(comment_fk == model.id).scalar_subquery()
+        result = await db.execute(
+            update(model)
+            .where(or_(model.like_count != actual_likes, model.comment_count != actual_comments))
+            .values(like_count=actual_likes, comment_count=actual_comments)
+            .execution_options(synchronize_session=False, table_version=False)
+        )
+        corrected[target] = result.rowcount
+    await db.commit()
+    return corrected
+
+async def notify_owner(target: str, target_id: str, actor_id: str, actor_name: str, type: NotificationType) -> None:
+    """
+    Tell the owner of a post/event/endorsement about a like or comment (coalesced per item).
+
+    Call once the like/comment has committed. The notification is written in a
+    session of its own, and a failure is logged rather than failing a request
+    whose write already stuck.
+    """
+    owner_column = SOCIAL_OWNERS[target]
+    model = SOCIAL_TARGETS[target][0]
+    try:
+        async with db_session.AsyncSessionLocal() as db:
+            owner_id = (await db.execute(select(owner_column).where(model.id == target_id))).scalar()
+            if not owner_id:
+                return
+            title, action = ACTIVITY_MESSAGES[type]
+            await notification_service.notify_coalesced(
+                db,
+                user_id=owner_id,
+                type=type,
+                title=title,
+                action=action.format(target=target),
+                related_entity_type=target,
+                related_entity_id=target_id,
+                actor_id=actor_id,
+                actor_name=actor_name,
+            )
+    except Exception:
+        logger.exception("Notifying the owner of %s %s about a %s failed", target, target_id, type.value)
@@ -17,8 +17,8 @@ async def create_task(db: Session, task_in: schemas.TaskCreate, creator_id: str)
 
     db_obj = Task(**task_data)
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
     return db_obj
 
 async def get_tasks(
@@ -1,8 +1,17 @@
 from sqlalchemy.orm import Session
 from app.crud.v2 import testing as crud_testing
 from app.schemas.v2 import testing as schemas
-from app.models.v2.testing import TestingCycle, TestExecution
+from app.models.v2.testing import TestingCycle, TestExecution, STATUS_COUNTERS, pass_rate_expression
+from app.core.jobs import job_queue
+from app.core.config import settings
+from pydantic import ValidationError
+from sqlalchemy import select, update, func
+from datetime import datetime
+import codecs
+import csv
+import json
 import uuid
+from typing import Any, AsyncIterator, List, Optional, Tuple
 
 async def create_testing_cycle(db: Session, cycle_in: schemas.TestingCycleCreate) -> TestingCycle:
     cycle_data = cycle_in.model_dump()
@@ -10,8 +19,8 @@ async def create_testing_cycle(db: Session, cycle_in: schemas.TestingCycleCreate
     
     db_obj = TestingCycle(**cycle_data)
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
+    await db.commit()
+    await db.refresh(db_obj)
     return db_obj
 
 async def get_release_cycles(db: Session, release_id: str) -> list[TestingCycle]:
@@ -24,13 +33,167 @@ async def create_test_execution(db: Session, execution_in: schemas.TestExecution
     
     db_obj = TestExecution(**execution_data)
     db.add(db_obj)
-    db.commit()
-    db.refresh(db_obj)
-    
-    # Trigger metric update (async in real world)
-    # await update_cycle_pass_rate(db, execution_in.cycle_id)
+    # Cycle counters and pass rate are adjusted by the TestExecution hooks in the same flush
+    await db.commit()
+    await db.refresh(db_obj)
     
     return db_obj
 
-async def get_cycle_executions(db: Session, cycle_id: str) -> list[TestExecution]:
-    return await crud_testing.test_execution.get_by_cycle(db, cycle_id)
+async def update_test_execution(db: Session, execution_id: str, execution_in: schemas.TestExecutionUpdate) -> Optional[TestExecution]:
+    db_obj = await crud_testing.test_execution.get(db, id=execution_id)
+    if not db_obj:
+        return None
+    return await crud_testing.test_execution.update(db, db_obj=db_obj, obj_in=execution_in)
+
+async def get_cycle_executions(db: Session, cycle_id: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> list[TestExecution]:
+    return await crud_testing.test_execution.get_by_cycle(db, cycle_id, skip=skip, limit=limit, cursor=cursor)
+
+async def get_cycle_summary(db: Session, cycle_id: str) -> Optional[schemas.TestingCycleSummary]:
+    """Status histogram and pass rate, straight from the cycle's stored counters."""
+    cycle = await crud_testing.testing_cycle.get(db, id=cycle_id)
+    if not cycle:
+        return None
+    counts = {status: getattr(cycle, column) for status, column in STATUS_COUNTERS.items()}
+    return schemas.TestingCycleSummary(
+        cycle_id=cycle.id,
+        name=cycle.name,
+        status=cycle.status,
+        total=sum(counts.values()),
+        counts=counts,
+        pass_rate=cycle.pass_rate,
+    )
+
+@job_queue.handler("testing.recount_cycle")
+async def recount_cycle(db: Session, cycle_id: str) -> None:
+    """Rebuild one cycle's status counters and pass rate from its executions."""
+    status = TestExecution.status
+    counts = select(
+        *(func.count().filter(status == s).label(column) for s, column in STATUS_COUNTERS.items())
+    ).where(TestExecution.cycle_id == cycle_id)
+    row = (await db.execute(counts)).one()
+    cycle = update(TestingCycle).where(TestingCycle.id == cycle_id)
+    await db.execute(cycle.values(**row._asdict()))
+    release_id = (await db.execute(
+        cycle.values(
+            pass_rate=pass_rate_expression(TestingCycle.pass_count, TestingCycle.fail_count, TestingCycle.blocked_count)
+        ).returning(TestingCycle.release_id)
+    )).scalar()
+    # Core updates skip the release metrics hooks; queue the refresh directly
+    if release_id:
+        await job_queue.enqueue(db, "releases.update_metrics", key=release_id, release_id=release_id)
+    await db.commit()
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into lines (newline kept) without buffering the whole body."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+async def _ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Any]]:
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except ValueError as e:
+            yield number, e
+
+def _csv_fields(record: str) -> Optional[List[str]]:
+    """Fields of one CSV record, or None while a quoted field is still open."""
+    lines = record.splitlines(keepends=True)
+    try:
+        return next(csv.reader(lines, strict=True), [])
+    except csv.Error as e:
+        if str(e) == "unexpected end of data":
+            return None
+    # Malformed quoting (e.g. `"a"b`): read it the lenient way
+    return next(csv.reader(lines), [])
+
+async def _csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Any]]:
+    """Rows as dicts keyed by the header row; quoted fields may span lines."""
+    header, record, number = None, "", 0
+    async for line in lines:
+        record += line
+        # Quotes only open a field at its start, so `Screen 5" bug` is complete as is
+        values = _csv_fields(record)
+        if values is None:
+            continue
+        number += 1
+        record = ""
+        if not values:
+            continue
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) > len(header):
+            yield number, ValueError(f"expected {len(header)} columns, got {len(values)}")
+            continue
+        yield number, {name: value for name, value in zip(header, values) if value != ""}
+    if record:
+        yield number + 1, ValueError("unterminated quoted field")
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'row'}: {e['msg']}" for e in error.errors())
+    return str(error)
+
+async def import_executions(
+    db: Session, cycle_id: str, chunks: AsyncIterator[bytes], format: str, user_id: str
+) -> schemas.TestExecutionImportResult:
+    """
+    Bulk-load executions from a CSV (with header row) or NDJSON stream.
+
+    Rows are parsed as they arrive, validated in batches and written with one
+    multi-row INSERT (and commit) per batch. Invalid rows are reported by line
+    number and skipped. Bulk inserts bypass the per-row counter hooks, so the
+    cycle's counters are rebuilt once at the end.
+    """
+    rows = _csv_rows(_lines(chunks)) if format == "csv" else _ndjson_rows(_lines(chunks))
+    result = schemas.TestExecutionImportResult(cycle_id=cycle_id)
+    batch: List[dict] = []
+
+    async def write_batch():
+        await db.execute(TestExecution.__table__.insert(), batch)
+        await db.commit()
+        result.imported += len(batch)
+        batch.clear()
+
+    try:
+        async for number, data in rows:
+            try:
+                if isinstance(data, Exception):
+                    raise data
+                if not isinstance(data, dict):
+                    raise ValueError("expected an object")
+                row = schemas.TestExecutionBase.model_validate(data)
+            except ValueError as e:
+                result.failed += 1
+                if len(result.errors) < settings.TEST_IMPORT_MAX_ERRORS:
+                    result.errors.append(schemas.TestExecutionImportError(row=number, error=_describe(e)))
+                continue
+            batch.append({
+                **row.model_dump(),
+                "id": str(uuid.uuid4()),
+                "cycle_id": cycle_id,
+                "executed_by_id": user_id,
+                "created_at": datetime.utcnow(),
+            })
+            if len(batch) >= settings.TEST_IMPORT_BATCH_SIZE:
+                await write_batch()
+        if batch:
+            await write_batch()
+    finally:
+        if result.imported:
+            # A failed batch leaves the session unusable until it is rolled back
+            await db.rollback()
+            await recount_cycle(db, cycle_id)
+    return result
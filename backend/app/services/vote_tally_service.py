@@ -0,0 +1,231 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, func, delete, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db import session as db_session
+from app.db.dialect import upsert
+from app.models.vote import EventVote, EventVoteTally, EventVoteTallyDelta
+
+logger = logging.getLogger(__name__)
+
+TallyKey = Tuple[str, str, str]  # (event_id, award_category, nominee_id)
+
+def record_vote(db: AsyncSession, event_id: str, award_category: str, previous_nominee_id: Optional[str], nominee_id: str) -> None:
+    """
+    Add the tally change for a new (or moved) vote to the caller's transaction.
+
+    Commit it together with the EventVote row: the delta then exists exactly
+    when the vote does, whichever worker flushes it and whenever.
+    """
+    if previous_nominee_id == nominee_id:
+        return
+    if previous_nominee_id:
+        db.add(EventVoteTallyDelta(
+            event_id=event_id, award_category=award_category, nominee_id=previous_nominee_id, delta=-1
+        ))
+    db.add(EventVoteTallyDelta(event_id=event_id, award_category=award_category, nominee_id=nominee_id, delta=1))
+
+
+class VoteTallyFlusher:
+    """
+    Folds `event_vote_tally_delta` rows into `event_vote_tally`.
+
+    Each batch is claimed with FOR UPDATE SKIP LOCKED, applied as one upsert
+    and deleted in the same transaction, so any number of workers can flush
+    without applying a delta twice. Deltas the tally table rejects outright
+    (integrity errors) are dropped and logged, key by key, instead of
+    blocking every batch behind them.
+    """
+
+    def __init__(self):
+        self.flushed_rows = 0
+        self.applied_deltas = 0
+        self.failed_flushes = 0
+        self.dropped_deltas = 0
+
+    @staticmethod
+    async def _apply(db: AsyncSession, totals: Dict[TallyKey, int]) -> int:
+        now = datetime.utcnow()
+        rows = [
+            {"event_id": e, "award_category": c, "nominee_id": n, "vote_count": delta, "updated_at": now}
+            for (e, c, n), delta in totals.items() if delta
+        ]
+        if rows:
+            table = EventVoteTally.__table__
+            stmt = upsert(db, table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["event_id", "award_category", "nominee_id"],
+                set_={"vote_count": table.c.vote_count + stmt.excluded.vote_count, "updated_at": stmt.excluded.updated_at},
+            )
+            await db.execute(stmt, rows)
+        return len(rows)
+
+    async def _flush_batch(self, db: AsyncSession, batch_size: int) -> int:
+        """Apply one batch of deltas. Returns how many delta rows it consumed."""
+        result = await db.execute(
+            select(
+                EventVoteTallyDelta.id, EventVoteTallyDelta.event_id,
+                EventVoteTallyDelta.award_category, EventVoteTallyDelta.nominee_id, EventVoteTallyDelta.delta,
+            )
+            .order_by(EventVoteTallyDelta.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        ids_by_key: Dict[TallyKey, List[int]] = defaultdict(list)
+        totals: Dict[TallyKey, int] = defaultdict(int)
+        for id, event_id, award_category, nominee_id, delta in result.all():
+            ids_by_key[(event_id, award_category, nominee_id)].append(id)
+            totals[(event_id, award_category, nominee_id)] += delta
+        consumed = sum(len(ids) for ids in ids_by_key.values())
+        if not consumed:
+            await db.rollback()
+            return 0
+
+        dropped_before = self.dropped_deltas
+        try:
+            touched = await self._apply(db, totals)
+            await db.execute(
+                delete(EventVoteTallyDelta).where(
+                    EventVoteTallyDelta.id.in_([id for ids in ids_by_key.values() for id in ids])
+                )
+            )
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            self.failed_flushes += 1
+            touched = await self._flush_by_key(db, ids_by_key)
+        except Exception:
+            # Transient (connection, lock timeout): the rows stay put for the next run
+            await db.rollback()
+            self.failed_flushes += 1
+            raise
+        self.flushed_rows += touched
+        self.applied_deltas += consumed - (self.dropped_deltas - dropped_before)
+        return consumed
+
+    async def _flush_by_key(self, db: AsyncSession, ids_by_key: Dict[TallyKey, List[int]]) -> int:
+        touched = 0
+        for key, ids in ids_by_key.items():
+            # The failed batch's locks are gone; re-claim so no other flusher applies these too
+            result = await db.execute(
+                select(EventVoteTallyDelta.id, EventVoteTallyDelta.delta)
+                .where(EventVoteTallyDelta.id.in_(ids))
+                .with_for_update(skip_locked=True)
+            )
+            claimed = result.all()
+            if not claimed:
+                await db.rollback()
+                continue
+            consumed = delete(EventVoteTallyDelta).where(EventVoteTallyDelta.id.in_([id for id, _ in claimed]))
+            try:
+                touched += await self._apply(db, {key: sum(delta for _, delta in claimed)})
+                await db.execute(consumed)
+                await db.commit()
+            except IntegrityError:
+                await db.rollback()
+                logger.error("Dropping %d vote tally delta(s) for %s: rejected by event_vote_tally", len(claimed), key)
+                await db.execute(consumed)
+                await db.commit()
+                self.dropped_deltas += len(claimed)
+        return touched
+
+    async def flush(self, db: AsyncSession, batch_size: Optional[int] = None) -> int:
+        """Apply every pending delta, batch by batch. Returns the number of delta rows applied."""
+        batch_size = batch_size or settings.VOTE_TALLY_FLUSH_BATCH_SIZE
+        total = 0
+        while True:
+            consumed = await self._flush_batch(db, batch_size)
+            total += consumed
+            if consumed < batch_size:
+                return total
+
+    def stats(self) -> dict:
+        return {
+            "flushed_rows": self.flushed_rows,
+            "applied_deltas": self.applied_deltas,
+            "failed_flushes": self.failed_flushes,
+            "dropped_deltas": self.dropped_deltas,
+        }
+
+
+vote_tally = VoteTallyFlusher()
+
+async def run_flusher(interval: float = settings.VOTE_TALLY_FLUSH_SECONDS) -> None:
+    """Background loop flushing pending tally deltas; started from the app lifespan."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with db_session.AsyncSessionLocal() as db:
+                await vote_tally.flush(db)
+        except Exception:
+            logger.exception("Vote tally flush failed; will retry")
+
+async def get_event_tallies(db: AsyncSession, event_id: str) -> Dict[Tuple[str, str], int]:
+    """Vote counts keyed by (award_category, nominee_id): stored tallies plus deltas not yet flushed."""
+    stored = select(
+        EventVoteTally.award_category, EventVoteTally.nominee_id, EventVoteTally.vote_count.label("count")
+    ).where(EventVoteTally.event_id == event_id)
+    pending = select(
+        EventVoteTallyDelta.award_category, EventVoteTallyDelta.nominee_id, EventVoteTallyDelta.delta.label("count")
+    ).where(EventVoteTallyDelta.event_id == event_id)
+    combined = union_all(stored, pending).subquery()
+    total = func.sum(combined.c.count)
+    result = await db.execute(
+        select(combined.c.award_category, combined.c.nominee_id, total)
+        .group_by(combined.c.award_category, combined.c.nominee_id)
+        .having(total > 0)
+    )
+    return {(award_category, nominee_id): count for award_category, nominee_id, count in result.all()}
+
+async def reconcile_tallies(db: AsyncSession, event_id: Optional[str] = None, fix: bool = False) -> List[dict]:
+    """
+    Compare stored tallies with counts from `event_vote`.
+
+    Pending deltas are flushed first so the stored tallies are complete.
+    Returns the mismatches. With `fix=True` the tallies of mismatched events
+    are rewritten from the table, and any deltas for them that arrived in the
+    meantime are dropped in the same transaction (they are already counted).
+    A vote committing while the fix runs can slip between the two; run the
+    check again afterwards.
+    """
+    await vote_tally.flush(db)
+    actual_stmt = (
+        select(EventVote.event_id, EventVote.award_category, EventVote.nominee_id, func.count(EventVote.id))
+        .group_by(EventVote.event_id, EventVote.award_category, EventVote.nominee_id)
+    )
+    stored_stmt = select(
+        EventVoteTally.event_id, EventVoteTally.award_category, EventVoteTally.nominee_id, EventVoteTally.vote_count
+    )
+    if event_id:
+        actual_stmt = actual_stmt.where(EventVote.event_id == event_id)
+        stored_stmt = stored_stmt.where(EventVoteTally.event_id == event_id)
+
+    actual = {tuple(row[:3]): row[3] for row in (await db.execute(actual_stmt)).all()}
+    stored = {tuple(row[:3]): row[3] for row in (await db.execute(stored_stmt)).all()}
+
+    mismatches = [
+        {"event_id": key[0], "award_category": key[1], "nominee_id": key[2],
+         "stored": stored.get(key, 0), "actual": actual.get(key, 0)}
+        for key in sorted(set(actual) | set(stored))
+        if stored.get(key, 0) != actual.get(key, 0)
+    ]
+
+    if fix and mismatches:
+        event_ids = {m["event_id"] for m in mismatches}
+        await db.execute(delete(EventVoteTallyDelta).where(EventVoteTallyDelta.event_id.in_(event_ids)))
+        await db.execute(delete(EventVoteTally).where(EventVoteTally.event_id.in_(event_ids)))
+        now = datetime.utcnow()
+        rows = [
+            {"event_id": e, "award_category": c, "nominee_id": n, "vote_count": count, "updated_at": now}
+            for (e, c, n), count in actual.items() if e in event_ids
+        ]
+        if rows:
+            await db.execute(EventVoteTally.__table__.insert(), rows)
+        await db.commit()
+
+    return mismatches
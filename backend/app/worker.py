@@ -0,0 +1,36 @@
+"""
+Standalone background job worker:
+
+    python -m app.worker [--concurrency N]
+
+Run it alongside API processes started with JOB_WORKER_IN_PROCESS=false.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from app.core.config import settings
+from app.core.jobs import job_queue
+from app.db import session as db_session
+# Importing the services registers their job handlers
+from app.services import notification_service, release_metrics_service, testing_service  # noqa: F401
+
+async def main(concurrency: int) -> None:
+    try:
+        await job_queue.run_worker(concurrency=concurrency)
+    finally:
+        await db_session.engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run background jobs from the jobs table.")
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_CONCURRENCY, help="Jobs run at once")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    try:
+        asyncio.run(main(args.concurrency))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,30 @@
+import argparse
+import asyncio
+import sys
+import os
+
+# Add backend directory to path to allow imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.services import notification_service
+
+async def archive(days, batch_size):
+    async with AsyncSessionLocal() as session:
+        print(f"Archiving read notifications older than {days} days...")
+        moved = await notification_service.archive_read_notifications(
+            session, older_than_days=days, batch_size=batch_size
+        )
+        print(f"  Moved {moved} notification(s) to notifications_archive.")
+        print("Done.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move old read notifications into notifications_archive.")
+    parser.add_argument("--days", type=int, default=settings.NOTIFICATION_RETENTION_DAYS, help="Retention age in days")
+    parser.add_argument("--batch-size", type=int, default=settings.NOTIFICATION_ARCHIVE_BATCH_SIZE, help="Rows moved per transaction")
+    args = parser.parse_args()
+
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(archive(args.days, args.batch_size))
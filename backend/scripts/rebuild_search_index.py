@@ -0,0 +1,22 @@
+import asyncio
+import sys
+import os
+
+# Add backend directory to path to allow imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.db.session import AsyncSessionLocal
+from app.services import search_service
+
+async def rebuild():
+    async with AsyncSessionLocal() as session:
+        print("Rebuilding search documents...")
+        counts = await search_service.rebuild_index(session)
+        for entity_type, count in counts.items():
+            print(f"  {entity_type}: {count} document(s)")
+        print("Done.")
+
+if __name__ == "__main__":
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(rebuild())
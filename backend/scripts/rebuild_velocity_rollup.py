@@ -0,0 +1,21 @@
+import asyncio
+import sys
+import os
+
+# Add backend directory to path to allow imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.db.session import AsyncSessionLocal
+from app.services import analytics_service
+
+async def rebuild():
+    async with AsyncSessionLocal() as session:
+        print("Rebuilding daily velocity rollup...")
+        buckets = await analytics_service.rebuild_velocity_rollup(session)
+        print(f"  {buckets} (day, team) bucket(s)")
+        print("Done.")
+
+if __name__ == "__main__":
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(rebuild())
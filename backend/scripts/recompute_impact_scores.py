@@ -0,0 +1,21 @@
+import asyncio
+import sys
+import os
+
+# Add backend directory to path to allow imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.db.session import AsyncSessionLocal
+from app.services import impact_service
+
+async def recompute():
+    async with AsyncSessionLocal() as session:
+        print("Recomputing impact scores...")
+        users = await impact_service.recompute_all(session)
+        print(f"  {users} user(s) with a score")
+        print("Done.")
+
+if __name__ == "__main__":
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(recompute())
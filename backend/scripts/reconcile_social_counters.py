@@ -0,0 +1,22 @@
+import asyncio
+import sys
+import os
+
+# Add backend directory to path to allow imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.db.session import AsyncSessionLocal
+from app.services import social_service
+
+async def reconcile():
+    async with AsyncSessionLocal() as session:
+        print("Reconciling like/comment counters...")
+        corrected = await social_service.reconcile_counters(session)
+        for target, count in corrected.items():
+            print(f"  {target}: {count} row(s) corrected")
+        print("Done.")
+
+if __name__ == "__main__":
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(reconcile())
@@ -0,0 +1,21 @@
+import asyncio
+import sys
+import os
+
+# Add backend directory to path to allow imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.db.session import AsyncSessionLocal
+from app.services import notification_service
+
+async def reconcile():
+    async with AsyncSessionLocal() as session:
+        print("Reconciling notification unread counters...")
+        corrected = await notification_service.reconcile_unread_counts(session)
+        print(f"  {corrected} counter(s) corrected")
+        print("Done.")
+
+if __name__ == "__main__":
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(reconcile())
@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+import sys
+import os
+
+# Add backend directory to path to allow imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.db.session import AsyncSessionLocal
+from app.services import vote_tally_service
+
+async def reconcile(event_id, fix):
+    async with AsyncSessionLocal() as session:
+        print("Checking event vote tallies...")
+        mismatches = await vote_tally_service.reconcile_tallies(session, event_id=event_id, fix=fix)
+        for m in mismatches:
+            print(f"  {m['event_id']} / {m['award_category']} / {m['nominee_id']}: stored {m['stored']}, actual {m['actual']}")
+        if not mismatches:
+            print("  All tallies match.")
+        elif fix:
+            print(f"  Rewrote tallies for {len({m['event_id'] for m in mismatches})} event(s).")
+        print("Done.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check event vote tallies against event_vote.")
+    parser.add_argument("--event-id", help="Only check this event")
+    parser.add_argument("--fix", action="store_true", help="Rewrite mismatched tallies from event_vote")
+    args = parser.parse_args()
+
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(reconcile(args.event_id, args.fix))